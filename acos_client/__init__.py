@@ -13,11 +13,38 @@
 #    under the License.
 # flake8: noqa
 
+import importlib
+import sys
+
 from acos_client.version import VERSION
 from acos_client.client import Client
-from acos_client.hash import Hash
 
 AXAPI_21 = '21'
 AXAPI_30 = '30'
 #AXAPI_SSH = 'ssh'
 AXAPI_VERSIONS = (AXAPI_21, AXAPI_30)
+
+# Imported on first use so `import acos_client` does not pull in asyncio
+# or uhashring for processes that never touch them.
+_LAZY = {
+    'AsyncClient': 'acos_client.async_client',
+    'FleetClient': 'acos_client.fleet',
+    'Hash': 'acos_client.hash',
+}
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name not in _LAZY:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+else:
+    from acos_client.fleet import FleetClient
+    from acos_client.hash import Hash
+
+    try:
+        from acos_client.async_client import AsyncClient
+    except ImportError:
+        # asyncio is not available on Python 2
+        pass
@@ -0,0 +1,183 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+"""asyncio front end for acos_client.
+
+AsyncClient exposes the same resource tree as Client, but every method
+returns an awaitable::
+
+    async with AsyncClient('1.2.3.4', acos_client.AXAPI_30, 'admin', 'a10') as c:
+        await c.slb.server.create('s1', '1.1.1.1')
+        await c.slb.service_group.member.create('pool1', 's1', 80)
+
+The transport is still the blocking requests stack: calls run the
+regular resource code in worker threads against the client's pooled
+connections. By default those are the event loop's default executor,
+shared by every AsyncClient on the loop, so the thread count does not
+grow with the number of devices; pass executor= to size it yourself.
+
+So that slow or dead devices cannot tie up that shared pool:
+
+* Each device gets at most max_in_flight workers at a time, and only
+  one until it has answered a call, or again once a call fails without
+  an answer (connection error, timeout, open circuit). Calls over the
+  limit wait on the event loop rather than in a worker.
+* Retry backoff is awaited on the event loop. The worker returns as soon
+  as a retryable error comes back and the whole call runs again once the
+  delay is over, so a call's earlier requests may be repeated.
+
+An AsyncClient must only be used from one event loop.
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import asyncio
+import collections
+import functools
+import threading
+
+from requests import exceptions as requests_exceptions
+
+from acos_client import AXAPI_21
+from acos_client import client as acos_client
+from acos_client import errors as acos_errors
+from acos_client import retry
+from acos_client.v21 import base as v21_base
+from acos_client.v30 import base as v30_base
+
+# Failures that mean the device did not answer
+_UNREACHABLE = (requests_exceptions.ConnectionError, requests_exceptions.Timeout, acos_errors.CircuitOpen)
+
+
+class AsyncClient(object):
+
+    def __init__(
+            self,
+            host,              # ip address or name of the A10 device
+            version,           # either 21 or 30
+            username,          # username to use for authenticating to the A10 device
+            password,          # password to use for authenticating to the A10 device
+            max_in_flight=10,  # maximum concurrent calls to this device
+            executor=None,     # executor to run calls on; the event loop's default if None
+            **kwargs           # passed on to acos_client.Client
+    ):
+        kwargs.setdefault('pool_maxsize', max_in_flight)
+        self.client = acos_client.Client(host, version, username, password, **kwargs)
+        self.max_in_flight = max_in_flight
+
+        self._executor = executor
+        # Calls waiting for a worker queue here, on the event loop, so
+        # they never hold a thread of the shared executor.
+        self._queue = collections.deque()
+        self._running = 0
+        # Until the device answers, one call at a time may hold a worker
+        self._healthy = False
+        self._auth_lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name == 'client':
+            raise AttributeError(name)
+        return _wrap(self, getattr(self.client, name))
+
+    def __aenter__(self):
+        f = asyncio.get_event_loop().create_future()
+        f.set_result(self)
+        return f
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return self.close()
+
+    def _run(self, partition, state, job):
+        # Authenticate once up front rather than letting concurrent
+        # first calls race each other to /auth.
+        if self.client.session.session_id is None:
+            with self._auth_lock:
+                self.client.session.id
+        with retry.deferred(*state):
+            # As in Parallel._call, v3 calls are always scoped
+            if self.client._version == AXAPI_21:
+                return job()
+            with self.client.partition_scope(partition):
+                return job()
+
+    def _limit(self):
+        return self.max_in_flight if self._healthy else 1
+
+    def _enqueue(self, loop, outer, partition, state, job):
+        self._queue.append((loop, outer, partition, state, job))
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._queue and self._running < self._limit():
+            loop, outer, partition, state, job = self._queue.popleft()
+            if outer.cancelled():
+                continue
+            self._running += 1
+            inner = loop.run_in_executor(self._executor, self._run, partition, state, job)
+            inner.add_done_callback(functools.partial(self._finished, loop, outer, partition, job))
+
+    def _finished(self, loop, outer, partition, job, inner):
+        self._running -= 1
+        e = None if inner.cancelled() else inner.exception()
+        if not inner.cancelled():
+            self._healthy = not isinstance(e, _UNREACHABLE)
+        if outer.cancelled():
+            pass
+        elif isinstance(e, retry.RetryLater):
+            # Back off here rather than in a worker, then run the call again
+            loop.call_later(e.delay, self._enqueue, loop, outer, partition, (e.attempt, e.started), job)
+        elif inner.cancelled():
+            outer.cancel()
+        elif e is not None:
+            outer.set_exception(e)
+        else:
+            outer.set_result(inner.result())
+        self._dispatch()
+
+    def call(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the executor and return an awaitable.
+
+        The call goes to the partition current when call() is made, even
+        if the partition changes before a worker picks it up.
+        """
+        loop = asyncio.get_event_loop()
+        outer = loop.create_future()
+        self._enqueue(loop, outer, self.client.current_partition, (0, None), functools.partial(fn, *args, **kwargs))
+        return outer
+
+    def close(self):
+        """Log off and release connections; returns an awaitable."""
+        return asyncio.get_event_loop().run_in_executor(self._executor, self.client.close)
+
+
+class _AsyncResource(object):
+    """Proxy for a resource object whose methods return awaitables."""
+
+    def __init__(self, async_client, resource):
+        self._async_client = async_client
+        self._resource = resource
+
+    def __getattr__(self, name):
+        return _wrap(self._async_client, getattr(self._resource, name))
+
+    def __repr__(self):
+        return '<async %r>' % self._resource
+
+
+def _wrap(async_client, value):
+    if isinstance(value, (v21_base.BaseV21, v30_base.BaseV30)):
+        return _AsyncResource(async_client, value)
+    if callable(value) and not isinstance(value, type):
+        return functools.partial(async_client.call, value)
+    return value
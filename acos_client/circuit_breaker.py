@@ -0,0 +1,96 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import logging
+import threading
+import time
+
+from acos_client import errors as acos_errors
+
+LOG = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker(object):
+    """Fail fast against a device that keeps refusing or timing out.
+
+    After failure_threshold consecutive connection failures the breaker
+    opens and every call raises CircuitOpen without touching the network.
+    Once reset_timeout seconds have passed it half-opens and lets a single
+    probe call through: success closes it again, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return CLOSED
+        if time.time() - self.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def stats(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'opened_at': self.opened_at,
+        }
+
+    def before_call(self):
+        with self._lock:
+            state = self.state
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+        raise acos_errors.CircuitOpen(msg="circuit open after %d failures" % self.failures)
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                LOG.info("circuit_breaker: closing after successful probe")
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release(self):
+        """End a call that got no answer but did not fail to connect.
+
+        Counts neither way; a half-open breaker lets the next probe through.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._probing:
+                    LOG.warning("circuit_breaker: opening after %d failures", self.failures)
+                self.opened_at = time.time()
+            self._probing = False
@@ -15,78 +15,88 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import contextlib
+import importlib
 import logging
 import six
 import socket
+import threading
 
 import acos_client
 from acos_client import errors as acos_errors
-from acos_client.v21 import axapi_http as v21_http
-from acos_client.v21.dns import DNS as v21_DNS
-from acos_client.v21.ha import HA as v21_HA
-from acos_client.v21.interface import Interface as v21_Interface
-from acos_client.v21.license_manager import LicenseManager as v21_LicenseManager
-from acos_client.v21.nat import Nat as v21_Nat
-from acos_client.v21.network import Network as v21_Network
-from acos_client.v21.session import Session as v21_Session
-from acos_client.v21.sflow import SFlow as v21_SFlow
-from acos_client.v21.slb import SLB as v21_SLB
-from acos_client.v21.system import System as v21_System
-from acos_client.v21.vrrp_a import VRRPA as v21_VRRPA
-
-from acos_client.v30 import axapi_http as v30_http
-from acos_client.v30.device_context import DeviceContext as v30_DeviceContext
-from acos_client.v30.dns import DNS as v30_DNS
-from acos_client.v30.file import File as v30_File
-from acos_client.v30.ha import HA as v30_HA
-from acos_client.v30.interface import Interface as v30_Interface
-from acos_client.v30.license_manager import LicenseManager as v30_LicenseManager
-from acos_client.v30.nat import Nat as v30_Nat
-from acos_client.v30.network import Network as v30_Network
-from acos_client.v30.overlay import Overlay as v30_Overlay
-from acos_client.v30.route import RIB as v30_RIB
-from acos_client.v30.session import Session as v30_Session
-from acos_client.v30.sflow import SFlow as v30_SFlow
-from acos_client.v30.slb import SLB as v30_SLB
-from acos_client.v30.system import System as v30_System
-from acos_client.v30.vlan import Vlan as v30_Vlan
-from acos_client.v30.vrrpa.vrid import VRID as v30_VRRPA
+from acos_client import jsoncodec
+from acos_client import response_cache as acos_response_cache
+from acos_client import retry
+from acos_client import session_cache as acos_session_cache
+
+
+class LazyImports(object):
+    """Mapping of name to class whose modules are imported on first lookup.
+
+    A process normally talks a single AXAPI version, and usually only a
+    few of its resources, so nothing is imported until a Client asks for
+    it. Values are 'package.module:Attribute', 'package.module' or None.
+    """
+
+    def __init__(self, paths):
+        self._paths = paths
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        path = self._paths[name]
+        value = None
+        if path is not None:
+            module, _, attr = path.partition(':')
+            value = importlib.import_module(module)
+            if attr:
+                value = getattr(value, attr)
+        self._loaded[name] = value
+        return value
+
 
 VERSION_IMPORTS = {
-    '21': {
-        'DNS': v21_DNS,
-        'http': v21_http,
-        'HA': v21_HA,
-        'Interface': v21_Interface,
-        'LicenseManager': v21_LicenseManager,
-        'Nat': v21_Nat,
-        'Network': v21_Network,
-        'Session': v21_Session,
-        'SFlow': v21_SFlow,
-        'SLB': v21_SLB,
-        'System': v21_System,
+    '21': LazyImports({
+        'DNS': 'acos_client.v21.dns:DNS',
+        'http': 'acos_client.v21.axapi_http',
+        'HA': 'acos_client.v21.ha:HA',
+        'Interface': 'acos_client.v21.interface:Interface',
+        'LicenseManager': 'acos_client.v21.license_manager:LicenseManager',
+        'Nat': 'acos_client.v21.nat:Nat',
+        'Network': 'acos_client.v21.network:Network',
+        'PartitionSessions': None,
+        'Session': 'acos_client.v21.session:Session',
+        'SessionPool': None,
+        'SFlow': 'acos_client.v21.sflow:SFlow',
+        'SLB': 'acos_client.v21.slb:SLB',
+        'System': 'acos_client.v21.system:System',
         'Vlan': None,
-        'VRRPA': v21_VRRPA
-    },
-    '30': {
-        'DNS': v30_DNS,
-        'http': v30_http,
-        'Interface': v30_Interface,
-        'HA': v30_HA,
-        'LicenseManager': v30_LicenseManager,
-        'Nat': v30_Nat,
-        'Network': v30_Network,
-        'Overlay': v30_Overlay,
-        'RIB': v30_RIB,
-        'Session': v30_Session,
-        'SFlow': v30_SFlow,
-        'SLB': v30_SLB,
-        'System': v30_System,
-        'File': v30_File,
-        'Vlan': v30_Vlan,
-        'VRRPA': v30_VRRPA,
-        'DeviceContext': v30_DeviceContext
-    },
+        'VRRPA': 'acos_client.v21.vrrp_a:VRRPA'
+    }),
+    '30': LazyImports({
+        'DNS': 'acos_client.v30.dns:DNS',
+        'http': 'acos_client.v30.axapi_http',
+        'Interface': 'acos_client.v30.interface:Interface',
+        'HA': 'acos_client.v30.ha:HA',
+        'LicenseManager': 'acos_client.v30.license_manager:LicenseManager',
+        'Nat': 'acos_client.v30.nat:Nat',
+        'Network': 'acos_client.v30.network:Network',
+        'Overlay': 'acos_client.v30.overlay:Overlay',
+        'PartitionSessions': 'acos_client.v30.session:PartitionSessions',
+        'RIB': 'acos_client.v30.route:RIB',
+        'Session': 'acos_client.v30.session:Session',
+        'SessionPool': 'acos_client.v30.session:SessionPool',
+        'SFlow': 'acos_client.v30.sflow:SFlow',
+        'SLB': 'acos_client.v30.slb:SLB',
+        'System': 'acos_client.v30.system:System',
+        'File': 'acos_client.v30.file:File',
+        'Vlan': 'acos_client.v30.vlan:Vlan',
+        'VRRPA': 'acos_client.v30.vrrpa.vrid:VRID',
+        'DeviceContext': 'acos_client.v30.device_context:DeviceContext'
+    }),
 }
 
 LOG = logging.getLogger(__name__)
@@ -103,83 +113,201 @@ class Client(object):
             max_retries=3,     # number of times to retry a connection before giving up
             port=None,         # TCP port to use for connecting to the A10 device
             protocol="https",  # transport protocol - http or https, encryption recommended
-            timeout=5          # seconds to wait for return data before giving up
+            timeout=5,         # seconds to wait for return data before giving up
+            pool_connections=10,  # number of host connection pools to cache
+            pool_maxsize=10,   # maximum number of connections kept open to the A10 device
+            pool_block=False,  # block when the pool is exhausted instead of opening extra connections
+            keep_alive=True,   # reuse connections across calls
+            optimistic=False,  # create without an existence GET; the device's duplicate error raises Exists
+            retry_policy=None,  # acos_client.retry.RetryPolicy for busy/expired-session retries
+            circuit_breaker=None,  # acos_client.circuit_breaker.CircuitBreaker for unreachable devices
+            session_pool_size=None,  # number of AXAPI sessions to spread concurrent calls over (v30 only)
+            session_cache=None,  # SessionCache to reuse sessions across clients; True for the process-wide one
+            partition_sessions=False,  # keep a session (or session pool) per partition instead of switching (v30 only)
+            json_codec=None,  # acos_client.jsoncodec.Codec or library name; fastest installed by default
+            response_cache=None,  # ResponseCache for GET responses (v30 only); True for one with default TTLs
+            coalesce_gets=True  # identical GETs in flight at the same time share one request (v30 only)
     ):
         self._version = self._just_digits(version)
         if self._version not in acos_client.AXAPI_VERSIONS:
             raise acos_errors.ACOSUnsupportedVersion()
         self.max_retries = max_retries
         self.timeout = timeout
+        self.optimistic = bool(optimistic)
+        self.coalesce_gets = bool(coalesce_gets)
+        self.retry_policy = retry_policy or retry.DEFAULT_POLICY
+        if session_cache is True:
+            session_cache = acos_session_cache.DEFAULT_CACHE
+        self.session_cache = session_cache
+        if response_cache not in (None, False) and self._version == acos_client.AXAPI_21:
+            raise acos_errors.ACOSUnsupportedVersion()
+        if response_cache is True:
+            response_cache = acos_response_cache.ResponseCache()
+        self.response_cache = response_cache
+        if isinstance(json_codec, six.string_types):
+            json_codec = jsoncodec.get(json_codec)
         self.host = host
         self.port = port
         self.http = VERSION_IMPORTS[self._version]['http'].HttpClient(
-            host, port, protocol, max_retries=self.max_retries, timeout=timeout
+            host, port, protocol, max_retries=self.max_retries, timeout=timeout,
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            pool_block=pool_block, keep_alive=keep_alive, circuit_breaker=circuit_breaker,
+            codec=json_codec
         )
-        self.session = VERSION_IMPORTS[self._version]['Session'](self, username, password)
-        self.current_partition = 'shared'
+        if partition_sessions:
+            if VERSION_IMPORTS[self._version]['PartitionSessions'] is None:
+                raise acos_errors.ACOSUnsupportedVersion()
+            self.session = VERSION_IMPORTS[self._version]['PartitionSessions'](
+                self, username, password, session_pool_size)
+        elif session_pool_size:
+            if VERSION_IMPORTS[self._version]['SessionPool'] is None:
+                raise acos_errors.ACOSUnsupportedVersion()
+            self.session = VERSION_IMPORTS[self._version]['SessionPool'](
+                self, username, password, session_pool_size)
+        else:
+            self.session = VERSION_IMPORTS[self._version]['Session'](self, username, password)
+        self._partition = 'shared'
+        self._scope = threading.local()
+        # Top-level resources, built on first access and then reused
+        self._resources = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Log off the AXAPI session and release pooled connections."""
+        try:
+            if self.session.session_id is not None:
+                self.session.close()
+        finally:
+            self.http.close()
+
+    @property
+    def current_partition(self):
+        """Partition this thread's calls go to.
+
+        Inside partition_scope() this is the scope's partition; otherwise
+        it is the client-wide partition set by partition.active().
+        """
+        return getattr(self._scope, 'partition', self._partition)
+
+    @current_partition.setter
+    def current_partition(self, name):
+        if hasattr(self._scope, 'partition'):
+            self._scope.partition = name
+        else:
+            self._partition = name
+
+    @contextlib.contextmanager
+    def partition_scope(self, name):
+        """Send the calls this thread makes in the block to partition name.
+
+        Other threads keep their own partition, so one client can serve a
+        whole worker pool. Calls to different partitions take turns on a
+        single session; use session_pool_size or partition_sessions to
+        run them at the same time. v3 only.
+        """
+        if self._version == acos_client.AXAPI_21:
+            raise acos_errors.ACOSUnsupportedVersion()
+        outer = getattr(self._scope, 'partition', None)
+        self._scope.partition = name
+        try:
+            yield self
+        finally:
+            if outer is None:
+                del self._scope.partition
+            else:
+                self._scope.partition = outer
+
+    def parallel(self, max_in_flight=None):
+        """Return a batch that runs independent calls concurrently.
+
+        max_in_flight caps concurrent calls to this device and defaults to
+        the connection pool size. See acos_client.parallel.Parallel.
+        """
+        # Imported here so `import acos_client` does not load concurrent.futures
+        from acos_client import parallel
+        return parallel.Parallel(self, max_in_flight)
+
+    def graph(self, max_in_flight=None):
+        """Return a batch of calls that run as their dependencies allow.
+
+        See acos_client.parallel.Graph; max_in_flight is as for parallel().
+        """
+        from acos_client import parallel
+        return parallel.Graph(self, max_in_flight)
+
+    def _resource(self, name):
+        try:
+            return self._resources[name]
+        except KeyError:
+            return self._resources.setdefault(name, VERSION_IMPORTS[self._version][name](self))
 
     def _just_digits(self, s):
         return ''.join(i for i in str(s) if i.isdigit())
 
     @property
     def dns(self):
-        return VERSION_IMPORTS[self._version]['DNS'](self)
+        return self._resource('DNS')
 
     @property
     def ha(self):
-        return VERSION_IMPORTS[self._version]['HA'](self)
+        return self._resource('HA')
 
     @property
     def interface(self):
-        return VERSION_IMPORTS[self._version]['Interface'](self)
+        return self._resource('Interface')
 
     @property
     def system(self):
-        return VERSION_IMPORTS[self._version]['System'](self)
+        return self._resource('System')
 
     @property
     def slb(self):
-        return VERSION_IMPORTS[self._version]['SLB'](self)
+        return self._resource('SLB')
 
     @property
     def network(self):
-        return VERSION_IMPORTS[self._version]['Network'](self)
+        return self._resource('Network')
 
     @property
     def nat(self):
-        return VERSION_IMPORTS[self._version]['Nat'](self)
+        return self._resource('Nat')
 
     @property
     def file(self):
-        return VERSION_IMPORTS[self._version]['File'](self)
+        return self._resource('File')
 
     @property
     def sflow(self):
-        return VERSION_IMPORTS[self._version]['SFlow'](self)
+        return self._resource('SFlow')
 
     @property
     def license_manager(self):
-        return VERSION_IMPORTS[self._version]["LicenseManager"](self)
+        return self._resource('LicenseManager')
 
     @property
     def overlay(self):
-        return VERSION_IMPORTS[self._version]["Overlay"](self)
+        return self._resource('Overlay')
 
     @property
     def vlan(self):
-        return VERSION_IMPORTS[self._version]["Vlan"](self)
+        return self._resource('Vlan')
 
     @property
     def route(self):
-        return VERSION_IMPORTS[self._version]["RIB"](self)
+        return self._resource('RIB')
 
     @property
     def vrrpa(self):
-        return VERSION_IMPORTS[self._version]["VRRPA"](self)
+        return self._resource('VRRPA')
 
     @property
     def device_context(self):
-        return VERSION_IMPORTS[self._version]["DeviceContext"](self)
+        return self._resource('DeviceContext')
 
     def wait_for_connect(self, max_timeout=60):
         for i in six.moves.range(0, max_timeout):
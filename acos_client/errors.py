@@ -113,3 +113,28 @@ class KeyParsingFailed(ACOSException):
 
 class FeatureNotSupported(ACOSException):
     pass
+
+
+class DeviceTimeout(ACOSException):
+    pass
+
+
+class CircuitOpen(ACOSException):
+    pass
+
+
+class DependencyFailed(ACOSException):
+    """A call was not made because a call it depends on failed; see cause."""
+
+    def __init__(self, cause):
+        self.cause = cause
+        super(DependencyFailed, self).__init__(msg="dependency failed: %s" % cause)
+
+
+class PartialFailure(ACOSException):
+    """Some items of a bulk operation failed; see failures."""
+
+    def __init__(self, failures, total=None):
+        self.failures = failures
+        msg = "%d of %s items failed" % (len(failures), total if total is not None else "?")
+        super(PartialFailure, self).__init__(msg=msg)
@@ -0,0 +1,145 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+from concurrent import futures
+import logging
+import threading
+import time
+
+from acos_client import errors as acos_errors
+
+LOG = logging.getLogger(__name__)
+
+FleetResult = collections.namedtuple('FleetResult', ['device', 'value', 'exception'])
+
+
+class FleetClient(object):
+    """Run the same operation across many devices concurrently.
+
+    Usage::
+
+        fleet = FleetClient({'lb1': client1, 'lb2': client2})
+        for r in fleet.run('system.action.write_memory', timeout=30):
+            if r.exception:
+                LOG.error("%s: %s", r.device, r.exception)
+
+    The operation is either a dotted path resolved on each device's Client
+    or a callable taking the Client as its first argument. Results are
+    yielded as each device finishes. A device that raises, or that runs
+    longer than timeout seconds, yields a result carrying the exception
+    without affecting the others.
+    """
+
+    def __init__(self, clients=None, max_workers=32):
+        self.clients = collections.OrderedDict(clients or {})
+        self.max_workers = max_workers
+
+    def __len__(self):
+        return len(self.clients)
+
+    def add(self, device, client):
+        self.clients[device] = client
+
+    def remove(self, device):
+        return self.clients.pop(device)
+
+    def close(self):
+        for device, client in self.clients.items():
+            try:
+                client.close()
+            except Exception as e:
+                LOG.warning("fleet: closing %s failed: %s", device, e)
+
+    def _resolve(self, client, operation):
+        if callable(operation):
+            return lambda *args, **kwargs: operation(client, *args, **kwargs)
+        target = client
+        for name in operation.split('.'):
+            target = getattr(target, name)
+        return target
+
+    def run(self, operation, *args, **kwargs):
+        """Run operation on each device, yielding FleetResults as they finish.
+
+        Keyword arguments devices (names to target, default all) and
+        timeout (per-device seconds, default none) are consumed here; the
+        rest are passed to the operation.
+        """
+        devices = kwargs.pop('devices', None)
+        timeout = kwargs.pop('timeout', None)
+        if devices is None:
+            devices = list(self.clients)
+        if not devices:
+            return
+
+        started = {}
+        lock = threading.Lock()
+
+        def call(device):
+            with lock:
+                started[device] = time.time()
+            return self._resolve(self.clients[device], operation)(*args, **kwargs)
+
+        executor = futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(devices)))
+        pending = {}
+        try:
+            pending = dict((executor.submit(call, d), d) for d in devices)
+            while pending:
+                done, _ = futures.wait(pending, timeout=self._next_deadline(pending, started, lock, timeout),
+                                       return_when=futures.FIRST_COMPLETED)
+                for f in done:
+                    device = pending.pop(f)
+                    e = f.exception()
+                    if e is not None:
+                        yield FleetResult(device, None, e)
+                    else:
+                        yield FleetResult(device, f.result(), None)
+
+                if timeout is None:
+                    continue
+                now = time.time()
+                for f, device in list(pending.items()):
+                    with lock:
+                        start = started.get(device)
+                    if start is not None and now - start >= timeout:
+                        # Running threads can't be interrupted; report the
+                        # device and stop waiting for it.
+                        del pending[f]
+                        yield FleetResult(device, None, acos_errors.DeviceTimeout(
+                            msg="%s did not finish within %ss" % (device, timeout)))
+        finally:
+            # If the caller stopped iterating, devices not started yet are
+            # left alone; calls already running can't be interrupted.
+            for f in pending:
+                f.cancel()
+            executor.shutdown(wait=False)
+
+    def run_all(self, operation, *args, **kwargs):
+        """Like run(), but return a dict of device -> FleetResult."""
+        return dict((r.device, r) for r in self.run(operation, *args, **kwargs))
+
+    def _next_deadline(self, pending, started, lock, timeout):
+        if timeout is None:
+            return None
+        now = time.time()
+        waits = []
+        with lock:
+            for device in pending.values():
+                start = started.get(device)
+                waits.append(timeout if start is None else start + timeout - now)
+        return max(0, min(waits))
@@ -0,0 +1,87 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""JSON encoding of AXAPI requests and decoding of responses.
+
+AXAPI oper and stats responses run to megabytes, so by default the
+fastest JSON library installed of orjson, ujson and python-rapidjson is
+used, falling back to the standard library. Responses are decoded
+straight from the body bytes.
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import importlib
+import json
+
+# Tried in this order by default()
+PREFERENCE = ('orjson', 'ujson', 'rapidjson', 'json')
+
+
+class Codec(object):
+    """A named pair of dumps(obj) -> str or bytes and loads(bytes) -> obj.
+
+    loads raises ValueError for a body that is not JSON, as json.loads
+    does.
+    """
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return '<Codec %s>' % self.name
+
+
+def _stdlib_loads(data):
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _ujson_codec(ujson):
+    def dumps(obj):
+        return ujson.dumps(obj, escape_forward_slashes=False)
+    return Codec('ujson', dumps, ujson.loads)
+
+
+_FACTORIES = {
+    'orjson': lambda m: Codec('orjson', m.dumps, m.loads),
+    'ujson': _ujson_codec,
+    'rapidjson': lambda m: Codec('rapidjson', m.dumps, m.loads),
+    'json': lambda m: Codec('json', m.dumps, _stdlib_loads),
+}
+
+_codecs = {}
+
+
+def get(name):
+    """Return the codec for library name; ImportError if not installed."""
+    if name not in _codecs:
+        if name not in _FACTORIES:
+            raise ValueError("unknown JSON codec %r" % name)
+        _codecs[name] = _FACTORIES[name](importlib.import_module(name))
+    return _codecs[name]
+
+
+def default():
+    """Return the first codec in PREFERENCE that is installed."""
+    for name in PREFERENCE:
+        try:
+            return get(name)
+        except ImportError:
+            continue
+    return get('json')
@@ -0,0 +1,191 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Incremental parsing of the "*-list" arrays in large AXAPI responses.
+
+List and oper responses for a whole device can run to hundreds of
+megabytes once parsed. iter_lists() reads the body a chunk at a time and
+decodes one list item at a time, so memory use is bounded by the
+largest single item instead of the size of the configuration.
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import codecs
+import json
+import re
+
+import six
+
+CHUNK_SIZE = 64 * 1024
+
+_WS = re.compile(r'[ \t\n\r]*')
+_NUMBER_TAIL = re.compile(r'[0-9.eE+-]*')
+_NUMBERS = six.integer_types + (float,)
+_DECODER = json.JSONDecoder()
+
+
+class _Reader(object):
+    """A window of decoded text over an iterable of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        """Append the next chunk, dropping what has been consumed.
+
+        Returns False once the input is exhausted.
+        """
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:]
+        self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b'', final=True)
+        self.eof = True
+        return False
+
+    def peek(self):
+        """Return the next non-whitespace character, or '' at the end."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                return ''
+
+    def value(self):
+        """Decode the complete JSON value starting at pos."""
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self.more():
+                    continue
+                raise
+            # A number cut by the end of the buffer may continue in the
+            # next chunk, even when what was read so far decodes ("12.")
+            number = isinstance(value, _NUMBERS) and not isinstance(value, bool)
+            if number and _NUMBER_TAIL.match(self.buf, end).end() == len(self.buf) and self.more():
+                continue
+            self.pos = end
+            return value
+
+
+def _items(reader):
+    if reader.peek() == ']':
+        reader.pos += 1
+        return
+    while True:
+        if not reader.peek():
+            raise ValueError("truncated JSON")
+        yield reader.value()
+        c = reader.peek()
+        reader.pos += 1
+        if c == ']':
+            return
+        if not c:
+            raise ValueError("truncated JSON")
+        if c != ',':
+            raise ValueError("expected ',' or ']' in list, found %r" % c)
+
+
+def iter_lists(chunks):
+    """Yield (key, item) for every item of every "<name>-list" array.
+
+    chunks is an iterable of bytes such as response.iter_content(). Lists
+    are found at any depth, but a list inside an item is returned as part
+    of that item. Raises ValueError if the body is not valid JSON.
+    """
+    reader = _Reader(chunks)
+    stack = []
+    key = None
+    expect_value = True
+    while True:
+        c = reader.peek()
+        if not c:
+            if stack or expect_value:
+                raise ValueError("truncated JSON")
+            return
+        if expect_value:
+            expect_value = False
+            if c == '[' and key is not None and key.endswith('-list'):
+                reader.pos += 1
+                for item in _items(reader):
+                    yield key, item
+            elif c in '{[':
+                reader.pos += 1
+                stack.append(c)
+            else:
+                reader.value()
+            key = None
+        elif not stack:
+            raise ValueError("extra data after JSON value")
+        elif c in '}]':
+            reader.pos += 1
+            stack.pop()
+        elif c == ',':
+            reader.pos += 1
+            expect_value = stack[-1] == '['
+        elif stack[-1] == '{':
+            key = reader.value()
+            if not isinstance(key, six.string_types) or reader.peek() != ':':
+                raise ValueError("expected an object key")
+            reader.pos += 1
+            expect_value = True
+        else:
+            expect_value = True
+
+
+def lists_in(data):
+    """Yield (key, item) like iter_lists() for an already decoded body."""
+    if isinstance(data, dict):
+        for key, value in six.iteritems(data):
+            if isinstance(value, list) and key.endswith('-list'):
+                for item in value:
+                    yield key, item
+            else:
+                for pair in lists_in(value):
+                    yield pair
+    elif isinstance(data, list):
+        for value in data:
+            for pair in lists_in(value):
+                yield pair
+
+
+class ListStream(object):
+    """Iterator of (key, item) over a streamed requests response.
+
+    The response is closed when iteration finishes or is abandoned.
+    """
+
+    def __init__(self, response, chunk_size=CHUNK_SIZE):
+        self.response = response
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        try:
+            for pair in iter_lists(self.response.iter_content(self.chunk_size)):
+                yield pair
+        finally:
+            self.response.close()
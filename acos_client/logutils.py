@@ -12,12 +12,18 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 import six
 
-CLEAN_FIELDS = ["username", "password"]
+# Keys whose values are masked in logs, at any depth
+CLEAN_FIELDS = ["username", "password", "passphrase", "key-passphrase", "Authorization"]
 
 REPLACEMENT = "*" * 8
 
+# Longest payload rendering written to debug logs; None for no limit
+MAX_DUMP_LENGTH = None
+
 
 def clean(data, field=None):
     if field in CLEAN_FIELDS:
@@ -38,3 +44,78 @@ def clean(data, field=None):
         return type(data)(clean(x) for x in data)
 
     return data
+
+
+def redact(data, fields=None):
+    """Return data with the values of sensitive keys masked.
+
+    Unlike clean(), nothing is copied unless it has to change: a response
+    without credentials in it is returned as is, and otherwise only the
+    dicts and lists on the way to a masked value are rebuilt. fields
+    defaults to CLEAN_FIELDS.
+    """
+    if fields is None:
+        fields = frozenset(CLEAN_FIELDS)
+    if type(data) in _CONTAINERS:
+        return _redact(data, fields)
+    return data
+
+
+_CONTAINERS = frozenset([dict, list, tuple])
+
+
+def _redact(data, fields):
+    if type(data) is dict:
+        copy = None
+        for key, value in six.iteritems(data):
+            if key in fields:
+                new = REPLACEMENT
+            elif type(value) in _CONTAINERS:
+                new = _redact(value, fields)
+                if new is value:
+                    continue
+            else:
+                continue
+            if copy is None:
+                copy = dict(data)
+            copy[key] = new
+        return data if copy is None else copy
+
+    items = None
+    for i, value in enumerate(data):
+        if type(value) in _CONTAINERS:
+            new = _redact(value, fields)
+            if new is not value:
+                if items is None:
+                    items = list(data)
+                items[i] = new
+    if items is None:
+        return data
+    return type(data)(items)
+
+
+class Dump(object):
+    """Redacted JSON rendering of data, built only when it is logged.
+
+    Pass it as a logging argument, LOG.debug("data = %s", Dump(data)),
+    and redaction and serialization happen only if a handler formats the
+    record. Values of the keys in fields (CLEAN_FIELDS by default) are
+    masked. Output longer than MAX_DUMP_LENGTH is cut short.
+    """
+
+    __slots__ = ('data', 'indent', 'fields')
+
+    def __init__(self, data, indent=None, fields=None):
+        self.data = data
+        self.indent = indent
+        self.fields = fields
+
+    def __str__(self):
+        fields = frozenset(CLEAN_FIELDS if self.fields is None else self.fields)
+        try:
+            text = json.dumps(redact(self.data, fields), indent=self.indent)
+        except (TypeError, ValueError):
+            text = repr(clean(self.data))
+        if MAX_DUMP_LENGTH is not None and len(text) > MAX_DUMP_LENGTH:
+            text = "%s... (%d more characters)" % (text[:MAX_DUMP_LENGTH], len(text) - MAX_DUMP_LENGTH)
+        return text
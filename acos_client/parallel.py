@@ -0,0 +1,213 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+from concurrent import futures
+import heapq
+import logging
+
+import acos_client
+from acos_client import errors as acos_errors
+
+LOG = logging.getLogger(__name__)
+
+Result = collections.namedtuple('Result', ['value', 'exception'])
+
+
+class Parallel(object):
+    """Run independent AXAPI calls against one device on a thread pool.
+
+    Usage::
+
+        batch = c.parallel(max_in_flight=8)
+        for name in servers:
+            batch.add(c.slb.service_group.member.create, 'pool1', name, 80)
+        for result in batch.run():
+            if result.exception:
+                ...
+
+    Results come back in the order the calls were added. A failing call
+    does not stop the others; its exception is returned in its Result.
+    """
+
+    def __init__(self, client, max_in_flight=None):
+        self.client = client
+        if max_in_flight is None:
+            max_in_flight = client.http.pool_maxsize
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self._calls = []
+
+    def __len__(self):
+        return len(self._calls)
+
+    def add(self, fn, *args, **kwargs):
+        self._calls.append((fn, args, kwargs))
+        return self
+
+    def map(self, fn, iterable):
+        """Add fn(*args) for every args tuple in iterable."""
+        for args in iterable:
+            self.add(fn, *args)
+        return self
+
+    def run(self):
+        calls, self._calls = self._calls, []
+        if not calls:
+            return []
+
+        # Log in once here so the workers don't race each other to /auth.
+        self.client.session.id
+
+        # Workers run in the partition of the thread that called run()
+        partition = self.client.current_partition
+        workers = min(self.max_in_flight, len(calls))
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            fs = [executor.submit(self._call, partition, fn, args, kwargs) for fn, args, kwargs in calls]
+            return [self._result(f) for f in fs]
+
+    def _call(self, partition, fn, args, kwargs):
+        # Always scope v3 calls: the client-wide partition can change under
+        # a worker at any time. v2.1 has no scopes.
+        if self.client._version == acos_client.AXAPI_21:
+            return fn(*args, **kwargs)
+        with self.client.partition_scope(partition):
+            return fn(*args, **kwargs)
+
+    def _result(self, f):
+        e = f.exception()
+        if e is not None:
+            LOG.debug("parallel: call failed with %s", e.__class__.__name__)
+            return Result(None, e)
+        return Result(f.result(), None)
+
+
+class Task(object):
+    """A call added to a Graph; see Graph.add()."""
+
+    def __init__(self, index, fn, args, kwargs):
+        self.index = index
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.dependencies = []
+
+    def after(self, *tasks):
+        """Run this call only once all of tasks have succeeded."""
+        self.dependencies.extend(tasks)
+        return self
+
+
+class Graph(Parallel):
+    """Run AXAPI calls that depend on each other against one device.
+
+    Usage::
+
+        graph = c.graph(max_in_flight=8)
+        hm = graph.add(c.slb.hm.create, 'hm1', c.slb.hm.HTTP, 5, 5, 3)
+        servers = [graph.add(c.slb.server.create, name, ip).after(hm)
+                   for name, ip in backends]
+        pool = graph.add(c.slb.service_group.create, 'pool1')
+        members = [graph.add(c.slb.service_group.member.create, 'pool1', name, 80).after(pool, s)
+                   for (name, ip), s in zip(backends, servers)]
+        ...
+        results = graph.run()
+
+    Each call starts as soon as everything it runs after has succeeded,
+    with at most max_in_flight calls in flight; among the calls that are
+    ready, those with the longest chain of calls waiting on them go
+    first. Results come back in the order the calls were added. A call
+    whose dependency failed is not made; its Result carries
+    DependencyFailed.
+    """
+
+    def add(self, fn, *args, **kwargs):
+        """Add fn(*args, **kwargs) and return its Task."""
+        task = Task(len(self._calls), fn, args, kwargs)
+        self._calls.append(task)
+        return task
+
+    def run(self):
+        tasks, self._calls = self._calls, []
+        if not tasks:
+            return []
+
+        dependents = dict((task, []) for task in tasks)
+        waiting = {}
+        for task in tasks:
+            deps = set(task.dependencies)
+            for dep in deps:
+                if dep not in dependents:
+                    raise ValueError("task %d depends on a task from another graph" % task.index)
+                dependents[dep].append(task)
+            waiting[task] = len(deps)
+        priority = self._priority(tasks, dependents, waiting)
+
+        # As in Parallel.run(): log in once, run in the caller's partition
+        self.client.session.id
+        partition = self.client.current_partition
+        results = [None] * len(tasks)
+        ready = [(priority[task], task.index, task) for task in tasks if not waiting[task]]
+        heapq.heapify(ready)
+        running = {}
+
+        with futures.ThreadPoolExecutor(max_workers=min(self.max_in_flight, len(tasks))) as executor:
+            while ready or running:
+                while ready and len(running) < self.max_in_flight:
+                    task = heapq.heappop(ready)[2]
+                    running[executor.submit(self._call, partition, task.fn, task.args, task.kwargs)] = task
+                done, _ = futures.wait(list(running), return_when=futures.FIRST_COMPLETED)
+                for f in done:
+                    task = running.pop(f)
+                    results[task.index] = result = self._result(f)
+                    if result.exception is not None:
+                        self._skip(task, result.exception, dependents, results)
+                        continue
+                    for dependent in dependents[task]:
+                        waiting[dependent] -= 1
+                        if not waiting[dependent] and results[dependent.index] is None:
+                            heapq.heappush(ready, (priority[dependent], dependent.index, dependent))
+        return results
+
+    def _priority(self, tasks, dependents, waiting):
+        """Map each task to minus the length of the chain waiting on it.
+
+        Raises ValueError if the dependencies form a cycle.
+        """
+        remaining = dict(waiting)
+        order = [task for task in tasks if not remaining[task]]
+        for task in order:
+            for dependent in dependents[task]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    order.append(dependent)
+        if len(order) != len(tasks):
+            raise ValueError("task dependencies form a cycle")
+
+        depth = {}
+        for task in reversed(order):
+            depth[task] = 1 + max([depth[d] for d in dependents[task]] or [0])
+        return dict((task, -d) for task, d in depth.items())
+
+    def _skip(self, failed, cause, dependents, results):
+        stack = list(dependents[failed])
+        while stack:
+            task = stack.pop()
+            if results[task.index] is None:
+                results[task.index] = Result(None, acos_errors.DependencyFailed(cause))
+                stack.extend(dependents[task])
@@ -0,0 +1,126 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+import copy
+import json
+import threading
+import time
+
+
+class ResponseCache(object):
+    """Read-through cache of AXAPI GET responses.
+
+    Entries are keyed on (device, partition, url, params) and live for ttl
+    seconds, or for the ttl of the longest matching prefix in ttls, e.g.
+    {'/slb/service-group/': 30, '/partition-all/': 60}; a ttl of 0 turns
+    caching off below that prefix. At most max_entries responses are
+    kept, least recently used first out.
+
+    A POST, PUT or DELETE drops every entry whose url is a prefix of the
+    written url or starts with it, in every partition, so writing
+    /slb/service-group/pool1 drops pool1, its members and oper, and the
+    /slb/service-group/ and /slb/ listings. Changes made by other clients
+    are only seen once an entry expires.
+
+    Responses are copied in and out, so callers may modify what they get.
+    """
+
+    def __init__(self, ttl=5.0, ttls=None, max_entries=1024):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        # Bumped by every write so a GET racing one is not stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+            }
+
+    def ttl_for(self, url):
+        best = None
+        for prefix in self.ttls:
+            if url.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        return self.ttl if best is None else self.ttls[best]
+
+    def fetch(self, device, partition, url, params, get):
+        """Return the cached response for the key, or get() and cache it."""
+        ttl = self.ttl_for(url)
+        if ttl is None or ttl <= 0:
+            return get()
+
+        key = (device, partition, url, json.dumps(params, sort_keys=True) if params else '')
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries[key] = self._entries.pop(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+            generation = self._generation
+
+        value = get()
+        stored = copy.deepcopy(value)
+        with self._lock:
+            if generation == self._generation:
+                self._entries.pop(key, None)
+                self._entries[key] = (now + ttl, stored)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def invalidate(self, device, url):
+        """Drop the entries of device a write to url may have changed."""
+        url = url.rstrip('/')
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries
+                     if key[0] == device and _related(key[2].rstrip('/'), url)]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+def _related(cached, written):
+    return cached.startswith(written) or written.startswith(cached)
+
+
+def cache_for(client):
+    cache = getattr(client, 'response_cache', None)
+    if isinstance(cache, ResponseCache):
+        return cache
+    return None
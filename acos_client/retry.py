@@ -0,0 +1,137 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import contextlib
+import random
+import threading
+import time
+
+_deferred = threading.local()
+
+
+class RetryLater(Exception):
+    """Raised in place of a backoff sleep while retries are deferred.
+
+    The caller waits delay seconds however it likes and then runs the
+    whole call again inside deferred(attempt, started), so backoff and
+    the deadline carry on from where they stopped.
+    """
+
+    def __init__(self, delay, attempt, started):
+        super(RetryLater, self).__init__(delay)
+        self.delay = delay
+        self.attempt = attempt
+        self.started = started
+
+
+class RetryBudget(object):
+    """Token bucket limiting retries against one device.
+
+    Every retry spends a token and every successful call earns back
+    ratio of one, so when a device is failing retries stop once the
+    bucket is empty instead of multiplying its load.
+    """
+
+    def __init__(self, capacity=20.0, ratio=0.2):
+        self.capacity = capacity
+        self.ratio = ratio
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy(object):
+    """Exponential backoff with full jitter, bounded by a per-call deadline.
+
+    The n-th retry sleeps a random time between 0 and
+    min(max_delay, base_delay * 2 ** n); no retry is attempted if it would
+    end past deadline seconds from the first attempt. Retry budgets are
+    kept per device, so every Client using the same policy and device
+    draws from the same bucket.
+    """
+
+    def __init__(self, base_delay=0.5, max_delay=30.0, deadline=120.0,
+                 budget_capacity=20.0, budget_ratio=0.2):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget_capacity = budget_capacity
+        self.budget_ratio = budget_ratio
+        self._budgets = {}
+        self._lock = threading.Lock()
+
+    def budget(self, device):
+        with self._lock:
+            if device not in self._budgets:
+                self._budgets[device] = RetryBudget(self.budget_capacity, self.budget_ratio)
+            return self._budgets[device]
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def next_delay(self, attempt, started):
+        """Seconds to sleep before retry number attempt, or None to give up."""
+        delay = self.backoff(attempt)
+        if time.time() + delay > started + self.deadline:
+            return None
+        return delay
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+@contextlib.contextmanager
+def deferred(attempt=0, started=None):
+    """Raise RetryLater from retries on this thread instead of sleeping."""
+    _deferred.state = (attempt, time.time() if started is None else started)
+    try:
+        yield
+    finally:
+        del _deferred.state
+
+
+def begin():
+    """Return (attempt, started) for a request's retry loop."""
+    return getattr(_deferred, 'state', None) or (0, time.time())
+
+
+def wait(delay, attempt, started):
+    """Sleep before retry number attempt, or raise RetryLater if deferred."""
+    if getattr(_deferred, 'state', None) is not None:
+        raise RetryLater(delay, attempt, started)
+    time.sleep(delay)
+
+
+def policy_for(client):
+    policy = getattr(client, 'retry_policy', None)
+    if isinstance(policy, RetryPolicy):
+        return policy
+    return DEFAULT_POLICY
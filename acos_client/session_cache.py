@@ -0,0 +1,205 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+def cache_key(url_base, username, password, partition):
+    """Key for the sessions of one user in one partition of one device.
+
+    The password is folded in as a digest so a client with different
+    credentials never receives another client's session.
+    """
+    digest = hashlib.sha256(password.encode('utf-8')).hexdigest()
+    return (url_base, username, partition, digest)
+
+
+class SessionCache(object):
+    """Process-wide store of idle AXAPI session ids.
+
+    Clients that are created and closed per request can hand their session
+    back here instead of logging off; the next Client for the same device,
+    user and partition picks it up instead of logging in. A session id is
+    only ever lent to one Session at a time because the active partition
+    is per-session state on the device.
+
+    Ids idle for longer than idle_timeout are dropped rather than reused,
+    so idle_timeout should be below the device's own session timeout. Ids
+    are not checked when lent: a stale one is rejected by the device with
+    InvalidSessionID and the Session logs in again as usual.
+    """
+
+    def __init__(self, idle_timeout=300.0, max_idle=8):
+        self.idle_timeout = idle_timeout
+        self.max_idle = max_idle
+        self.hits = 0
+        self.misses = 0
+        self._idle = collections.defaultdict(list)
+        self._leased = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _entries(self):
+        """Hold the cache locked and yield its idle ids.
+
+        The mapping is slot -> list of (session_id, released_at), where
+        slot is _slot(key). Subclasses keeping the ids elsewhere override
+        this and _slot.
+        """
+        with self._lock:
+            yield self._idle
+
+    def _slot(self, key):
+        return key
+
+    def __len__(self):
+        with self._entries() as idle:
+            return sum(len(v) for v in idle.values())
+
+    def stats(self):
+        with self._entries() as idle:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'idle': sum(len(v) for v in idle.values()),
+                'leased': len(self._leased),
+            }
+
+    def lease(self, key):
+        """Return an idle session id for key, or None if there is none."""
+        now = time.time()
+        with self._entries() as all_idle:
+            idle = all_idle.get(self._slot(key), [])
+            while idle:
+                session_id, released_at = idle.pop()
+                if now - released_at < self.idle_timeout:
+                    self._leased[session_id] = key
+                    self.hits += 1
+                    return session_id
+            self.misses += 1
+            return None
+
+    def release(self, key, session_id):
+        """Hand session_id back under key.
+
+        Returns False when the cache is full, in which case the caller
+        should log the session off itself.
+        """
+        with self._entries() as all_idle:
+            self._leased.pop(session_id, None)
+            idle = all_idle.setdefault(self._slot(key), [])
+            if len(idle) >= self.max_idle:
+                return False
+            idle.append((session_id, time.time()))
+            return True
+
+    def discard(self, session_id):
+        """Forget a session id the device has rejected."""
+        with self._lock:
+            self._leased.pop(session_id, None)
+
+    def clear(self):
+        with self._entries() as idle:
+            idle.clear()
+            self._leased.clear()
+
+
+class FileSessionCache(SessionCache):
+    """SessionCache kept in a file so separate processes can share it.
+
+    Meant for scripts and cron jobs that run one Client and exit: the
+    session the last run handed back is picked up by the next one instead
+    of logging in again. The file is created readable only by its owner
+    and locked with flock(2) while read and rewritten; on platforms
+    without fcntl only threads within one process are serialized.
+
+    The file holds live session ids, which grant access to the device
+    until they time out, so it should live in a directory only the
+    script's user can reach. Keys are stored as digests and carry no
+    usernames or passwords.
+    """
+
+    def __init__(self, path, idle_timeout=300.0, max_idle=8):
+        super(FileSessionCache, self).__init__(idle_timeout=idle_timeout, max_idle=max_idle)
+        self.path = path
+
+    def _slot(self, key):
+        return hashlib.sha256('\0'.join(key).encode('utf-8')).hexdigest()
+
+    @contextlib.contextmanager
+    def _entries(self):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                os.fchmod(fd, 0o600)
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                idle = self._read(fd)
+                yield idle
+                self._write(fd, idle)
+            finally:
+                os.close(fd)
+
+    def _read(self, fd):
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            sessions = json.loads(b''.join(chunks).decode('utf-8'))['sessions']
+            now = time.time()
+            idle = {}
+            for slot, entries in sessions.items():
+                # Expired ids are dropped here so the file does not grow
+                live = [tuple(e) for e in entries if now - e[1] < self.idle_timeout]
+                if live:
+                    idle[slot] = live
+            return idle
+        except (ValueError, KeyError, TypeError, AttributeError, IndexError):
+            # Empty, truncated by a crash, or not ours; start over
+            return {}
+
+    def _write(self, fd, idle):
+        sessions = dict((slot, entries) for slot, entries in idle.items() if entries)
+        data = json.dumps({'sessions': sessions}).encode('utf-8')
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        while data:
+            data = data[os.write(fd, data):]
+
+
+DEFAULT_CACHE = SessionCache()
+
+
+def cache_for(client):
+    cache = getattr(client, 'session_cache', None)
+    if isinstance(cache, SessionCache):
+        return cache
+    return None
@@ -0,0 +1,88 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import copy
+import sys
+import threading
+
+import six
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.exc_info = None
+
+
+class SingleFlight(object):
+    """Coalesce identical calls that are in progress at the same time.
+
+    The first caller for a key runs the call; callers arriving with the
+    same key before it finishes wait and receive a copy of its result, or
+    the exception it raised. Completed calls are not remembered.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.exc_info is not None:
+                six.reraise(*call.exc_info)
+            return copy.deepcopy(call.result)
+
+        result = None
+        try:
+            result = fn()
+            return result
+        except BaseException:
+            call.exc_info = sys.exc_info()
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            # No one joins once the call is unlisted; waiters copy from
+            # a snapshot the leader's caller cannot modify
+            if call.waiters and call.exc_info is None:
+                call.result = copy.deepcopy(result)
+            call.done.set()
+
+    def forget(self):
+        """Make later callers start new calls instead of joining current ones.
+
+        Called after a write so that a read issued after it completes
+        never shares a response fetched before it.
+        """
+        with self._lock:
+            self._calls.clear()
@@ -0,0 +1,225 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+from concurrent import futures
+import json
+import threading
+import time
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+from requests import exceptions as requests_exceptions
+
+try:
+    import asyncio
+    from acos_client.async_client import AsyncClient
+except ImportError:
+    asyncio = None
+
+from acos_client import errors as acos_errors
+from acos_client import retry
+
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+AUTH_URL = '{}/auth'.format(BASE_URL)
+SERVER_URL = '{}/slb/server/'.format(BASE_URL)
+MEMBER_URL = '{}/slb/service-group/pool1/member/'.format(BASE_URL)
+
+
+@unittest.skipIf(asyncio is None, 'asyncio not available')
+class TestAsyncClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = AsyncClient(HOSTNAME, '30', 'fake_username', 'fake_password', max_in_flight=4)
+
+    def run_async(self, make_awaitable):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(make_awaitable())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def test_resources_are_wrapped(self):
+        self.assertEqual(self.client.slb.service_group.TCP, 'tcp')
+        self.assertIn('ServiceGroup', repr(self.client.slb.service_group))
+
+    @responses.activate
+    @responses.activate
+    def test_create_awaitable(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.POST, SERVER_URL, json={'server': {}})
+
+        with mock.patch('acos_client.v30.slb.server.Server.get', side_effect=acos_errors.NotFound):
+            resp = self.run_async(lambda: self.client.slb.server.create('s1', '1.1.1.1'))
+
+        self.assertEqual(resp, {'server': {}})
+        self.assertEqual(responses.calls[1].request.headers['Authorization'], 'A10 foobar')
+        self.assertEqual(json.loads(responses.calls[1].request.body)['server']['host'], '1.1.1.1')
+
+    @responses.activate
+    def test_concurrent_calls_authenticate_once(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.POST, MEMBER_URL, json={})
+        member = self.client.slb.service_group.member
+
+        with mock.patch('acos_client.v30.slb.member.Member.get', side_effect=acos_errors.NotFound):
+            self.run_async(lambda: asyncio.gather(*[
+                member.create('pool1', 's%d' % i, 80) for i in range(10)
+            ]))
+
+        auth_calls = [c for c in responses.calls if c.request.url == AUTH_URL]
+        self.assertEqual(len(auth_calls), 1)
+        self.assertEqual(len(responses.calls), 11)
+
+    def test_max_in_flight(self):
+        state = {'active': 0, 'peak': 0}
+        lock = threading.Lock()
+        self.client.client.session.session_id = 'foobar'
+
+        def op():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.02)
+            with lock:
+                state['active'] -= 1
+
+        self.run_async(lambda: asyncio.gather(*[self.client.call(op) for i in range(12)]))
+
+        self.assertEqual(state['peak'], 4)
+
+    def test_shares_one_executor(self):
+        executor = futures.ThreadPoolExecutor(2)
+        a = AsyncClient(HOSTNAME, '30', 'u', 'p', max_in_flight=1, executor=executor)
+        b = AsyncClient(HOSTNAME, '30', 'u', 'p', max_in_flight=1, executor=executor)
+        a.client.session.session_id = b.client.session.session_id = 'foobar'
+        order = []
+
+        def op(name):
+            order.append(name)
+            time.sleep(0.02)
+
+        try:
+            self.run_async(lambda: asyncio.gather(*([a.call(op, 'a') for i in range(3)] + [b.call(op, 'b')])))
+        finally:
+            executor.shutdown()
+
+        # a's queued calls wait on the loop, leaving a worker free for b
+        self.assertEqual(order[:2], ['a', 'b'])
+
+    def test_partition_change_before_call_runs(self):
+        self.client.client.session.session_id = 'foobar'
+
+        def op():
+            t = threading.Thread(target=setattr, args=(self.client.client, 'current_partition', 'p2'))
+            t.start()
+            t.join()
+            return self.client.client.current_partition
+
+        self.assertEqual(self.run_async(lambda: self.client.call(op)), 'shared')
+
+    def test_stuck_devices_leave_workers_for_others(self):
+        executor = futures.ThreadPoolExecutor(3)
+        release = threading.Event()
+        stuck = [AsyncClient('stuck%d' % i, '30', 'u', 'p', executor=executor) for i in range(2)]
+        healthy = AsyncClient(HOSTNAME, '30', 'u', 'p', executor=executor)
+        for c in stuck + [healthy]:
+            c.client.session.session_id = 'foobar'
+
+        def scenario():
+            blocked = [c.call(release.wait, 5) for c in stuck for i in range(5)]
+            served = asyncio.ensure_future(asyncio.wait_for(
+                asyncio.gather(*[healthy.call(lambda: 'ok') for i in range(3)]), 2))
+            served.add_done_callback(lambda f: release.set())
+            return asyncio.gather(served, *blocked)
+
+        try:
+            results = self.run_async(scenario)
+        finally:
+            release.set()
+            executor.shutdown()
+
+        self.assertEqual(results[0], ['ok'] * 3)
+
+    def test_unanswered_call_limits_device_to_one_worker(self):
+        self.client.client.session.session_id = 'foobar'
+        self.assertEqual(self.client._limit(), 1)
+
+        self.run_async(lambda: self.client.call(lambda: None))
+        self.assertEqual(self.client._limit(), 4)
+
+        def op():
+            raise requests_exceptions.ConnectTimeout()
+
+        with self.assertRaises(requests_exceptions.ConnectTimeout):
+            self.run_async(lambda: self.client.call(op))
+        self.assertEqual(self.client._limit(), 1)
+
+    def test_retry_backoff_frees_the_worker(self):
+        executor = futures.ThreadPoolExecutor(1)
+        policy = retry.RetryPolicy()
+        policy.backoff = lambda attempt: 0.2
+        a = AsyncClient(HOSTNAME, '30', 'u', 'p', executor=executor, retry_policy=policy)
+        b = AsyncClient('other', '30', 'u', 'p', executor=executor)
+        a.client.session.session_id = b.client.session.session_id = 'foobar'
+        a.client.http.request = mock.Mock(side_effect=[acos_errors.ConfigManagerNotReady(), 'a'])
+        b.client.http.request = mock.Mock(return_value='b')
+        done = []
+
+        def scenario():
+            fs = [a.slb.server.get('s1'), b.slb.server.get('s1')]
+            for f in fs:
+                f.add_done_callback(lambda f: done.append(f.result()))
+            return asyncio.gather(*fs)
+
+        try:
+            with mock.patch.object(a.client.session, 'reset') as reset:
+                results = self.run_async(scenario)
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(results, ['a', 'b'])
+        # b ran while a was backing off on the loop
+        self.assertEqual(done, ['b', 'a'])
+        self.assertEqual(a.client.http.request.call_count, 2)
+        reset.assert_called_once_with('foobar')
+
+    def test_default_executor_is_the_loops(self):
+        self.assertIsNone(self.client._executor)
+
+    def test_errors_propagate(self):
+        self.client.client.session.session_id = 'foobar'
+
+        def op():
+            raise acos_errors.NotFound()
+
+        with self.assertRaises(acos_errors.NotFound):
+            self.run_async(lambda: self.client.call(op))
+
+    def test_close(self):
+        with mock.patch.object(self.client.client, 'close') as close:
+            self.run_async(self.client.close)
+
+        close.assert_called_once_with()
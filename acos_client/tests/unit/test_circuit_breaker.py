@@ -0,0 +1,150 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import requests
+import responses
+
+from acos_client import circuit_breaker
+from acos_client import errors as acos_errors
+from acos_client.v21 import axapi_http as v21_axapi_http
+from acos_client.v30 import axapi_http
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.breaker = circuit_breaker.CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    def fail(self, n):
+        for i in range(n):
+            self.breaker.before_call()
+            self.breaker.record_failure()
+
+    def test_opens_after_threshold(self):
+        self.fail(2)
+        self.assertEqual(self.breaker.state, circuit_breaker.CLOSED)
+
+        self.fail(1)
+        self.assertEqual(self.breaker.state, circuit_breaker.OPEN)
+        with self.assertRaises(acos_errors.CircuitOpen):
+            self.breaker.before_call()
+
+    def test_success_resets_count(self):
+        self.fail(2)
+        self.breaker.record_success()
+        self.fail(2)
+
+        self.assertEqual(self.breaker.state, circuit_breaker.CLOSED)
+
+    @mock.patch('acos_client.circuit_breaker.time.time')
+    def test_half_open_single_probe(self, now):
+        now.return_value = 100
+        self.fail(3)
+        now.return_value = 111
+
+        self.assertEqual(self.breaker.state, circuit_breaker.HALF_OPEN)
+        self.breaker.before_call()
+        with self.assertRaises(acos_errors.CircuitOpen):
+            self.breaker.before_call()
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, circuit_breaker.CLOSED)
+        self.breaker.before_call()
+
+    @mock.patch('acos_client.circuit_breaker.time.time')
+    def test_failed_probe_reopens(self, now):
+        now.return_value = 100
+        self.fail(3)
+        now.return_value = 111
+
+        self.breaker.before_call()
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, circuit_breaker.OPEN)
+        self.assertEqual(self.breaker.stats(), {'state': 'open', 'failures': 4, 'opened_at': 111})
+
+    @mock.patch('acos_client.circuit_breaker.time.time')
+    def test_released_probe_stays_half_open(self, now):
+        now.return_value = 100
+        self.fail(3)
+        now.return_value = 111
+
+        self.breaker.before_call()
+        self.breaker.release()
+
+        self.assertEqual(self.breaker.state, circuit_breaker.HALF_OPEN)
+        self.assertEqual(self.breaker.failures, 3)
+        self.breaker.before_call()
+
+
+class TestHttpClientCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        breaker = circuit_breaker.CircuitBreaker(failure_threshold=2)
+        self.http = axapi_http.HttpClient('fake_a10', circuit_breaker=breaker)
+        self.url = 'https://fake_a10:443/axapi/v3/system'
+
+    @responses.activate
+    def test_connection_errors_open_circuit(self):
+        responses.add(responses.GET, self.url, body=requests.exceptions.ConnectionError())
+
+        for i in range(2):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                self.http.get('/axapi/v3/system')
+        with self.assertRaises(acos_errors.CircuitOpen):
+            self.http.get('/axapi/v3/system')
+
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(self.http.circuit_breaker.state, circuit_breaker.OPEN)
+
+    @responses.activate
+    def test_axapi_errors_do_not_count(self):
+        responses.add(responses.GET, self.url, json={
+            'response': {'status': 'fail', 'err': {'code': 1023460352, 'msg': 'not found'}}
+        })
+
+        for i in range(3):
+            with self.assertRaises(acos_errors.NotFound):
+                self.http.get('/axapi/v3/system')
+
+        self.assertEqual(self.http.circuit_breaker.state, circuit_breaker.CLOSED)
+
+    def test_open_circuit_builds_no_session(self):
+        for http in (self.http, v21_axapi_http.HttpClient('fake_a10', circuit_breaker=self.http.circuit_breaker)):
+            http.circuit_breaker.opened_at = 1e12
+            with mock.patch.object(http, '_new_session') as new_session:
+                with self.assertRaises(acos_errors.CircuitOpen):
+                    http.get('/axapi/v3/system', max_retries=0)
+            new_session.assert_not_called()
+
+    @responses.activate
+    def test_other_request_errors_do_not_close_circuit(self):
+        responses.add(responses.GET, self.url, body=requests.exceptions.TooManyRedirects())
+        self.http.circuit_breaker.failures = 2
+        self.http.circuit_breaker.opened_at = 1
+
+        with self.assertRaises(requests.exceptions.TooManyRedirects):
+            self.http.get('/axapi/v3/system')
+
+        self.assertEqual(self.http.circuit_breaker.state, circuit_breaker.HALF_OPEN)
+        self.assertEqual(self.http.circuit_breaker.failures, 2)
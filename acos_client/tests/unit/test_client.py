@@ -14,12 +14,17 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import threading
+
 from acos_client import client
+from acos_client import errors as acos_errors
 
 try:
-    import unittest2 as unittest
-except ImportError:
     import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
 
 
 class TestClient(unittest.TestCase):
@@ -51,3 +56,84 @@ class TestClient(unittest.TestCase):
         self.assertEqual(self.client_30.timeout, 4)
         self.assertEqual(self.client_30.http.max_retries, 6)
         self.assertEqual(self.client_30.http.timeout, 4)
+
+    def test_flags_are_booleans(self):
+        c = client.Client('fake-host', '3.0', 'fake-username', 'fake-password', optimistic=1, coalesce_gets=0)
+
+        self.assertIs(c.optimistic, True)
+        self.assertIs(c.coalesce_gets, False)
+        self.assertTrue(c.slb.server._optimistic({}))
+        self.assertFalse(c.slb.server._coalesce())
+
+    def test_close_without_session(self):
+        with mock.patch.object(self.client_30.http, 'close') as http_close:
+            with mock.patch.object(self.client_30.session, 'close') as session_close:
+                self.client_30.close()
+
+        session_close.assert_not_called()
+        http_close.assert_called_once_with()
+
+    def test_close_logs_off_session(self):
+        self.client_30.session.session_id = 'foobar'
+
+        with mock.patch.object(self.client_30.http, 'close') as http_close:
+            with mock.patch.object(self.client_30.session, 'close') as session_close:
+                self.client_30.close()
+
+        session_close.assert_called_once_with()
+        http_close.assert_called_once_with()
+
+    def test_context_manager_closes(self):
+        with mock.patch.object(self.client_30, 'close') as close:
+            with self.client_30 as c:
+                self.assertIs(c, self.client_30)
+
+        close.assert_called_once_with()
+
+    def test_pool_settings_v30(self):
+        c = client.Client('fake-host', '3.0', 'fake-username', 'fake-password',
+                          pool_maxsize=20, pool_block=True)
+
+        self.assertEqual(c.http.pool_maxsize, 20)
+        self.assertTrue(c.http.pool_block)
+
+    def test_partition_scope_is_per_thread(self):
+        seen = []
+        with self.client_30.partition_scope('p1'):
+            t = threading.Thread(target=lambda: seen.append(self.client_30.current_partition))
+            t.start()
+            t.join()
+            self.assertEqual(self.client_30.current_partition, 'p1')
+
+        self.assertEqual(seen, ['shared'])
+        self.assertEqual(self.client_30.current_partition, 'shared')
+
+    def test_partition_scope_nests(self):
+        with self.client_30.partition_scope('p1'):
+            with self.client_30.partition_scope('p2'):
+                self.assertEqual(self.client_30.current_partition, 'p2')
+            self.assertEqual(self.client_30.current_partition, 'p1')
+            # partition.active() inside a scope only moves the scope
+            self.client_30.current_partition = 'p3'
+            self.assertEqual(self.client_30.current_partition, 'p3')
+        self.assertEqual(self.client_30.current_partition, 'shared')
+
+    def test_partition_scope_v21_unsupported(self):
+        with self.assertRaises(acos_errors.ACOSUnsupportedVersion):
+            with self.client_21.partition_scope('p1'):
+                pass
+
+    def test_resource_tree_reused(self):
+        self.assertIs(self.client_30.slb, self.client_30.slb)
+        self.assertIs(self.client_30.slb.service_group.member, self.client_30.slb.service_group.member)
+        self.assertIs(self.client_21.system.partition, self.client_21.system.partition)
+
+    def test_resource_tree_per_client(self):
+        other = client.Client('fake-host', '3.0', 'fake-username', 'fake-password')
+        self.assertIsNot(other.slb.server, self.client_30.slb.server)
+        self.assertIs(other.slb.server.client, other)
+
+    def test_blade_parameters_not_reused(self):
+        # BladeParameters accumulates a payload, so each access starts fresh
+        vrid = self.client_30.vrrpa
+        self.assertIsNot(vrid.blade, vrid.blade)
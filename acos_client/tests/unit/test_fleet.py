@@ -0,0 +1,129 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import time
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+from acos_client import errors as acos_errors
+from acos_client import fleet
+
+
+class TestFleetClient(unittest.TestCase):
+
+    def setUp(self):
+        self.clients = dict(('lb%d' % i, mock.MagicMock()) for i in range(4))
+        self.fleet = fleet.FleetClient(self.clients)
+
+    def test_dotted_operation(self):
+        for name, c in self.clients.items():
+            c.system.information.return_value = {'name': name}
+
+        results = self.fleet.run_all('system.information')
+
+        self.assertEqual(sorted(results), sorted(self.clients))
+        for name, r in results.items():
+            self.assertEqual(r.value, {'name': name})
+            self.assertIsNone(r.exception)
+
+    def test_callable_operation_with_args(self):
+        results = self.fleet.run_all(lambda c, x, y=None: (x, y), 1, y=2)
+
+        self.assertEqual(set(r.value for r in results.values()), set([(1, 2)]))
+
+    def test_subset_of_devices(self):
+        results = list(self.fleet.run('system.information', devices=['lb1', 'lb3']))
+
+        self.assertEqual(sorted(r.device for r in results), ['lb1', 'lb3'])
+        self.clients['lb0'].system.information.assert_not_called()
+
+    def test_failure_isolated(self):
+        self.clients['lb2'].system.action.write_memory.side_effect = acos_errors.ConfigManagerNotReady()
+
+        results = self.fleet.run_all('system.action.write_memory')
+
+        self.assertIsInstance(results['lb2'].exception, acos_errors.ConfigManagerNotReady)
+        self.assertEqual([d for d, r in results.items() if r.exception], ['lb2'])
+
+    def test_results_stream_as_completed(self):
+        delays = {'lb0': 0.2, 'lb1': 0.0, 'lb2': 0.1, 'lb3': 0.05}
+
+        def op(c, device):
+            time.sleep(delays[device])
+            return device
+
+        order = [r.device for r in self.fleet.run(lambda c: op(c, self._device(c)))]
+
+        self.assertEqual(order, ['lb1', 'lb3', 'lb2', 'lb0'])
+
+    def _device(self, client):
+        return [d for d, c in self.clients.items() if c is client][0]
+
+    def test_concurrent_not_serial(self):
+        start = time.time()
+        list(self.fleet.run(lambda c: time.sleep(0.1)))
+
+        self.assertLess(time.time() - start, 0.3)
+
+    def test_stopping_early_cancels_devices_not_started(self):
+        clients = dict(('lb%d' % i, mock.MagicMock()) for i in range(8))
+        ran = []
+
+        def op(c):
+            ran.append(c)
+            time.sleep(0.05)
+
+        for result in fleet.FleetClient(clients, max_workers=2).run(op):
+            break
+        time.sleep(0.2)
+
+        # Two were running when the first result came back, two more may
+        # have started before the loop ended; the rest never run
+        self.assertLessEqual(len(ran), 4)
+
+    def test_per_device_timeout(self):
+        slow = self.clients['lb0']
+
+        def op(c):
+            if c is slow:
+                time.sleep(0.5)
+            return 'ok'
+
+        start = time.time()
+        results = self.fleet.run_all(op, timeout=0.1)
+
+        self.assertLess(time.time() - start, 0.4)
+        self.assertIsInstance(results['lb0'].exception, acos_errors.DeviceTimeout)
+        self.assertEqual(results['lb1'].value, 'ok')
+
+    def test_close(self):
+        self.clients['lb0'].close.side_effect = Exception()
+
+        self.fleet.close()
+
+        for c in self.clients.values():
+            c.close.assert_called_once_with()
+
+    def test_add_remove(self):
+        c = mock.MagicMock()
+        self.fleet.add('lb9', c)
+        self.assertEqual(len(self.fleet), 5)
+        self.assertIs(self.fleet.remove('lb9'), c)
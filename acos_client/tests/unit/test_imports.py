@@ -0,0 +1,82 @@
+# Copyright 2014,  Doug Wiegley,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import subprocess
+import sys
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+def imported_modules(code):
+    """Return the modules `python -X importtime -c code` imports."""
+    p = subprocess.Popen([sys.executable, '-X', 'importtime', '-c', code],
+                         stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = p.communicate()
+    if p.returncode != 0:
+        raise AssertionError(err.decode('utf-8'))
+    modules = set()
+    for line in err.decode('utf-8').splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.rsplit('|', 1)[1].strip())
+    return modules
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime needs Python 3.7")
+class TestImportTime(unittest.TestCase):
+
+    def assertNotImported(self, modules, prefixes):
+        found = sorted(m for m in modules for p in prefixes if m == p or m.startswith(p + '.'))
+        self.assertEqual(found, [])
+
+    def test_import_is_light(self):
+        modules = imported_modules('import acos_client')
+
+        self.assertIn('acos_client.client', modules)
+        self.assertNotImported(modules, [
+            'acos_client.v21', 'acos_client.v30', 'requests', 'uhashring', 'asyncio', 'concurrent'])
+
+    def test_client_imports_only_its_version(self):
+        modules = imported_modules(
+            'import acos_client; acos_client.Client("h", "30", "u", "p").slb.server')
+
+        self.assertIn('acos_client.v30.slb.server', modules)
+        self.assertNotImported(modules, ['acos_client.v21', 'acos_client.v30.vrrpa', 'uhashring', 'asyncio'])
+
+    def test_axapi_args_without_v21(self):
+        # The unit suite imports v2.1 itself, which would hide a v3 call
+        # reaching into acos_client.v21, so this runs in a fresh process.
+        modules = imported_modules('''
+import json
+import mock
+import acos_client
+c = acos_client.Client("h", "30", "u", "p")
+c.http._session = mock.Mock()
+c.http._session.post.return_value.content = b'{}'
+c.http.request("POST", "/axapi/v3/slb/server", {"server": {"name": "s"}}, axapi_args={"a_b": 1})
+payload = c.http._session.post.call_args[1]["data"]
+assert json.loads(payload)["a-b"] == 1, payload
+''')
+
+        self.assertNotImported(modules, ['acos_client.v21'])
+
+    def test_lazy_attributes(self):
+        modules = imported_modules('import acos_client; acos_client.Hash; acos_client.AsyncClient')
+
+        self.assertIn('uhashring', modules)
+        self.assertIn('asyncio', modules)
@@ -0,0 +1,78 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+from acos_client import jsoncodec
+
+RESPONSE = {'service-group': {'name': 'pool1', 'member-list': [{'name': 's1', 'port': 80}], 'url': '/a/b'}}
+
+
+def installed():
+    for name in jsoncodec.PREFERENCE:
+        try:
+            yield jsoncodec.get(name)
+        except ImportError:
+            pass
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_round_trip(self):
+        for codec in installed():
+            encoded = codec.dumps(RESPONSE)
+            if not isinstance(encoded, bytes):
+                encoded = encoded.encode('utf-8')
+            self.assertEqual(codec.loads(encoded), RESPONSE, codec.name)
+
+    def test_invalid_raises_value_error(self):
+        for codec in installed():
+            for body in (b'', b'<html>'):
+                with self.assertRaises(ValueError):
+                    codec.loads(body)
+
+    def test_default_prefers_installed(self):
+        with mock.patch.object(jsoncodec, 'PREFERENCE', ('not_a_json_lib', 'json')):
+            with mock.patch.dict(jsoncodec._FACTORIES, {'not_a_json_lib': None}):
+                self.assertEqual(jsoncodec.default().name, 'json')
+
+    def test_unknown(self):
+        with self.assertRaises(ValueError):
+            jsoncodec.get('yaml')
+
+    @responses.activate
+    def test_client_uses_codec(self):
+        loads = mock.Mock(side_effect=jsoncodec.get('json').loads)
+        codec = jsoncodec.Codec('test', jsoncodec.get('json').dumps, loads)
+        responses.add(responses.GET, 'https://fake_a10:443/axapi/v3/slb/service-group/pool1', json=RESPONSE)
+
+        c = client.Client('fake_a10', '30', 'admin', 'a10', json_codec=codec)
+        c.session.session_id = 'foobar'
+
+        self.assertEqual(c.slb.service_group.get('pool1'), RESPONSE)
+        self.assertIsInstance(loads.call_args[0][0], bytes)
+
+    def test_client_codec_by_name(self):
+        c = client.Client('fake_a10', '30', 'admin', 'a10', json_codec='json')
+        self.assertEqual(c.http.codec.name, 'json')
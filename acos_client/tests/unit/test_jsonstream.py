@@ -0,0 +1,102 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import json
+
+from acos_client import jsonstream
+
+BODY = {
+    'slb': {
+        'server-list': [
+            {'name': 's1', 'host': '10.0.0.1', 'port-list': [{'port-number': 80}]},
+            {'name': 'sé中', 'weight': 1.5e3, 'conn-limit': 12345678},
+        ],
+        'misc': [1, {'a-list': [5]}, 'x]y,"z'],
+        'service-group-list': [],
+        'count': 987654321,
+    },
+    'virtual-server-list': [{'name': 'vip1', 'enable': True, 'template': None}],
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterLists(unittest.TestCase):
+
+    def expected(self):
+        return list(jsonstream.lists_in(BODY))
+
+    def test_lists_in(self):
+        keys = [k for k, item in self.expected()]
+        self.assertEqual(keys, ['server-list', 'server-list', 'a-list', 'virtual-server-list'])
+
+    def test_any_chunk_size(self):
+        for text in (json.dumps(BODY), json.dumps(BODY, indent=4, ensure_ascii=False)):
+            data = text.encode('utf-8')
+            for size in (1, 2, 3, 5, 7, 64, len(data)):
+                self.assertEqual(list(jsonstream.iter_lists(chunked(data, size))), self.expected())
+
+    def test_numbers_split_at_every_offset(self):
+        data = b'{"stats": {"rate": -12.5e+3, "n": 1e5}, "x-list": [12.25, 3, -0.5E-2, {"v": 100.75}]}'
+        expected = [('x-list', 12.25), ('x-list', 3), ('x-list', -0.5E-2), ('x-list', {'v': 100.75})]
+        for i in range(1, len(data)):
+            self.assertEqual(list(jsonstream.iter_lists([data[:i], data[i:]])), expected, i)
+
+    def test_items_are_decoded_lazily(self):
+        data = json.dumps({'server-list': [{'name': 's%d' % i} for i in range(100)]}).encode()
+        chunks = iter(chunked(data, 16))
+        items = jsonstream.iter_lists(chunks)
+        self.assertEqual(next(items), ('server-list', {'name': 's0'}))
+        # Most of the body is still unread
+        self.assertGreater(len(list(chunks)), 50)
+
+    def test_no_lists(self):
+        self.assertEqual(list(jsonstream.iter_lists([b'{"a": {"b": [1, 2]}}'])), [])
+
+    def test_invalid(self):
+        for data in (b'', b'{"a-list": [1, 2', b'{"a":', b'{"a-list": [1 2]}', b'{} {}', b'{1: 2}'):
+            with self.assertRaises(ValueError):
+                list(jsonstream.iter_lists(chunked(data, 3)))
+
+
+class TestListStream(unittest.TestCase):
+
+    def test_closes_response(self):
+        response = mock.Mock()
+        response.iter_content.return_value = [b'{"server-list": [1, 2]}']
+        stream = jsonstream.ListStream(response, chunk_size=10)
+
+        self.assertEqual(list(stream), [('server-list', 1), ('server-list', 2)])
+        response.iter_content.assert_called_once_with(10)
+        response.close.assert_called_once_with()
+
+    def test_closes_abandoned_response(self):
+        response = mock.Mock()
+        response.iter_content.return_value = [b'{"server-list": [1, 2]}']
+        items = iter(jsonstream.ListStream(response))
+
+        next(items)
+        items.close()
+        response.close.assert_called_once_with()
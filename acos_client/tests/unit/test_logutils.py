@@ -14,6 +14,8 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import json
+
 import six
 
 try:
@@ -168,3 +170,73 @@ class FakeObject(object):
     def __init__(self, *args, **kwargs):
         for k, v in six.iteritems(kwargs):
             setattr(self, k, v)
+
+
+class TestDump(unittest.TestCase):
+
+    def test_redacted_json(self):
+        dump = target.Dump({'credentials': {'username': 'admin', 'password': 'secret'}, 'a': 1})
+        self.assertEqual(
+            json.loads(str(dump)),
+            {'credentials': {'username': target.REPLACEMENT, 'password': target.REPLACEMENT}, 'a': 1})
+
+    @mock.patch('acos_client.logutils.clean')
+    def test_lazy(self, clean):
+        target.Dump({'a': 1})
+        clean.assert_not_called()
+
+    @mock.patch.object(target, 'MAX_DUMP_LENGTH', 10)
+    def test_truncated(self):
+        text = str(target.Dump({'name': 'x' * 100}))
+        self.assertTrue(text.startswith('{"name": "'))
+        self.assertTrue(text.endswith('... (102 more characters)'))
+
+    def test_not_json(self):
+        self.assertEqual(str(target.Dump(object)), repr(object))
+
+
+class TestRedact(unittest.TestCase):
+
+    def test_nothing_to_mask_is_not_copied(self):
+        data = {'a': [{'b': 1}, (2, 3)], 'c': 'd'}
+        self.assertIs(target.redact(data), data)
+
+    def test_only_path_to_secret_copied(self):
+        untouched = [{'name': 's1'}]
+        data = {'servers': untouched, 'credentials': {'username': 'admin', 'password': 'secret'}}
+
+        actual = target.redact(data)
+
+        self.assertEqual(actual['credentials'], {'username': target.REPLACEMENT, 'password': target.REPLACEMENT})
+        self.assertIs(actual['servers'], untouched)
+        self.assertEqual(data['credentials']['password'], 'secret')
+
+    def test_lists_and_tuples(self):
+        data = [1, ({'passphrase': 'x'},)]
+        self.assertEqual(target.redact(data), [1, ({'passphrase': target.REPLACEMENT},)])
+
+    def test_whole_value_masked(self):
+        self.assertEqual(target.redact({'password': {'a': 1}}), {'password': target.REPLACEMENT})
+
+    def test_custom_fields(self):
+        data = {'key': 'k1', 'password': 'p'}
+        self.assertEqual(target.redact(data, fields=['key']), {'key': target.REPLACEMENT, 'password': 'p'})
+
+    def test_matches_clean(self):
+        data = {'a': [{'username': 'u', 'b': (1, {'password': 'p'})}], 'Authorization': 'A10 sig'}
+        self.assertEqual(target.redact(data), target.clean(data))
+
+    def test_scalars(self):
+        for value in (None, 1, 3.7, 'text'):
+            self.assertIs(target.redact(value), value)
+
+
+class TestDumpFields(unittest.TestCase):
+
+    def test_custom_fields(self):
+        dump = target.Dump({'key': 'k1', 'cert': 'c1'}, fields=['key'])
+        self.assertEqual(json.loads(str(dump)), {'key': target.REPLACEMENT, 'cert': 'c1'})
+
+    def test_authorization_masked(self):
+        dump = target.Dump({'Authorization': 'A10 sig'})
+        self.assertNotIn('sig', str(dump))
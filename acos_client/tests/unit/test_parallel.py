@@ -0,0 +1,246 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import time
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+from acos_client import errors as acos_errors
+
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+AUTH_URL = '{}/auth'.format(BASE_URL)
+MEMBER_URL = '{}/slb/service-group/pool1/member/'.format(BASE_URL)
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password')
+
+    def test_results_in_order(self):
+        self.client.session.session_id = 'foobar'
+
+        def op(i):
+            time.sleep(0.001 * (5 - i))
+            if i == 2:
+                raise acos_errors.NotFound()
+            return i
+
+        results = self.client.parallel(max_in_flight=5).map(op, [(i,) for i in range(5)]).run()
+
+        self.assertEqual([r.value for r in results], [0, 1, None, 3, 4])
+        self.assertIsInstance(results[2].exception, acos_errors.NotFound)
+        self.assertEqual([r.exception for r in results if r.value is not None], [None] * 4)
+
+    def test_max_in_flight(self):
+        self.client.session.session_id = 'foobar'
+        state = {'active': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def op():
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+
+        batch = self.client.parallel(max_in_flight=3)
+        for i in range(12):
+            batch.add(op)
+        batch.run()
+
+        self.assertEqual(state['peak'], 3)
+
+    def test_default_max_in_flight_is_pool_size(self):
+        self.assertEqual(self.client.parallel().max_in_flight, self.client.http.pool_maxsize)
+
+    def test_invalid_max_in_flight(self):
+        with self.assertRaises(ValueError):
+            self.client.parallel(max_in_flight=0)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.client.parallel().run(), [])
+
+    @responses.activate
+    def test_member_create_authenticates_once(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.POST, MEMBER_URL, json={})
+        member = self.client.slb.service_group.member
+        batch = self.client.parallel(max_in_flight=4)
+        for i in range(8):
+            batch.add(member.create, 'pool1', 's%d' % i, 80)
+
+        with mock.patch('acos_client.v30.slb.member.Member.get', side_effect=acos_errors.NotFound):
+            results = batch.run()
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(len(responses.calls), 9)
+        self.assertEqual(len([c for c in responses.calls if c.request.url == AUTH_URL]), 1)
+
+    def test_calls_run_in_callers_partition(self):
+        self.client.session.session_id = 'foobar'
+        batch = self.client.parallel(max_in_flight=3)
+        for i in range(3):
+            batch.add(lambda: self.client.current_partition)
+
+        with self.client.partition_scope('p1'):
+            results = batch.run()
+
+        self.assertEqual([r.value for r in results], ['p1'] * 3)
+        self.assertEqual(self.client.current_partition, 'shared')
+
+    def test_partition_change_during_run(self):
+        self.client.session.session_id = 'foobar'
+
+        def op():
+            # Another thread moves the client-wide partition mid-call
+            t = threading.Thread(target=setattr, args=(self.client, 'current_partition', 'p2'))
+            t.start()
+            t.join()
+            return self.client.current_partition
+
+        results = self.client.parallel(max_in_flight=1).add(op).run()
+
+        self.assertEqual(results[0].value, 'shared')
+        self.assertEqual(self.client.current_partition, 'p2')
+
+    def test_v21_calls_run_unscoped(self):
+        c = client.Client(HOSTNAME, '21', 'fake_username', 'fake_password')
+        c.session.session_id = 'foobar'
+
+        results = c.parallel().add(lambda: c.current_partition).run()
+
+        self.assertEqual(results[0].value, 'shared')
+
+
+class TestGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password')
+        self.client.session.session_id = 'foobar'
+        self.log = []
+        self.lock = threading.Lock()
+
+    def op(self, name, fail=False, delay=0.005):
+        def fn():
+            with self.lock:
+                self.log.append(('start', name))
+            time.sleep(delay)
+            with self.lock:
+                self.log.append(('end', name))
+            if fail:
+                raise acos_errors.NotFound()
+            return name
+        return fn
+
+    def index(self, event, name):
+        return self.log.index((event, name))
+
+    def test_dependencies_respected(self):
+        graph = self.client.graph(max_in_flight=4)
+        hm = graph.add(self.op('hm'))
+        servers = [graph.add(self.op('s%d' % i)).after(hm) for i in range(3)]
+        pool = graph.add(self.op('pool'))
+        members = [graph.add(self.op('m%d' % i)).after(pool, s) for i, s in enumerate(servers)]
+        vip = graph.add(self.op('vip'))
+        graph.add(self.op('vport')).after(vip, *members)
+
+        results = graph.run()
+
+        self.assertEqual([r.value for r in results],
+                         ['hm', 's0', 's1', 's2', 'pool', 'm0', 'm1', 'm2', 'vip', 'vport'])
+        for i in range(3):
+            self.assertLess(self.index('end', 'hm'), self.index('start', 's%d' % i))
+            self.assertLess(self.index('end', 's%d' % i), self.index('start', 'm%d' % i))
+            self.assertLess(self.index('end', 'pool'), self.index('start', 'm%d' % i))
+            self.assertLess(self.index('end', 'm%d' % i), self.index('start', 'vport'))
+        # Independent branches overlap
+        self.assertLess(self.index('start', 'pool'), self.index('end', 'hm'))
+
+    def test_max_in_flight(self):
+        state = {'active': 0, 'peak': 0}
+
+        def op():
+            with self.lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with self.lock:
+                state['active'] -= 1
+
+        graph = self.client.graph(max_in_flight=3)
+        roots = [graph.add(op) for i in range(6)]
+        for i in range(6):
+            graph.add(op).after(roots[i])
+        graph.run()
+
+        self.assertEqual(state['peak'], 3)
+
+    def test_failure_skips_dependents_only(self):
+        graph = self.client.graph(max_in_flight=2)
+        bad = graph.add(self.op('bad', fail=True))
+        child = graph.add(self.op('child')).after(bad)
+        grandchild = graph.add(self.op('grandchild')).after(child)
+        other = graph.add(self.op('other'))
+        graph.add(self.op('joined')).after(other, bad)
+
+        results = graph.run()
+
+        self.assertIsInstance(results[bad.index].exception, acos_errors.NotFound)
+        for task in (child, grandchild):
+            self.assertIsInstance(results[task.index].exception, acos_errors.DependencyFailed)
+            self.assertIsInstance(results[task.index].exception.cause, acos_errors.NotFound)
+        self.assertEqual(results[other.index].value, 'other')
+        self.assertIsInstance(results[4].exception, acos_errors.DependencyFailed)
+        self.assertEqual(sorted(name for event, name in self.log if event == 'start'), ['bad', 'other'])
+
+    def test_longest_chain_first(self):
+        graph = self.client.graph(max_in_flight=1)
+        graph.add(self.op('short', delay=0))
+        head = graph.add(self.op('head', delay=0))
+        graph.add(self.op('tail', delay=0)).after(head)
+
+        graph.run()
+
+        self.assertEqual([name for event, name in self.log if event == 'start'], ['head', 'short', 'tail'])
+
+    def test_cycle(self):
+        graph = self.client.graph()
+        a = graph.add(self.op('a'))
+        b = graph.add(self.op('b')).after(a)
+        a.after(b)
+        self.assertRaises(ValueError, graph.run)
+
+    def test_foreign_task(self):
+        other = self.client.graph().add(self.op('a'))
+        graph = self.client.graph()
+        graph.add(self.op('b')).after(other)
+        self.assertRaises(ValueError, graph.run)
+
+    def test_empty(self):
+        self.assertEqual(self.client.graph().run(), [])
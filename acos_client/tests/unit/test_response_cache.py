@@ -0,0 +1,189 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+from acos_client import errors as acos_errors
+from acos_client import response_cache
+
+DEVICE = 'https://fake_a10:443'
+BASE_URL = DEVICE + '/axapi/v3'
+AUTH_URL = BASE_URL + '/auth'
+SG_URL = BASE_URL + '/slb/service-group/pool1'
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = response_cache.ResponseCache(ttl=10, max_entries=2)
+        self.get = mock.Mock(side_effect=lambda: {'n': self.get.call_count})
+
+    def fetch(self, url, partition='shared', params=None):
+        return self.cache.fetch(DEVICE, partition, url, params, self.get)
+
+    def test_hit(self):
+        self.assertEqual(self.fetch('/a'), {'n': 1})
+        self.assertEqual(self.fetch('/a'), {'n': 1})
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1})
+
+    def test_key(self):
+        self.fetch('/a')
+        self.assertEqual(self.fetch('/a', partition='p1'), {'n': 2})
+        self.assertEqual(self.fetch('/a', params={'x': 1}), {'n': 3})
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_returns_copies(self):
+        self.fetch('/a')['n'] = 'changed'
+        self.fetch('/a')['n'] = 'changed'
+        self.assertEqual(self.fetch('/a'), {'n': 1})
+
+    @mock.patch('acos_client.response_cache.time.time')
+    def test_expiry(self, now):
+        now.return_value = 1000
+        self.fetch('/a')
+        now.return_value = 1011
+        self.assertEqual(self.fetch('/a'), {'n': 2})
+
+    def test_ttls(self):
+        self.cache.ttls = {'/slb/': 60, '/slb/service-group/stats': 0}
+        self.assertEqual(self.cache.ttl_for('/slb/server/s1'), 60)
+        self.assertEqual(self.cache.ttl_for('/slb/service-group/stats'), 0)
+        self.assertEqual(self.cache.ttl_for('/partition-all/oper'), 10)
+        self.fetch('/slb/service-group/stats')
+        self.assertEqual(self.fetch('/slb/service-group/stats'), {'n': 2})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru(self):
+        self.fetch('/a')
+        self.fetch('/b')
+        self.fetch('/a')
+        self.fetch('/c')
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.fetch('/a'), {'n': 1})
+        self.assertEqual(self.fetch('/b'), {'n': 4})
+
+    def test_errors_not_cached(self):
+        self.get.side_effect = acos_errors.NotFound
+        for i in range(2):
+            self.assertRaises(acos_errors.NotFound, self.fetch, '/a')
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidate(self):
+        self.cache.max_entries = 10
+        for url in ('/slb/', '/slb/service-group/', '/slb/service-group/pool1/oper',
+                    '/slb/service-group/pool2', '/slb/server/'):
+            self.fetch(url)
+        self.cache.invalidate('https://other:443', '/slb/service-group/pool1')
+        self.assertEqual(len(self.cache), 5)
+
+        self.cache.invalidate(DEVICE, '/slb/service-group/pool1')
+        self.assertEqual(sorted(k[2] for k in self.cache._entries),
+                         ['/slb/server/', '/slb/service-group/pool2'])
+
+    def test_write_during_get_not_stored(self):
+        def get():
+            self.cache.invalidate(DEVICE, '/a')
+            return {}
+        self.cache.fetch(DEVICE, 'shared', '/a', None, get)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_cache_for(self):
+        self.assertIsNone(response_cache.cache_for(mock.Mock()))
+        self.assertIs(response_cache.cache_for(mock.Mock(response_cache=self.cache)), self.cache)
+
+
+class TestClientResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client('fake_a10', '30', 'admin', 'a10', response_cache=True)
+
+    def gets(self):
+        return len([c for c in responses.calls if c.request.method == 'GET'])
+
+    @responses.activate
+    def test_get_is_cached(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, SG_URL, json={'service-group': {'name': 'pool1'}})
+
+        self.client.slb.service_group.get('pool1')
+        self.assertEqual(self.client.slb.service_group.get('pool1'), {'service-group': {'name': 'pool1'}})
+        self.assertEqual(self.gets(), 1)
+        self.assertEqual(self.client.response_cache.hits, 1)
+
+    @responses.activate
+    def test_write_invalidates(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, SG_URL, json={'service-group': {'name': 'pool1'}})
+        responses.add(responses.DELETE, SG_URL, json={})
+
+        self.client.slb.service_group.get('pool1')
+        self.client.slb.service_group.delete('pool1')
+        self.client.slb.service_group.get('pool1')
+        self.assertEqual(self.gets(), 2)
+
+    @responses.activate
+    def test_stream_bypasses_cache(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, BASE_URL + '/slb/service-group/', json={'service-group-list': []})
+
+        list(self.client.slb.service_group.iter_all())
+        list(self.client.slb.service_group.iter_all())
+        self.assertEqual(self.gets(), 2)
+        self.assertEqual(len(self.client.response_cache), 0)
+
+    @responses.activate
+    def test_get_without_cache(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, SG_URL, json={'service-group': {'name': 'pool1'}})
+
+        self.client.slb.service_group.get('pool1')
+        self.client.slb.service_group._get('/slb/service-group/pool1', cache=False)
+        self.assertEqual(self.gets(), 2)
+
+    @responses.activate
+    def test_snapshot_and_reconcile_read_the_device(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, BASE_URL + '/slb/', json={'slb': {}})
+        responses.add(responses.GET, BASE_URL + '/slb/server/', json={'server-list': []})
+        responses.add(responses.GET, BASE_URL + '/health/monitor/', json={'monitor-list': []})
+
+        snapshot = self.client.slb.snapshot()
+        self.client.slb.snapshot()
+        snapshot.refresh('server')
+        snapshot.refresh('server')
+        self.client.slb.reconciler.plan({'monitor-list': []})
+        self.client.slb.reconciler.plan({'monitor-list': []})
+
+        self.assertEqual(self.gets(), 8)
+        self.assertEqual(len(self.client.response_cache), 0)
+
+    def test_v21_unsupported(self):
+        self.assertRaises(acos_errors.ACOSUnsupportedVersion, client.Client,
+                          'fake_a10', '21', 'admin', 'a10', response_cache=True)
+        # An empty cache is falsy but still asks for caching
+        self.assertRaises(acos_errors.ACOSUnsupportedVersion, client.Client,
+                          'fake_a10', '21', 'admin', 'a10', response_cache=response_cache.ResponseCache())
+        for off in (None, False):
+            c = client.Client('fake_a10', '21', 'admin', 'a10', response_cache=off)
+            self.assertIsNone(response_cache.cache_for(c))
@@ -0,0 +1,178 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import time
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+from acos_client import errors as acos_errors
+from acos_client import retry
+from acos_client.v21 import base as v21_base
+from acos_client.v30 import base as v30_base
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_withdraw_until_empty(self):
+        budget = retry.RetryBudget(capacity=2, ratio=0.5)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_deposit_refills_to_capacity(self):
+        budget = retry.RetryBudget(capacity=2, ratio=0.5)
+        budget.withdraw()
+        budget.withdraw()
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+        for i in range(10):
+            budget.deposit()
+        self.assertEqual(budget.tokens, 2)
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_full_jitter_bounds(self):
+        policy = retry.RetryPolicy(base_delay=1, max_delay=5)
+
+        for attempt in range(8):
+            delay = policy.backoff(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** attempt))
+
+    def test_deadline(self):
+        policy = retry.RetryPolicy(base_delay=10, max_delay=10, deadline=1)
+
+        with mock.patch('random.uniform', return_value=10):
+            self.assertIsNone(policy.next_delay(0, time.time()))
+
+    def test_budget_per_device(self):
+        policy = retry.RetryPolicy()
+
+        self.assertIs(policy.budget('a'), policy.budget('a'))
+        self.assertIsNot(policy.budget('a'), policy.budget('b'))
+
+    def test_policy_for(self):
+        client = mock.MagicMock()
+        self.assertIs(retry.policy_for(client), retry.DEFAULT_POLICY)
+
+        client.retry_policy = retry.RetryPolicy()
+        self.assertIs(retry.policy_for(client), client.retry_policy)
+
+
+@mock.patch('acos_client.retry.time.sleep')
+class TestBaseV30Retry(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.MagicMock()
+        self.client.retry_policy = retry.RetryPolicy(base_delay=0.01, deadline=60)
+        self.base = v30_base.BaseV30(self.client)
+
+    def test_retries_until_success(self, sleep):
+        self.client.http.request.side_effect = [acos_errors.ConfigManagerNotReady()] * 3 + ['ok']
+
+        self.assertEqual(self.base._get('/system'), 'ok')
+        self.assertEqual(sleep.call_count, 3)
+        session = self.client.session.acquire.return_value
+        self.assertEqual(session.reset.call_count, 3)
+
+    def test_retry_limit(self, sleep):
+        self.client.http.request.side_effect = acos_errors.InvalidSessionID()
+
+        with self.assertRaises(acos_errors.InvalidSessionID):
+            self.base._get('/system')
+
+        self.assertEqual(self.client.http.request.call_count, 6)
+
+    def test_budget_exhausted_fails_fast(self, sleep):
+        self.client.retry_policy = retry.RetryPolicy(budget_capacity=2)
+        self.client.http.request.side_effect = acos_errors.ConfigManagerNotReady()
+
+        with self.assertRaises(acos_errors.ConfigManagerNotReady):
+            self.base._get('/system')
+        with self.assertRaises(acos_errors.ConfigManagerNotReady):
+            self.base._get('/system')
+
+        self.assertEqual(self.client.http.request.call_count, 4)
+
+    def test_deadline_stops_retries(self, sleep):
+        self.client.retry_policy = retry.RetryPolicy(base_delay=100, max_delay=100, deadline=1)
+        self.client.http.request.side_effect = acos_errors.ConfigManagerNotReady()
+
+        with mock.patch('random.uniform', return_value=50):
+            with self.assertRaises(acos_errors.ConfigManagerNotReady):
+                self.base._get('/system')
+
+        sleep.assert_not_called()
+
+    def test_other_errors_not_retried(self, sleep):
+        self.client.http.request.side_effect = acos_errors.NotFound()
+
+        with self.assertRaises(acos_errors.NotFound):
+            self.base._get('/system')
+
+        self.assertEqual(self.client.http.request.call_count, 1)
+
+    def test_deferred_retry_raises_instead_of_sleeping(self, sleep):
+        self.client.http.request.side_effect = [acos_errors.ConfigManagerNotReady()] * 2 + ['ok']
+
+        with retry.deferred():
+            with self.assertRaises(retry.RetryLater) as cm:
+                self.base._get('/system')
+        sleep.assert_not_called()
+        self.assertEqual(cm.exception.attempt, 1)
+
+        # Running again carries on from the attempt it stopped at
+        with retry.deferred(cm.exception.attempt, cm.exception.started):
+            with self.assertRaises(retry.RetryLater) as cm:
+                self.base._get('/system')
+        self.assertEqual(cm.exception.attempt, 2)
+
+        with retry.deferred(cm.exception.attempt, cm.exception.started):
+            self.assertEqual(self.base._get('/system'), 'ok')
+        session = self.client.session.acquire.return_value
+        self.assertEqual(session.reset.call_count, 2)
+
+
+@mock.patch('acos_client.retry.time.sleep')
+class TestBaseV21Retry(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.MagicMock()
+        self.client.retry_policy = retry.RetryPolicy(base_delay=0.01)
+        self.base = v21_base.BaseV21(self.client)
+
+    def test_memory_fault_retried_without_session_reset(self, sleep):
+        self.client.http.request.side_effect = [acos_errors.MemoryFault(), 'ok']
+
+        self.assertEqual(self.base._get('slb.server.getAll'), 'ok')
+        self.client.session.close.assert_not_called()
+
+    def test_invalid_session_resets_session(self, sleep):
+        self.client.http.request.side_effect = [acos_errors.InvalidSessionID(), 'ok']
+
+        self.assertEqual(self.base._get('slb.server.getAll'), 'ok')
+        self.client.session.reset.assert_called_once_with()
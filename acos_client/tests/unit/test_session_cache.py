@@ -0,0 +1,124 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import os
+import shutil
+import stat
+import tempfile
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+from acos_client import session_cache
+
+KEY = session_cache.cache_key('https://fake_a10:443', 'admin', 'a10', 'shared')
+
+
+class TestSessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = session_cache.SessionCache(idle_timeout=60, max_idle=2)
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.lease(KEY))
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_release_then_lease(self):
+        self.assertTrue(self.cache.release(KEY, 'sid1'))
+        self.assertEqual(self.cache.lease(KEY), 'sid1')
+        self.assertIsNone(self.cache.lease(KEY))
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'idle': 0, 'leased': 1})
+
+    def test_key_includes_credentials_and_partition(self):
+        self.cache.release(KEY, 'sid1')
+        self.assertIsNone(self.cache.lease(
+            session_cache.cache_key('https://fake_a10:443', 'admin', 'wrong', 'shared')))
+        self.assertIsNone(self.cache.lease(
+            session_cache.cache_key('https://fake_a10:443', 'admin', 'a10', 'p1')))
+        self.assertEqual(self.cache.lease(KEY), 'sid1')
+
+    def test_full(self):
+        self.assertTrue(self.cache.release(KEY, 'sid1'))
+        self.assertTrue(self.cache.release(KEY, 'sid2'))
+        self.assertFalse(self.cache.release(KEY, 'sid3'))
+        self.assertEqual(len(self.cache), 2)
+
+    @mock.patch('acos_client.session_cache.time.time')
+    def test_idle_expiry(self, now):
+        now.return_value = 1000
+        self.cache.release(KEY, 'sid1')
+        now.return_value = 1061
+        self.assertIsNone(self.cache.lease(KEY))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_discard(self):
+        self.cache.release(KEY, 'sid1')
+        self.cache.lease(KEY)
+        self.cache.discard('sid1')
+        self.assertEqual(self.cache.stats()['leased'], 0)
+
+    def test_cache_for(self):
+        self.assertIsNone(session_cache.cache_for(mock.Mock()))
+        self.assertIs(session_cache.cache_for(mock.Mock(session_cache=self.cache)), self.cache)
+
+
+class TestFileSessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, 'sessions.json')
+
+    def new_cache(self):
+        return session_cache.FileSessionCache(self.path, idle_timeout=60, max_idle=2)
+
+    def test_shared_between_instances(self):
+        self.new_cache().release(KEY, 'sid1')
+        self.assertEqual(self.new_cache().lease(KEY), 'sid1')
+        self.assertIsNone(self.new_cache().lease(KEY))
+
+    def test_permissions(self):
+        self.new_cache().release(KEY, 'sid1')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_no_credentials_on_disk(self):
+        self.new_cache().release(KEY, 'sid1')
+        with open(self.path) as f:
+            data = f.read()
+        self.assertIn('sid1', data)
+        self.assertNotIn('admin', data)
+        self.assertNotIn('fake_a10', data)
+
+    @mock.patch('acos_client.session_cache.time.time')
+    def test_expired_pruned(self, now):
+        now.return_value = 1000
+        self.new_cache().release(KEY, 'sid1')
+        now.return_value = 1061
+        self.assertEqual(len(self.new_cache()), 0)
+        with open(self.path) as f:
+            self.assertNotIn('sid1', f.read())
+
+    def test_corrupt_file(self):
+        with open(self.path, 'w') as f:
+            f.write('{"sessions": ')
+        cache = self.new_cache()
+        self.assertIsNone(cache.lease(KEY))
+        self.assertTrue(cache.release(KEY, 'sid1'))
+        self.assertEqual(self.new_cache().lease(KEY), 'sid1')
@@ -0,0 +1,141 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+except ImportError:
+    import unittest2 as unittest
+
+import threading
+import time
+
+import responses
+
+from acos_client import client
+from acos_client import errors as acos_errors
+from acos_client.singleflight import SingleFlight
+
+BASE_URL = 'https://fake_a10:443/axapi/v3'
+AUTH_URL = BASE_URL + '/auth'
+SG_URL = BASE_URL + '/slb/service-group/pool1'
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    def run_concurrently(self, fn, n=5, key='k'):
+        results = [None] * n
+        errors = [None] * n
+
+        def worker(i):
+            try:
+                results[i] = self.flight.do(key, fn)
+            except Exception as e:
+                errors[i] = e
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    def blocking(self, result=None, error=None, n=5):
+        def fn():
+            self.calls += 1
+            wait_for(lambda: self.flight.shared == n - 1)
+            if error is not None:
+                raise error
+            return result
+        return fn
+
+    def test_concurrent_calls_share_one(self):
+        results, errors = self.run_concurrently(self.blocking({'a': [1]}))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{'a': [1]}] * 5)
+        # Every caller can modify its result without affecting the others
+        self.assertEqual(len(set(id(r) for r in results)), 5)
+
+    def test_exception_reaches_every_caller(self):
+        error = acos_errors.ACOSException(1, 'boom')
+        results, errors = self.run_concurrently(self.blocking(error=error))
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(errors, [error] * 5)
+
+    def test_sequential_calls_not_shared(self):
+        self.flight.do('k', lambda: 1)
+        self.assertEqual(self.flight.do('k', lambda: 2), 2)
+        self.assertEqual(self.flight.shared, 0)
+
+    def test_forget(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait()
+            return 'old'
+
+        t = threading.Thread(target=self.flight.do, args=('k', slow))
+        t.start()
+        started.wait()
+        self.flight.forget()
+        self.assertEqual(self.flight.do('k', lambda: 'new'), 'new')
+        release.set()
+        t.join()
+
+
+class TestClientCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client('fake_a10', '30', 'admin', 'a10')
+
+    @responses.activate
+    def test_identical_gets_coalesced(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        inflight = self.client.http.inflight
+
+        def get(request):
+            wait_for(lambda: inflight.shared == 7)
+            return (200, {}, '{"service-group": {"name": "pool1"}}')
+
+        responses.add_callback(responses.GET, SG_URL, callback=get)
+        results = []
+
+        def worker():
+            results.append(self.client.slb.service_group.get('pool1'))
+
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, [{'service-group': {'name': 'pool1'}}] * 8)
+        self.assertEqual(len([c for c in responses.calls if c.request.method == 'GET']), 1)
+
+    def test_disabled(self):
+        c = client.Client('fake_a10', '30', 'admin', 'a10', coalesce_gets=False)
+        self.assertFalse(c.slb.service_group._coalesce())
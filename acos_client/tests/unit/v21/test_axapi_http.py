@@ -0,0 +1,77 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client.v21 import axapi_http
+from acos_client.v21.ssl_adapter import SSLAdapter
+
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/services/rest/v2.1/?format=json&method='.format(HOSTNAME)
+SEARCH_URL = '{}slb.server.search&session_id=foobar'.format(BASE_URL)
+SEARCH_PATH = '/services/rest/v2.1/?format=json&method=slb.server.search&session_id=foobar'
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def setUp(self):
+        self.http = axapi_http.HttpClient(HOSTNAME)
+
+    def tearDown(self):
+        self.http.close()
+
+    def test_https_uses_ssl_adapter(self):
+        self.assertIsInstance(self.http.session.get_adapter(SEARCH_URL), SSLAdapter)
+
+    def test_ssl_context_built_once(self):
+        adapter = self.http.session.get_adapter(SEARCH_URL)
+
+        with mock.patch.object(adapter, 'create_ssl_context') as create:
+            adapter._ssl_context = None
+            adapter.ssl_context()
+            adapter.ssl_context()
+
+        create.assert_called_once_with()
+
+    @responses.activate
+    def test_session_reused_across_calls(self):
+        responses.add(responses.POST, SEARCH_URL, json={'server': {}})
+
+        self.http.post(SEARCH_PATH)
+        session = self.http.session
+        self.http.post(SEARCH_PATH)
+
+        self.assertIs(self.http.session, session)
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_connection_stats_without_session(self):
+        self.assertEqual(self.http.connection_stats(), {'connections': 0, 'requests': 0})
+
+    def test_connection_stats(self):
+        adapter = self.http.session.get_adapter(SEARCH_URL)
+        pool = adapter.poolmanager.connection_from_url(SEARCH_URL)
+        pool.num_connections = 1
+        pool.num_requests = 12
+
+        self.assertEqual(self.http.connection_stats(), {'connections': 1, 'requests': 12})
@@ -22,6 +22,7 @@ except ImportError:
 
 from acos_client import client
 import acos_client.errors as acos_errors
+from acos_client import session_cache
 import responses
 
 
@@ -120,3 +121,39 @@ class TestSession(unittest.TestCase):
         self.assertEqual(len(responses.calls), 2)
         self.assertEqual(responses.calls[1].request.method, responses.POST)
         self.assertEqual(responses.calls[1].request.url, BAD_CLOSE_AUTH_URL)
+
+
+class TestSessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = session_cache.SessionCache()
+
+    def new_client(self):
+        return client.Client(HOSTNAME, '21', 'fake_username', 'fake_password', session_cache=self.cache)
+
+    @responses.activate
+    def test_clients_share_session(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, BASE_URL + 'system.information.get&session_id=foobar', json={})
+
+        for i in range(3):
+            with self.new_client() as c:
+                c.system.information()
+
+        urls = [call.request.url for call in responses.calls]
+        self.assertEqual(urls.count(AUTH_URL), 1)
+        self.assertNotIn(CLOSE_AUTH_URL, urls)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    @responses.activate
+    def test_rejected_session_not_cached(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.POST, CLOSE_AUTH_URL, json={'response': {'status': 'OK'}})
+        c = self.new_client()
+        c.session.id
+
+        c.session.reset()
+        c.close()
+
+        self.assertIsNone(c.session.session_id)
+        self.assertEqual(len(self.cache), 0)
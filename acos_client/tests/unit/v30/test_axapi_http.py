@@ -0,0 +1,109 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client.v30 import axapi_http
+
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+OBJECT_URL = '{}/slb/server/s1'.format(BASE_URL)
+
+
+class TestHttpClient(unittest.TestCase):
+
+    def setUp(self):
+        self.http = axapi_http.HttpClient(HOSTNAME, pool_maxsize=4)
+
+    def tearDown(self):
+        self.http.close()
+
+    @responses.activate
+    def test_session_reused_across_calls(self):
+        responses.add(responses.GET, OBJECT_URL, json={'server': {}})
+
+        self.http.get('/axapi/v3/slb/server/s1')
+        session = self.http.session
+        self.http.get('/axapi/v3/slb/server/s1')
+
+        self.assertIs(self.http.session, session)
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_pool_settings_applied(self):
+        adapter = self.http.session.get_adapter(OBJECT_URL)
+
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(adapter._pool_block, False)
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_close_releases_session(self):
+        session = self.http.session
+
+        with mock.patch.object(session, 'close') as close:
+            self.http.close()
+
+        close.assert_called_once_with()
+        self.assertIsNot(self.http.session, session)
+
+    @responses.activate
+    def test_max_retries_override_uses_one_off_session(self):
+        responses.add(responses.GET, OBJECT_URL, json={'server': {}})
+        session = self.http.session
+
+        with mock.patch.object(session, 'get') as pooled_get:
+            self.http.get('/axapi/v3/slb/server/s1', max_retries=0)
+
+        pooled_get.assert_not_called()
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_keep_alive_disabled(self):
+        responses.add(responses.GET, OBJECT_URL, json={'server': {}})
+        http = axapi_http.HttpClient(HOSTNAME, keep_alive=False)
+
+        http.get('/axapi/v3/slb/server/s1')
+
+        self.assertEqual(responses.calls[0].request.headers['Connection'], 'close')
+
+    @mock.patch('acos_client.logutils.clean')
+    @responses.activate
+    def test_no_wire_logging_work_without_debug(self, clean):
+        responses.add(responses.POST, OBJECT_URL, json={'server': {}})
+
+        with mock.patch.object(axapi_http.LOG, 'isEnabledFor', return_value=False):
+            self.http.post('/axapi/v3/slb/server/s1', {'server': {'name': 's1'}})
+
+        clean.assert_not_called()
+
+    @responses.activate
+    def test_wire_logging_redacts(self):
+        responses.add(responses.POST, BASE_URL + '/auth', json={'authresponse': {'signature': 'x'}})
+
+        with mock.patch.object(axapi_http, 'LOG') as log:
+            log.isEnabledFor.return_value = True
+            self.http.post('/axapi/v3/auth', {'credentials': {'username': 'admin', 'password': 'a10'}})
+
+        logged = ' '.join(str(a) for c in log.debug.call_args_list for a in c[0][1:])
+        self.assertIn('"username": "********"', logged)
+        self.assertNotIn('a10"', logged)
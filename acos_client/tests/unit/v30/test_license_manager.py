@@ -28,7 +28,7 @@ URL_BASE = "/axapi/v3/license-manager"
 
 class TestLicenseManager(unittest.TestCase):
     def setUp(self):
-        self.client = mock.Mock()
+        self.client = mock.MagicMock()
         self.target = LicenseManager(self.client)
 
     def _untested(self):
@@ -48,6 +48,14 @@ class TestMember(unittest.TestCase):
         self.assertEqual(url, '/axapi/v3/slb/service-group/%s/member/' % (self._sg_name))
         self.assertEqual(params, expected)
 
+    def test_create_member_optimistic(self):
+        self.member.create(self._sg_name, 'fake-srever', 80, optimistic=True)
+
+        self.member._get.assert_not_called()
+        ((method, url, params, header), kwargs) = self.client.http.request.call_args
+        self.assertEqual(method, 'POST')
+        self.assertNotIn('optimistic', kwargs)
+
     def test_create_disable_member(self):
         expected = {
             'member': {
@@ -100,3 +108,26 @@ class TestMember(unittest.TestCase):
                                expected['member']['name'],
                                expected['member']['port']))
         self.assertEqual(params, expected)
+
+    def test_create_many(self):
+        members = [{'server_name': 's%d' % i, 'server_port': 80} for i in range(3)]
+
+        self.member.create_many(self._sg_name, members)
+
+        ((method, url, params, header), kwargs) = self.client.http.request.call_args
+        self.assertEqual(self.client.http.request.call_count, 1)
+        self.assertEqual(url, '/axapi/v3/slb/service-group/%s/member/' % self._sg_name)
+        self.assertEqual([m['name'] for m in params['member-list']], ['s0', 's1', 's2'])
+        self.assertEqual(params['member-list'][0]['member-state'], 'enable')
+
+    def test_update_many_fallback(self):
+        self.client.http.request.side_effect = [acos_errors.ACOSException(), None, None]
+        members = [{'server_name': 's%d' % i, 'server_port': 80} for i in range(2)]
+
+        self.member.update_many(self._sg_name, members)
+
+        urls = [c[0][1] for c in self.client.http.request.call_args_list]
+        self.assertEqual(urls[1:], [
+            '/axapi/v3/slb/service-group/%s/member/s0+80/' % self._sg_name,
+            '/axapi/v3/slb/service-group/%s/member/s1+80/' % self._sg_name,
+        ])
@@ -81,3 +81,21 @@ class TestPort(unittest.TestCase):
         self.assertEqual(method, 'DELETE')
         self.assertEqual(url, '/axapi/v3/slb/server/%s/port/%s+%s/' %
                               (self._server_name, 80, 'tcp'))
+
+    def test_create_many(self):
+        ports = [{'port': 80, 'protocol': 'tcp'}, {'port': 53, 'protocol': 'udp'}]
+
+        self.port.create_many(self._server_name, ports)
+
+        ((method, url, params, header), kwargs) = self.client.http.request.call_args
+        self.assertEqual(method, 'POST')
+        self.assertEqual(url, '/axapi/v3/slb/server/%s/port/' % self._server_name)
+        self.assertEqual([(p['port-number'], p['protocol']) for p in params['port-list']],
+                         [(80, 'tcp'), (53, 'udp')])
+
+    def test_delete_many(self):
+        self.port.delete_many(self._server_name, [(80, 'tcp'), (53, 'udp')])
+
+        urls = [c[0][1] for c in self.client.http.request.call_args_list]
+        self.assertEqual(urls, ['/axapi/v3/slb/server/%s/port/80+tcp/' % self._server_name,
+                                '/axapi/v3/slb/server/%s/port/53+udp/' % self._server_name])
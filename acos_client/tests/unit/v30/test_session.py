@@ -0,0 +1,332 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import itertools
+import threading
+import time
+
+try:
+    import unittest
+    from unittest import mock
+except ImportError:
+    import mock
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+from acos_client import errors as acos_errors
+from acos_client import session_cache
+
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+AUTH_URL = '{}/auth'.format(BASE_URL)
+LOGOFF_URL = '{}/logoff'.format(BASE_URL)
+SYSTEM_URL = '{}/system'.format(BASE_URL)
+
+
+def auth_callback():
+    counter = itertools.count()
+
+    def callback(request):
+        time.sleep(0.01)
+        return (200, {}, '{"authresponse": {"signature": "sig%d"}}' % next(counter))
+    return callback
+
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password')
+
+    @responses.activate
+    def test_concurrent_first_use_logs_in_once(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        ids = []
+
+        threads = [threading.Thread(target=lambda: ids.append(self.client.session.id)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(set(ids), set(['sig0']))
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_reset_only_drops_stale_id(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, LOGOFF_URL, json={})
+        session = self.client.session
+
+        stale = session.id
+        session.reset(stale)
+        fresh = session.id
+        session.reset(stale)
+
+        self.assertEqual((stale, fresh), ('sig0', 'sig1'))
+        self.assertEqual(session.id, 'sig1')
+        self.assertEqual(len([c for c in responses.calls if c.request.url == AUTH_URL]), 2)
+
+    @responses.activate
+    def test_activate_partition_once(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.POST, BASE_URL + '/active-partition/p1', json={})
+
+        self.client.session.activate('p1')
+        self.client.session.activate('p1')
+
+        self.assertEqual(self.client.session.partition, 'p1')
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_partition_scopes_share_one_session_safely(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        device = {'partition': 'shared'}
+        caller = threading.local()
+        wrong = []
+
+        def activate(request):
+            device['partition'] = request.url.rsplit('/', 1)[1]
+            return (200, {}, '{}')
+
+        def system(request):
+            # responses runs callbacks on the calling thread
+            if device['partition'] != caller.partition:
+                wrong.append((caller.partition, device['partition']))
+            time.sleep(0.005)
+            return (200, {}, '{"system": {}}')
+
+        responses.add_callback(responses.POST, BASE_URL + '/active-partition/p1', callback=activate)
+        responses.add_callback(responses.POST, BASE_URL + '/active-partition/p2', callback=activate)
+        responses.add_callback(responses.GET, SYSTEM_URL, callback=system)
+        # Every call has to reach the device for the partition check
+        self.client.coalesce_gets = False
+
+        def worker(p):
+            caller.partition = p
+            with self.client.partition_scope(p):
+                for i in range(3):
+                    self.client.system.information()
+
+        threads = [threading.Thread(target=worker, args=(p,)) for p in ('p1', 'p2', 'p1', 'p2')]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(wrong, [])
+        self.assertEqual(len([c for c in responses.calls if c.request.url == SYSTEM_URL]), 12)
+
+
+class TestSessionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = session_cache.SessionCache()
+
+    def new_client(self):
+        return client.Client(HOSTNAME, '30', 'fake_username', 'fake_password', session_cache=self.cache)
+
+    @responses.activate
+    def test_clients_share_session(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        for i in range(3):
+            with self.new_client() as c:
+                c.system.information()
+
+        urls = [c.request.url for c in responses.calls]
+        self.assertEqual(urls.count(AUTH_URL), 1)
+        self.assertNotIn(LOGOFF_URL, urls)
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    @responses.activate
+    def test_session_kept_in_partition(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, BASE_URL + '/active-partition/p1', json={})
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        with self.new_client() as c:
+            c.system.partition.active('p1')
+            c.system.information()
+        with self.new_client() as c:
+            c.system.partition.active('p1')
+            c.system.information()
+
+        urls = [c.request.url for c in responses.calls]
+        self.assertEqual(urls.count(AUTH_URL), 1)
+        self.assertEqual(urls.count(BASE_URL + '/active-partition/p1'), 1)
+
+    @mock.patch('acos_client.retry.time.sleep')
+    @responses.activate
+    def test_stale_session_discarded(self, sleep):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, LOGOFF_URL, json={})
+        self.cache.release(self.new_client().session._cache_key('shared'), 'expired')
+        responses.add(responses.GET, SYSTEM_URL, json={
+            'response': {'status': 'fail', 'err': {'code': 1207960052, 'msg': 'Invalid session'}}
+        })
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        with self.new_client() as c:
+            c.system.information()
+            self.assertEqual(c.session.session_id, 'sig0')
+
+        self.assertEqual(self.cache.lease(c.session._cache_key('shared')), 'sig0')
+        self.assertIsNone(self.cache.lease(c.session._cache_key('shared')))
+
+
+class TestSessionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password', session_pool_size=3)
+
+    def test_pool_v21_unsupported(self):
+        with self.assertRaises(acos_errors.ACOSUnsupportedVersion):
+            client.Client(HOSTNAME, '21', 'fake_username', 'fake_password', session_pool_size=3)
+
+    @responses.activate
+    def test_warm(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+
+        self.client.session.warm()
+
+        self.assertEqual(sorted(s.session_id for s in self.client.session.sessions), ['sig0', 'sig1', 'sig2'])
+
+    def test_checkout_exclusive(self):
+        pool = self.client.session
+        with pool.checkout() as a:
+            with pool.checkout() as b:
+                self.assertIsNot(a, b)
+
+        with pool.checkout() as c:
+            self.assertIs(c, a)
+
+    @responses.activate
+    def test_concurrent_requests_use_separate_sessions(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        seen = set()
+
+        def system(request):
+            seen.add(request.headers['Authorization'])
+            time.sleep(0.05)
+            return (200, {}, '{"system": {}}')
+
+        responses.add_callback(responses.GET, SYSTEM_URL, callback=system)
+        self.client.coalesce_gets = False
+
+        threads = [threading.Thread(target=self.client.system.information) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(seen, set(['A10 sig0', 'A10 sig1', 'A10 sig2']))
+
+    @responses.activate
+    def test_partition_applied_per_session(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, BASE_URL + '/active-partition/p1', json={})
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+        self.client.current_partition = 'p1'
+        pool = self.client.session
+        pool.warm()
+
+        with pool.checkout():
+            self.client.system.information()
+
+        activated = [c.request.headers['Authorization'] for c in responses.calls
+                     if c.request.url.endswith('/active-partition/p1')]
+        self.assertEqual(activated, ['A10 sig1'])
+        self.assertEqual(pool.sessions[1].partition, 'p1')
+        self.assertEqual(pool.sessions[0].partition, 'shared')
+
+    @mock.patch('acos_client.retry.time.sleep')
+    @responses.activate
+    def test_invalid_session_reauthenticates_that_session(self, sleep):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, LOGOFF_URL, json={})
+        responses.add(responses.GET, SYSTEM_URL, json={
+            'response': {'status': 'fail', 'err': {'code': 1207960052, 'msg': 'Invalid session'}}
+        })
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        self.assertEqual(self.client.system.information(), {'system': {}})
+        self.assertEqual(self.client.session.sessions[0].session_id, 'sig1')
+        self.assertIsNone(self.client.session.sessions[1].session_id)
+
+
+class TestPartitionSessions(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password', partition_sessions=True)
+
+    def test_partition_sessions_v21_unsupported(self):
+        with self.assertRaises(acos_errors.ACOSUnsupportedVersion):
+            client.Client(HOSTNAME, '21', 'fake_username', 'fake_password', partition_sessions=True)
+
+    @responses.activate
+    def test_switching_back_costs_nothing(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, BASE_URL + '/active-partition/p1', json={})
+        responses.add(responses.POST, BASE_URL + '/active-partition/p2', json={})
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        for i in range(3):
+            for p in ('p1', 'p2'):
+                self.client.system.partition.active(p)
+                self.client.system.information()
+
+        urls = [c.request.url for c in responses.calls]
+        self.assertEqual(urls.count(AUTH_URL), 2)
+        self.assertEqual(urls.count(BASE_URL + '/active-partition/p1'), 1)
+        self.assertEqual(urls.count(BASE_URL + '/active-partition/p2'), 1)
+        by_session = [c.request.headers['Authorization'] for c in responses.calls if c.request.url == SYSTEM_URL]
+        self.assertEqual(by_session, ['A10 sig0', 'A10 sig1'] * 3)
+
+    @responses.activate
+    def test_shared_needs_no_activation(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.GET, SYSTEM_URL, json={'system': {}})
+
+        self.client.system.information()
+
+        self.assertEqual([c.request.url for c in responses.calls], [AUTH_URL, SYSTEM_URL])
+
+    def test_pool_per_partition(self):
+        c = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password',
+                          partition_sessions=True, session_pool_size=2)
+        c.current_partition = 'p1'
+        with c.session.checkout() as a:
+            with c.session.checkout() as b:
+                self.assertIsNot(a, b)
+        self.assertEqual(len(c.session.sessions_for('p1')), 2)
+        self.assertEqual(list(c.session.partitions), ['p1'])
+
+    @responses.activate
+    def test_close_logs_off_every_partition(self):
+        responses.add_callback(responses.POST, AUTH_URL, callback=auth_callback())
+        responses.add(responses.POST, BASE_URL + '/active-partition/p1', json={})
+        responses.add(responses.POST, LOGOFF_URL, json={})
+
+        self.client.system.partition.active('p1')
+        self.client.session.sessions_for('shared').id
+        self.client.close()
+
+        self.assertEqual(len([c for c in responses.calls if c.request.url == LOGOFF_URL]), 2)
+        self.assertIsNone(self.client.session.session_id)
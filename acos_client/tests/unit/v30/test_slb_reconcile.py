@@ -0,0 +1,149 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import copy
+import json
+
+try:
+    import unittest
+except ImportError:
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+AUTH_URL = '{}/auth'.format(BASE_URL)
+
+DEVICE = {
+    'server-list': [
+        {'name': 's1', 'host': '10.0.0.1', 'conn-limit': 8000000,
+         'port-list': [{'port-number': 80, 'protocol': 'tcp', 'weight': 1}]},
+        {'name': 's2', 'host': '10.0.0.2', 'conn-limit': 8000000},
+    ],
+    'service-group-list': [
+        {'name': 'pool1', 'protocol': 'tcp', 'lb-method': 'round-robin',
+         'member-list': [{'name': 's1', 'port': 80}, {'name': 's2', 'port': 80}]},
+    ],
+    'virtual-server-list': [
+        {'name': 'vip1', 'ip-address': '192.0.2.1',
+         'port-list': [{'port-number': 80, 'protocol': 'tcp', 'service-group': 'pool1'}]},
+        {'name': 'unmanaged', 'ip-address': '192.0.2.99'},
+    ],
+}
+MONITORS = {'monitor-list': [{'name': 'hm1', 'retry': 3}]}
+
+
+def spec_of(device):
+    spec = copy.deepcopy(device)
+    # Only part of what the device reports is usually declared
+    for server in spec['server-list']:
+        server.pop('conn-limit')
+    spec['virtual-server-list'].pop()
+    return spec
+
+
+class TestReconciler(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password')
+        self.reconciler = self.client.slb.reconciler
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.GET, BASE_URL + '/slb/', json={'slb': DEVICE})
+        responses.add(responses.GET, BASE_URL + '/health/monitor/', json=MONITORS)
+
+    def plan(self, spec, **kwargs):
+        return [(c.action, c.kind, c.key) for c in self.reconciler.plan(spec, **kwargs)]
+
+    def gets(self):
+        return [c.request.url for c in responses.calls if c.request.method == 'GET']
+
+    @responses.activate
+    def test_no_changes(self):
+        spec = spec_of(DEVICE)
+        spec['monitor-list'] = MONITORS['monitor-list']
+
+        self.assertEqual(self.reconciler.reconcile(spec), [])
+        self.assertEqual(self.gets(), [BASE_URL + '/slb/', BASE_URL + '/health/monitor/'])
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_monitors_only_fetched_when_declared(self):
+        self.plan(spec_of(DEVICE))
+        self.assertEqual(self.gets(), [BASE_URL + '/slb/'])
+
+    @responses.activate
+    def test_changes_in_dependency_order(self):
+        spec = spec_of(DEVICE)
+        spec['server-list'][1]['host'] = '10.0.0.22'
+        spec['server-list'].append({'name': 's3', 'host': '10.0.0.3'})
+        pool1 = spec['service-group-list'][0]
+        pool1['member-list'] = [{'name': 's1', 'port': 80}, {'name': 's3', 'port': 80}]
+        spec['service-group-list'].append({'name': 'pool2', 'member-list': [{'name': 's3', 'port': 443}]})
+        spec['virtual-server-list'][0]['port-list'] = [
+            {'port-number': 443, 'protocol': 'tcp', 'service-group': 'pool2'}]
+
+        self.assertEqual(self.plan(spec), [
+            ('update', 'server', ('s2',)),
+            ('create', 'server', ('s3',)),
+            ('create', 'service-group', ('pool2',)),
+            ('create', 'member', ('pool1', 's3', 80)),
+            ('create', 'vport', ('vip1', 443, 'tcp')),
+            ('delete', 'vport', ('vip1', 80, 'tcp')),
+            ('delete', 'member', ('pool1', 's2', 80)),
+        ])
+
+    @responses.activate
+    def test_prune(self):
+        spec = spec_of(DEVICE)
+        del spec['server-list']
+        self.assertEqual(self.plan(spec), [])
+        self.assertEqual(self.plan(spec, prune=True), [('delete', 'virtual-server', ('unmanaged',))])
+
+    @responses.activate
+    def test_apply(self):
+        responses.add(responses.POST, BASE_URL + '/slb/server/', json={})
+        responses.add(responses.POST, BASE_URL + '/slb/server/s1', json={})
+        responses.add(responses.DELETE, BASE_URL + '/slb/virtual-server/unmanaged', json={})
+        spec = spec_of(DEVICE)
+        spec['server-list'][0]['conn-limit'] = 100
+        spec['server-list'].append({'name': 's3', 'host': '10.0.0.3'})
+        spec['server-list'].append({'name': 's4', 'host': '10.0.0.4'})
+
+        changes = self.reconciler.reconcile(spec, prune=True)
+
+        self.assertEqual(len(changes), 4)
+        writes = [(c.request.method, c.request.url, c.request.body and json.loads(c.request.body))
+                  for c in responses.calls if c.request.method != 'GET' and c.request.url != AUTH_URL]
+        self.assertEqual(writes, [
+            ('POST', BASE_URL + '/slb/server/s1', {'server': {'name': 's1', 'host': '10.0.0.1', 'conn-limit': 100}}),
+            ('POST', BASE_URL + '/slb/server/', {'server-list': [
+                {'name': 's3', 'host': '10.0.0.3'}, {'name': 's4', 'host': '10.0.0.4'}]}),
+            ('DELETE', BASE_URL + '/slb/virtual-server/unmanaged', None),
+        ])
+
+    @responses.activate
+    def test_dry_run(self):
+        spec = {'server-list': [{'name': 's9', 'host': '10.0.0.9'}]}
+        changes = self.reconciler.reconcile(spec, dry_run=True)
+        self.assertEqual([c.action for c in changes], ['create'])
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_missing_key(self):
+        self.assertRaises(ValueError, self.reconciler.plan, {'server-list': [{'host': '10.0.0.9'}]})
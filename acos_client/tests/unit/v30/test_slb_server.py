@@ -74,6 +74,31 @@ class TestServer(unittest.TestCase):
         with self.assertRaises(acos_errors.Exists):
             self.client.slb.server.create('test', '192.168.2.254')
 
+    @mock.patch('acos_client.v30.slb.server.Server.get')
+    @responses.activate
+    def test_server_create_optimistic(self, mocked_get):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.POST, CREATE_URL, json={'foo': 'bar'}, status=200)
+
+        self.client.slb.server.create('test', '192.168.2.254', optimistic=True)
+
+        mocked_get.assert_not_called()
+        self.assertEqual(len(responses.calls), 2)
+
+    @mock.patch('acos_client.v30.slb.server.Server.get')
+    @responses.activate
+    def test_server_create_optimistic_client_exists(self, mocked_get):
+        self.client.optimistic = True
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.POST, CREATE_URL, json={
+            'response': {'status': 'fail', 'err': {'code': 654311495, 'msg': 'Object exists'}}
+        }, status=200)
+
+        with self.assertRaises(acos_errors.Exists):
+            self.client.slb.server.create('test', '192.168.2.254')
+
+        mocked_get.assert_not_called()
+
     @mock.patch('acos_client.v30.slb.server.Server.get')
     @responses.activate
     def test_server_create_with_template(self, mocked_get):
@@ -163,6 +188,96 @@ class TestServer(unittest.TestCase):
 
         self.assertEqual(len(responses.calls), 2)
 
+    @responses.activate
+    def test_server_create_many_chunks(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.POST, CREATE_URL, json={'response': {'status': 'OK'}}, status=200)
+        servers = [{'name': 's%d' % i, 'ip_address': '10.0.0.%d' % i} for i in range(5)]
+
+        self.client.slb.server.create_many(servers, chunk_size=2)
+
+        bodies = [json.loads(c.request.body) for c in responses.calls[1:]]
+        self.assertEqual([len(b['server-list']) for b in bodies], [2, 2, 1])
+        self.assertEqual(bodies[2]['server-list'][0]['name'], 's4')
+        self.assertEqual(bodies[2]['server-list'][0]['host'], '10.0.0.4')
+
+    @responses.activate
+    def test_server_create_many_falls_back_per_item(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        fail = {'response': {'status': 'fail', 'err': {'code': 1023459393, 'msg': 'bad'}}}
+        ok = {'response': {'status': 'OK'}}
+
+        def callback(request):
+            body = json.loads(request.body)
+            if 'server-list' in body or body['server']['name'] == 's1':
+                return (200, {}, json.dumps(fail))
+            return (200, {}, json.dumps(ok))
+
+        responses.add_callback(responses.POST, CREATE_URL, callback=callback)
+        servers = [{'name': 's%d' % i, 'ip_address': '10.0.0.%d' % i} for i in range(3)]
+
+        with self.assertRaises(acos_errors.PartialFailure) as cm:
+            self.client.slb.server.create_many(servers)
+
+        self.assertEqual(len(cm.exception.failures), 1)
+        self.assertEqual(cm.exception.failures[0][0]['name'], 's1')
+        self.assertIsInstance(cm.exception.failures[0][1], acos_errors.InvalidParameter)
+        # one list request, then one request per item
+        self.assertEqual(len(responses.calls), 5)
+
+    @responses.activate
+    def test_server_create_many_partially_applied_chunk(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        exists = {'response': {'status': 'fail', 'err': {'code': 67371011, 'msg': 'exists'}}}
+        fail = {'response': {'status': 'fail', 'err': {'code': 1023459393, 'msg': 'bad'}}}
+        ok = {'response': {'status': 'OK'}}
+        created = set()
+
+        def callback(request):
+            body = json.loads(request.body)
+            # The device creates the list items in order up to the bad one
+            for server in body.get('server-list', [body.get('server')]):
+                if server['name'] == 's1':
+                    return (200, {}, json.dumps(fail))
+                if server['name'] in created:
+                    return (200, {}, json.dumps(exists))
+                created.add(server['name'])
+            return (200, {}, json.dumps(ok))
+
+        responses.add_callback(responses.POST, CREATE_URL, callback=callback)
+        servers = [{'name': 's%d' % i, 'ip_address': '10.0.0.%d' % i} for i in range(3)]
+
+        with self.assertRaises(acos_errors.PartialFailure) as cm:
+            self.client.slb.server.create_many(servers)
+
+        self.assertEqual([f[0]['name'] for f in cm.exception.failures], ['s1'])
+        self.assertEqual(created, set(['s0', 's2']))
+
+    @responses.activate
+    def test_server_update_many_reports_exists(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        exists = {'response': {'status': 'fail', 'err': {'code': 67371011, 'msg': 'exists'}}}
+        responses.add(responses.POST, CREATE_URL, json=exists)
+        responses.add(responses.POST, CREATE_URL + 's0', json=exists)
+
+        with self.assertRaises(acos_errors.PartialFailure) as cm:
+            self.client.slb.server.update_many([{'name': 's0', 'ip_address': '10.0.0.1'}])
+
+        self.assertIsInstance(cm.exception.failures[0][1], acos_errors.Exists)
+
+    @responses.activate
+    def test_server_delete_many(self):
+        responses.add(responses.POST, AUTH_URL, json={'authresponse': {'signature': 'foobar'}})
+        responses.add(responses.DELETE, CREATE_URL + 's1', json={'response': {'status': 'OK'}})
+        responses.add(responses.DELETE, CREATE_URL + 's2', json={
+            'response': {'status': 'fail', 'err': {'code': 67174402, 'msg': 'No such Server'}}
+        })
+
+        with self.assertRaises(acos_errors.PartialFailure) as cm:
+            self.client.slb.server.delete_many(['s1', 's2'])
+
+        self.assertEqual([f[0] for f in cm.exception.failures], ['s2'])
+
 
 class TestIPv6Server(unittest.TestCase):
 
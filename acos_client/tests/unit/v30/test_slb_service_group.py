@@ -56,6 +56,17 @@ class TestVirtualServer(unittest.TestCase):
         self.assertEqual(responses.calls[1].request.method, responses.POST)
         self.assertEqual(responses.calls[1].request.url, CREATE_URL)
 
+    @mock.patch('acos_client.v30.slb.service_group.ServiceGroup.get')
+    @responses.activate
+    def test_server_group_create_optimistic(self, mocked_get):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.POST, CREATE_URL, json={"foo": "bar"}, status=200)
+
+        self.client.slb.service_group.create('test1', optimistic=True)
+
+        mocked_get.assert_not_called()
+        self.assertEqual(len(responses.calls), 2)
+
     @mock.patch('acos_client.v30.slb.service_group.ServiceGroup.get')
     @responses.activate
     def test_server_group_create_with_templates(self, mocked_get):
@@ -240,3 +251,27 @@ class TestVirtualServer(unittest.TestCase):
         self.assertEqual(len(responses.calls), 2)
         self.assertEqual(responses.calls[1].request.method, responses.GET)
         self.assertEqual(responses.calls[1].request.url, ALL_OPER_URL)
+
+    @responses.activate
+    def test_server_group_iter_oper(self):
+        ALL_OPER_URL = '{}/slb/service-group/oper'.format(BASE_URL)
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        groups = [{'name': 'sg%d' % i, 'oper': {'state': 'All Up'}, 'member-list': []} for i in range(3)]
+        json_response = {'service-group-list': groups}
+        responses.add(responses.GET, ALL_OPER_URL, body=json.dumps(json_response), status=200)
+
+        resp = self.client.slb.service_group.iter_oper()
+
+        self.assertEqual(list(resp), groups)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(responses.calls[1].request.url, ALL_OPER_URL)
+
+    @responses.activate
+    def test_server_group_iter_oper_error(self):
+        ALL_OPER_URL = '{}/slb/service-group/oper'.format(BASE_URL)
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        json_response = {'response': {'status': 'fail', 'err': {'code': 1023460352, 'msg': 'Not found'}}}
+        responses.add(responses.GET, ALL_OPER_URL, json=json_response, status=404)
+
+        with self.assertRaises(acos_errors.NotFound):
+            list(self.client.slb.service_group.iter_oper())
@@ -0,0 +1,120 @@
+# Copyright 2018,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+try:
+    import unittest
+except ImportError:
+    import unittest2 as unittest
+
+import responses
+
+from acos_client import client
+from acos_client.v30.slb.snapshot import SLBSnapshot
+
+HOSTNAME = 'fake_a10'
+BASE_URL = 'https://{}:443/axapi/v3'.format(HOSTNAME)
+AUTH_URL = '{}/auth'.format(BASE_URL)
+
+SLB = {
+    'slb': {
+        'server-list': [
+            {'name': 's1', 'host': '10.0.0.1', 'port-list': [{'port-number': 80, 'protocol': 'tcp'}]},
+            {'name': 's2', 'server-ipv6-addr': '2001:db8::2'},
+        ],
+        'service-group-list': [
+            {'name': 'pool1', 'protocol': 'tcp', 'member-list': [
+                {'name': 's1', 'port': 80}, {'name': 's2', 'port': 80}]},
+            {'name': 'pool2', 'protocol': 'tcp', 'member-list': [{'name': 's1', 'port': 8080}]},
+            {'name': 'empty', 'protocol': 'tcp'},
+        ],
+        'virtual-server-list': [
+            {'name': 'vip1', 'ip-address': '192.0.2.1', 'port-list': [
+                {'port-number': 80, 'protocol': 'http', 'service-group': 'pool1'},
+                {'port-number': 443, 'protocol': 'https', 'service-group': 'pool1'},
+                {'port-number': 8080, 'protocol': 'tcp'}]},
+            {'name': 'vip2', 'ipv6-address': '2001:db8::100', 'port-list': [
+                {'port-number': 80, 'protocol': 'tcp', 'service-group': 'pool2'}]},
+        ],
+    }
+}
+
+
+class TestSLBSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.client = client.Client(HOSTNAME, '30', 'fake_username', 'fake_password')
+
+    def snapshot(self):
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+            rsps.add(responses.GET, BASE_URL + '/slb/', json=SLB)
+            return self.client.slb.snapshot()
+
+    def test_servers(self):
+        snap = self.snapshot()
+        self.assertEqual(snap.servers['s1']['host'], '10.0.0.1')
+        self.assertIs(snap.servers_by_ip['10.0.0.1'], snap.servers['s1'])
+        self.assertIs(snap.servers_by_ip['2001:db8::2'], snap.servers['s2'])
+
+    def test_membership(self):
+        snap = self.snapshot()
+        self.assertEqual(snap.members[('pool1', 's2', 80)], {'name': 's2', 'port': 80})
+        self.assertEqual(snap.groups_by_member[('s1', 80)], set(['pool1']))
+        self.assertEqual(snap.groups_by_server['s1'], set(['pool1', 'pool2']))
+        self.assertIn('empty', snap.service_groups)
+        self.assertNotIn(('s2', 8080), snap.groups_by_member)
+
+    def test_virtual_servers(self):
+        snap = self.snapshot()
+        self.assertIs(snap.virtual_servers_by_ip['192.0.2.1'], snap.virtual_servers['vip1'])
+        self.assertIs(snap.virtual_servers_by_ip['2001:db8::100'], snap.virtual_servers['vip2'])
+        self.assertEqual(snap.vport_service_group[('vip1', 443, 'https')], 'pool1')
+        self.assertNotIn(('vip1', 8080, 'tcp'), snap.vport_service_group)
+        self.assertIn(('vip1', 8080, 'tcp'), snap.vports)
+        self.assertEqual(snap.vports_by_service_group['pool1'],
+                         set([('vip1', 80, 'http'), ('vip1', 443, 'https')]))
+        self.assertEqual(snap.vports_reaching_server('s2'), set([('vip1', 80, 'http'), ('vip1', 443, 'https')]))
+        self.assertEqual(len(snap.vports_reaching_server('s1')), 3)
+        self.assertEqual(snap.vports_reaching_server('nope'), set())
+
+    @responses.activate
+    def test_refresh_one_type(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.GET, BASE_URL + '/slb/', json=SLB)
+        snap = self.client.slb.snapshot()
+        responses.calls.reset()
+        responses.add(responses.GET, BASE_URL + '/slb/service-group/', json={'service-group-list': [
+            {'name': 'pool3', 'member-list': [{'name': 's2', 'port': 443}]}]})
+
+        snap.refresh('service-group')
+
+        self.assertEqual([c.request.url for c in responses.calls if c.request.method == 'GET'],
+                         [BASE_URL + '/slb/service-group/'])
+        self.assertEqual(list(snap.service_groups), ['pool3'])
+        self.assertEqual(snap.groups_by_server, {'s2': set(['pool3'])})
+        # Other types are left as they were
+        self.assertEqual(sorted(snap.servers), ['s1', 's2'])
+        self.assertEqual(snap.vport_service_group[('vip2', 80, 'tcp')], 'pool2')
+
+    def test_refresh_unknown_type(self):
+        snap = self.snapshot()
+        self.assertRaises(ValueError, snap.refresh, 'template')
+
+    def test_empty(self):
+        snap = SLBSnapshot(None, {'slb': {}})
+        self.assertEqual(snap.servers, {})
+        self.assertEqual(snap.groups_by_server, {})
+        self.assertEqual(snap.vports, {})
@@ -533,3 +533,24 @@ class TestVirtualPort(unittest.TestCase):
         self.assertEqual(len(responses.calls), 2)
         self.assertEqual(responses.calls[1].request.method, responses.GET)
         self.assertEqual(responses.calls[1].request.url, ALL_URL)
+
+    @responses.activate
+    def test_virtual_port_create_many(self):
+        responses.add(responses.POST, AUTH_URL, json={'session_id': 'foobar'})
+        responses.add(responses.POST, CREATE_URL, json={'response': {'status': 'OK'}}, status=200)
+        vports = [
+            {'name': 'test1_VPORT', 'protocol': 'http', 'port': 80, 'service_group_name': 'pool1'},
+            {'name': 'test2_VPORT', 'protocol': 'https', 'port': 443, 'service_group_name': 'pool2'},
+        ]
+
+        self.client.slb.virtual_server.vport.create_many(VSERVER_NAME, vports)
+
+        self.assertEqual(len(responses.calls), 2)
+        body = json.loads(responses.calls[1].request.body)
+        self.assertEqual(body['port-list'][1], {
+            'name': 'test2_VPORT',
+            'service-group': 'pool2',
+            'protocol': 'https',
+            'port-number': 443,
+            'extended-stats': 1,
+        })
@@ -19,7 +19,7 @@ class Admin(base.BaseV21):
 
     @property
     def administrator(self):
-        return self.Administrator(self.client)
+        return self._child(self.Administrator)
 
     class Administrator(base.BaseV21):
 
@@ -19,11 +19,16 @@ import json
 import logging
 from requests.adapters import HTTPAdapter
 from requests import Session
+from requests import exceptions as requests_exceptions
 import six
 import sys
+import threading
 
 import acos_client
+from acos_client.circuit_breaker import CircuitBreaker
+from acos_client import jsoncodec
 from acos_client import logutils
+from acos_client.utils import merge_dicts
 from acos_client.v21 import responses as acos_responses
 from acos_client.v21.ssl_adapter import SSLAdapter
 
@@ -40,17 +45,6 @@ def extract_method(api_url):
     return six.moves.urllib_parse.parse_qs(q).get('method', [''])[0]
 
 
-def merge_dicts(d1, d2):
-    d = d1.copy()
-    # if isinstance(d1, dict) else {}
-    for k, v in d2.items():
-        if k in d and isinstance(d[k], dict):
-            d[k] = merge_dicts(d[k], d2[k])
-        else:
-            d[k] = d2[k]
-    return d
-
-
 broken_replies = {
     ('<?xml version="1.0" encoding="utf-8" ?><response status="ok">'
      '</response>'): (json.dumps({"response": {"status": "OK"}})),
@@ -93,7 +87,9 @@ class HttpClient(object):
         "User-Agent": "ACOS-Client-AGENT-%s" % acos_client.VERSION,
     }
 
-    def __init__(self, host, port=None, protocol="https", max_retries=3, timeout=5):
+    def __init__(self, host, port=None, protocol="https", max_retries=3, timeout=5,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 circuit_breaker=None, codec=None):
         if port is None:
             if protocol is 'http':
                 self.port = 80
@@ -101,64 +97,151 @@ class HttpClient(object):
                 self.port = 443
         else:
             self.port = port
+        self.protocol = protocol
         self.url_base = "%s://%s:%s" % (protocol, host, self.port)
         self.max_retries = max_retries
         self.timeout = timeout
 
+        # Connection pool settings for the long-lived session; see session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Shared by every call to this host:port
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        # JSON library for payloads and responses; see acos_client.jsoncodec
+        self.codec = codec or jsoncodec.default()
+
+    def _new_session(self, max_retries):
+        # Add adapter for any https session to force TLS1_0 connection for v21 of AXAPI
+        adapter_class = SSLAdapter if self.protocol == 'https' else HTTPAdapter
+        session = Session()
+        session.mount('%s://' % self.protocol, adapter_class(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=max_retries))
+        return session
+
+    @property
+    def session(self):
+        """Pooled requests.Session shared by every call on this client.
+
+        The mounted adapter, its SSL context and its open connections live
+        as long as the session, so TLS handshakes are paid once per
+        connection rather than once per call.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._new_session(self.max_retries)
+        return self._session
+
+    def connection_stats(self):
+        """Count connections opened and requests sent by the pooled session.
+
+        requests much greater than connections means keep-alive is working.
+        """
+        stats = {'connections': 0, 'requests': 0}
+        if self._session is None:
+            return stats
+        for adapter in self._session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                stats['connections'] += pool.num_connections
+                stats['requests'] += pool.num_requests
+        return stats
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def request(self, method, api_url, params={}, **kwargs):
         """Generate the API call to the device."""
 
-        LOG.debug("axapi_http: full url = %s", self.url_base + api_url)
-        LOG.debug("axapi_http: %s url = %s", method, api_url)
-        LOG.debug("axapi_http: params = %s", json.dumps(logutils.clean(params), indent=4))
+        # Wire tracing is skipped entirely unless DEBUG is enabled
+        trace = LOG.isEnabledFor(logging.DEBUG)
+        if trace:
+            LOG.debug("axapi_http: full url = %s", self.url_base + api_url)
+            LOG.debug("axapi_http: %s url = %s", method, api_url)
+            LOG.debug("axapi_http: params = %s", logutils.Dump(params, indent=4))
 
         # Set "data" variable for the request
         if params:
             extra_params = kwargs.get('axapi_args', {})
             params_copy = merge_dicts(params, extra_params)
-            LOG.debug("axapi_http: params_all = %s", logutils.clean(params_copy))
+            if trace:
+                LOG.debug("axapi_http: params_all = %s", logutils.Dump(params_copy))
 
-            payload = json.dumps(params_copy)
+            payload = self.codec.dumps(params_copy)
         else:
             try:
                 payload = kwargs.pop('payload', None)
                 self.headers = dict(self.HEADERS, **kwargs.pop('headers', {}))
-                LOG.debug("axapi_http: headers_all = %s", logutils.clean(self.headers))
+                if trace:
+                    LOG.debug("axapi_http: headers_all = %s", logutils.Dump(self.headers))
             except KeyError:
                 payload = None
 
         max_retries = kwargs.get('max_retries', self.max_retries)
         timeout = kwargs.get('timeout', self.timeout)
 
-        # Create session to set HTTPAdapter or SSLAdapter
-        session = Session()
-        if self.port == 443:
-            # Add adapter for any https session to force TLS1_0 connection for v21 of AXAPI
-            session.mount('https://', SSLAdapter(max_retries=max_retries))
+        request_headers = self.HEADERS
+        if not self.keep_alive:
+            request_headers = dict(self.HEADERS, Connection="close")
+
+        # Fail fast before building anything that would need cleaning up
+        self.circuit_breaker.before_call()
+
+        # Reuse the pooled session unless this call overrides max_retries,
+        # which is bound to the adapter and so needs a one-off session.
+        if max_retries == self.max_retries:
+            session = self.session
+            one_off = False
         else:
-            session.mount('http://', HTTPAdapter(max_retries=max_retries))
+            session = self._new_session(max_retries)
+            one_off = True
         session_request = getattr(session, method.lower())
 
         # Make actual request and handle any errors
         try:
             device_response = session_request(
-                self.url_base + api_url, verify=False, data=payload, headers=self.HEADERS, timeout=timeout
+                self.url_base + api_url, verify=False, data=payload, headers=request_headers, timeout=timeout
             )
+        except (requests_exceptions.ConnectionError, requests_exceptions.Timeout) as e:
+            self.circuit_breaker.record_failure()
+            LOG.error("acos_client failing with error %s after %s retries", e.__class__.__name__, max_retries)
+            raise e
         except (Exception) as e:
+            # No response came back, so this says nothing about the device
+            self.circuit_breaker.release()
             LOG.error("acos_client failing with error %s after %s retries", e.__class__.__name__, max_retries)
             raise e
+        else:
+            self.circuit_breaker.record_success()
         finally:
-            session.close()
+            if one_off:
+                session.close()
 
         # Log if the reponse is one of the known broken response
         if device_response in broken_replies:
             device_response = broken_replies[device_response]
-            LOG.debug("axapi_http: broken reply, new response: %s", logutils.clean(device_response))
+            if trace:
+                LOG.debug("axapi_http: broken reply, new response: %s", logutils.Dump(device_response))
 
         # Validate json response
         try:
-            json_response = device_response.json()
-            LOG.debug("axapi_http: data = %s", json.dumps(logutils.clean(json_response), indent=4))
+            json_response = self.codec.loads(device_response.content)
+            if trace:
+                LOG.debug("axapi_http: data = %s", logutils.Dump(json_response, indent=4))
         except ValueError as e:
             # The response is not JSON but it still succeeded.
             LOG.debug("axapi_http: json = %s", e)
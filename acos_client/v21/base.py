@@ -14,15 +14,30 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import time
-
 from acos_client import errors as acos_errors
+from acos_client import retry
 
 
 class BaseV21(object):
 
+    # How many times _request retries each retryable error; delays and
+    # the overall deadline come from the client's RetryPolicy.
+    RETRY_LIMITS = {
+        acos_errors.MemoryFault: 5,
+        acos_errors.InvalidSessionID: 5,
+    }
+
     def __init__(self, client):
         self.client = client
+        # Sub-resources, built on first access and then reused
+        self._children = {}
+
+    def _child(self, cls):
+        """Return the cls sub-resource of this resource, creating it once."""
+        try:
+            return self._children[cls]
+        except KeyError:
+            return self._children.setdefault(cls, cls(self.client))
 
     def minimal_dict(self, my_dict):
         return dict((k, v) for k, v in my_dict.items() if v is not None)
@@ -31,29 +46,35 @@ class BaseV21(object):
         return ("/services/rest/v2.1/?format=json&method=%s&session_id=%s" %
                 (action, self.client.session.id))
 
-    def _request(self, method, action, params, retry_count=0, **kwargs):
-        if retry_count > 6:
-            raise acos_errors.ACOSUnknownError()
+    def _request(self, method, action, params, **kwargs):
+        policy = retry.policy_for(self.client)
+        budget = policy.budget(self.client.http.url_base)
+        attempt, started = retry.begin()
 
-        try:
-            return self.client.http.request(method, self.url(action), params,
-                                            **kwargs)
-        except acos_errors.MemoryFault as e:
-            if retry_count < 5:
-                time.sleep(0.1)
-                return self._request(method, action, params, retry_count + 1, **kwargs)
-            raise e
-        except acos_errors.InvalidSessionID as e:
-            if retry_count < 5:
-                time.sleep(0.1)
-                try:
-                    p = self.client.current_partition
-                    self.client.session.close()
-                    self.client.partition.active(p)
-                except Exception:
-                    pass
-                return self._request(method, action, params, retry_count + 1, **kwargs)
-            raise e
+        while True:
+            try:
+                r = self.client.http.request(method, self.url(action), params,
+                                             **kwargs)
+            except (acos_errors.MemoryFault, acos_errors.InvalidSessionID) as e:
+                delay = None
+                if attempt < self.RETRY_LIMITS.get(type(e), 0):
+                    delay = policy.next_delay(attempt, started)
+                if delay is None or not budget.withdraw():
+                    raise
+
+                attempt += 1
+                if isinstance(e, acos_errors.InvalidSessionID):
+                    try:
+                        p = self.client.current_partition
+                        self.client.session.reset()
+                        self.client.system.partition.active(p)
+                    except Exception:
+                        pass
+                retry.wait(delay, attempt, started)
+                continue
+
+            budget.deposit()
+            return r
 
     def _get(self, action, params={}, **kwargs):
         return self._request('GET', action, params, **kwargs)
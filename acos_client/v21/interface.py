@@ -59,11 +59,11 @@ class Interface(base.BaseV21):
 
     @property
     def ethernet(self):
-        return EthernetInterface(self.client)
+        return self._child(EthernetInterface)
 
     @property
     def management(self):
-        return ManagementInterface(self.client)
+        return self._child(ManagementInterface)
 
 
 class EthernetInterface(Interface):
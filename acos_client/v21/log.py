@@ -35,23 +35,23 @@ class Log(base.BaseV21):
 
         @property
         def level(self):
-            return self.Level(self.client)
+            return self._child(self.Level)
 
         @property
         def server(self):
-            return self.Server(self.client)
+            return self._child(self.Server)
 
         @property
         def buffer(self):
-            return self.Buffer(self.client)
+            return self._child(self.Buffer)
 
         @property
         def smtp(self):
-            return self.Smtp(self.client)
+            return self._child(self.Smtp)
 
         @property
         def audit(self):
-            return self.Audit(self.client)
+            return self._child(self.Audit)
 
         class Level(base.BaseV21):
             def get(self, **kwargs):
@@ -18,7 +18,7 @@ from acos_client.v21 import base
 class Nat(base.BaseV21):
     @property
     def pool(self):
-        return self.Pool(self.client)
+        return self._child(self.Pool)
 
     class Pool(base.BaseV21):
         def _set(self, action, name, start_ip, end_ip, mask, **kwargs):
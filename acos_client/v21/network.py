@@ -19,7 +19,7 @@ class Network(base.BaseV21):
 
     @property
     def interface(self):
-        return self.Interface(self.client)
+        return self._child(self.Interface)
 
     class Interface(base.BaseV21):
 
@@ -40,7 +40,7 @@ class Network(base.BaseV21):
 
         @property
         def ipv4(self):
-            return self.IPV4(self.client)
+            return self._child(self.IPV4)
 
         class IPV4(base.BaseV21):
 
@@ -73,13 +73,13 @@ class Network(base.BaseV21):
 
     @property
     def acl(self):
-        return self.ACL(self.client)
+        return self._child(self.ACL)
 
     class ACL(base.BaseV21):
 
         @property
         def ext(self):
-            return self.Ext(self.client)
+            return self._child(self.Ext)
 
         class Ext(base.BaseV21):
 
@@ -125,7 +125,7 @@ class Network(base.BaseV21):
 
     @property
     def route(self):
-        return self.Route(self.client)
+        return self._child(self.Route)
 
     class Route(base.BaseV21):
 
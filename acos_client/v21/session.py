@@ -16,6 +16,7 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 from acos_client import errors as acos_errors
+from acos_client import session_cache
 
 
 class Session(object):
@@ -30,9 +31,22 @@ class Session(object):
     @property
     def id(self):
         if self.session_id is None:
-            self.authenticate(self.username, self.password)
+            self._lease_or_authenticate()
         return self.session_id
 
+    def _lease_or_authenticate(self):
+        cache = session_cache.cache_for(self.client)
+        if cache is not None:
+            # Cached sessions are always handed back in the shared partition
+            session_id = cache.lease(self._cache_key())
+            if session_id is not None:
+                self.session_id = session_id
+                return
+        self.authenticate(self.username, self.password)
+
+    def _cache_key(self):
+        return session_cache.cache_key(self.http.url_base, self.username, self.password, 'shared')
+
     def authenticate(self, username, password):
         url = "/services/rest/v2.1/?format=json&method=authenticate"
         params = {
@@ -47,12 +61,30 @@ class Session(object):
         self.session_id = r['session_id']
         return r
 
+    def reset(self):
+        """Log off a session id the device rejected without caching it."""
+        cache = session_cache.cache_for(self.client)
+        if cache is not None and self.session_id is not None:
+            cache.discard(self.session_id)
+        # The next session starts out in the shared partition
+        self.client.current_partition = 'shared'
+        return self._logoff()
+
     def close(self):
         try:
             self.client.partition.active()
         except Exception:
             pass
 
+        cache = session_cache.cache_for(self.client)
+        if cache is not None and self.session_id is not None and self.client.current_partition == 'shared':
+            # Hand the session to the next client instead of logging off
+            if cache.release(self._cache_key(), self.session_id):
+                self.session_id = None
+                return
+        return self._logoff()
+
+    def _logoff(self):
         try:
             url = ("/services/rest/v2.1/?format=json&method=session"
                    ".close&session_id=%s" % self.session_id)
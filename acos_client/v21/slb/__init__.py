@@ -31,35 +31,35 @@ class SLB(base.BaseV21):
 
     @property
     def hm(self):
-        return HealthMonitor(self.client)
+        return self._child(HealthMonitor)
 
     @property
     def server(self):
-        return Server(self.client)
+        return self._child(Server)
 
     @property
     def service_group(self):
-        return ServiceGroup(self.client)
+        return self._child(ServiceGroup)
 
     @property
     def template(self):
-        return Template(self.client)
+        return self._child(Template)
 
     @property
     def virtual_server(self):
-        return VirtualServer(self.client)
+        return self._child(VirtualServer)
 
     @property
     def aflex(self):
-        return Aflex(self.client)
+        return self._child(Aflex)
 
     @property
     def class_list(self):
-        return ClassList(self.client)
+        return self._child(ClassList)
 
     @property
     def virtual_service(self):
-        return VirtualService(self.client)
+        return self._child(VirtualService)
 
     @property
     def common(self):
@@ -69,4 +69,4 @@ class Server(base.BaseV21):
 
     @property
     def port(self):
-        return Port(self.client)
+        return self._child(Port)
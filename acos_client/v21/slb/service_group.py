@@ -22,7 +22,7 @@ class ServiceGroup(base.BaseV21):
 
     @property
     def member(self):
-        return Member(self.client)
+        return self._child(Member)
 
     # Valid LB methods
     ROUND_ROBIN = 0
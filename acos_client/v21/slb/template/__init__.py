@@ -24,16 +24,16 @@ class Template(base.BaseV21):
 
     @property
     def client_ssl(self):
-        return ClientSSL(self.client)
+        return self._child(ClientSSL)
 
     @property
     def server_ssl(self):
-        return ServerSSL(self.client)
+        return self._child(ServerSSL)
 
     @property
     def cookie_persistence(self):
-        return CookiePersistence(self.client)
+        return self._child(CookiePersistence)
 
     @property
     def src_ip_persistence(self):
-        return SourceIpPersistence(self.client)
+        return self._child(SourceIpPersistence)
@@ -22,7 +22,7 @@ class VirtualServer(base.BaseV21):
 
     @property
     def vport(self):
-        return VirtualPort(self.client)
+        return self._child(VirtualPort)
 
     def all(self, **kwargs):
         return self._get("slb.virtual_server.getAll", **kwargs)
@@ -25,8 +25,17 @@ FORCED_CIPHERS = (
 class SSLAdapter(HTTPAdapter):
     """A TransportAdapter that re-enables 3DES support in Requests.
 
+    The SSL context is built once per adapter and shared by every pool it
+    manages, so a long-lived adapter does not redo cipher setup per pool.
     """
 
+    _ssl_context = None
+
+    def ssl_context(self):
+        if self._ssl_context is None:
+            self._ssl_context = self.create_ssl_context()
+        return self._ssl_context
+
     def create_ssl_context(self):
         ctx = ssl.create_default_context()
         # Disable all encryption protcols except TLS1_0
@@ -42,10 +51,10 @@ class SSLAdapter(HTTPAdapter):
 
     def init_poolmanager(self, *args, **kwargs):
         logging.debug(' ----------- SSLAdapter.init_poolmanager -------------- ')
-        kwargs['ssl_context'] = self.create_ssl_context()
+        kwargs['ssl_context'] = self.ssl_context()
         return super(SSLAdapter, self).init_poolmanager(*args, **kwargs)
 
     def proxy_manager_for(self, *args, **kwargs):
         logging.debug(' ----------- SSLAdapter.proxy_manager_for -------------- ')
-        kwargs['ssl_context'] = self.create_ssl_context()
+        kwargs['ssl_context'] = self.ssl_context()
         return super(SSLAdapter, self).proxy_manager_for(*args, **kwargs)
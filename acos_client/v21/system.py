@@ -50,31 +50,31 @@ class System(base.BaseV21):
 
     @property
     def admin(self):
-        return Admin(self.client)
+        return self._child(Admin)
 
     @property
     def device_info(self):
-        return DeviceInfo(self.client)
+        return self._child(DeviceInfo)
 
     @property
     def action(self):
-        return Action(self.client)
+        return self._child(Action)
 
     @property
     def partition(self):
-        return Partition(self.client)
+        return self._child(Partition)
 
     @property
     def config_file(self):
-        return ConfigFile(self.client)
+        return self._child(ConfigFile)
 
     @property
     def log(self):
-        return Log(self.client)
+        return self._child(Log)
 
     @property
     def banner(self):
-        return self.Banner(self.client)
+        return self._child(self.Banner)
 
     class Banner(base.BaseV21):
         def get(self, **kwargs):
@@ -86,7 +86,7 @@ class System(base.BaseV21):
 
     @property
     def hostname(self):
-        return self.Hostname(self.client)
+        return self._child(self.Hostname)
 
     class Hostname(base.BaseV21):
         def get(self, **kwargs):
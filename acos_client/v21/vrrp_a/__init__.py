@@ -26,12 +26,12 @@ class VRRPA(base.BaseV21):
     # For status args
     @property
     def vrrpa_global(self):
-        return VRRPAGlobal(self.client)
+        return self._child(VRRPAGlobal)
 
     @property
     def interface(self):
-        return VRRPAInterface(self.client)
+        return self._child(VRRPAInterface)
 
     @property
     def failover_policy(self):
-        return VRRPAFailoverPolicy(self.client)
+        return self._child(VRRPAFailoverPolicy)
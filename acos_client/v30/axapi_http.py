@@ -15,14 +15,20 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-import json
 import logging
 from requests.adapters import HTTPAdapter
 from requests import Session
+from requests import exceptions as requests_exceptions
 import six
+import threading
 
 import acos_client
+from acos_client.circuit_breaker import CircuitBreaker
+from acos_client.singleflight import SingleFlight
+from acos_client import jsoncodec
+from acos_client import jsonstream
 from acos_client import logutils
+from acos_client import utils
 from acos_client.v30 import responses as acos_responses
 
 LOG = logging.getLogger(__name__)
@@ -38,7 +44,9 @@ class HttpClient(object):
         "User-Agent": "ACOS-Client-AGENT-%s" % acos_client.VERSION,
     }
 
-    def __init__(self, host, port=None, protocol="https", max_retries=3, timeout=5):
+    def __init__(self, host, port=None, protocol="https", max_retries=3, timeout=5,
+                 pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True,
+                 circuit_breaker=None, codec=None):
         if port is None:
             if protocol is 'http':
                 self.port = 80
@@ -47,15 +55,83 @@ class HttpClient(object):
         else:
             self.port = port
 
+        self.protocol = protocol
         self.url_base = "%s://%s:%s" % (protocol, host, self.port)
         self.max_retries = max_retries
         self.timeout = timeout
 
+        # Connection pool settings for the long-lived session; see session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Shared by every call to this host:port
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+        # JSON library for payloads and responses; see acos_client.jsoncodec
+        self.codec = codec or jsoncodec.default()
+
+        # Identical GETs in flight at once share one request; see BaseV30._get
+        self.inflight = SingleFlight()
+
+    def _new_session(self, max_retries):
+        session = Session()
+        session.mount('%s://' % self.protocol, HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=max_retries))
+        return session
+
+    @property
+    def session(self):
+        """Pooled requests.Session shared by every call on this client.
+
+        Created on first use so that building a Client never touches the
+        network; connections are kept alive between calls until close().
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._new_session(self.max_retries)
+        return self._session
+
+    def connection_stats(self):
+        """Count connections opened and requests sent by the pooled session.
+
+        requests much greater than connections means keep-alive is working.
+        """
+        stats = {'connections': 0, 'requests': 0}
+        if self._session is None:
+            return stats
+        for adapter in self._session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                stats['connections'] += pool.num_connections
+                stats['requests'] += pool.num_requests
+        return stats
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def request(self, method, api_url, params={}, headers=None,
-                file_name=None, file_content=None, axapi_args=None, **kwargs):
-        LOG.debug("axapi_http: full url = %s", self.url_base + api_url)
-        LOG.debug("axapi_http: %s url = %s", method, api_url)
-        LOG.debug("axapi_http: params = %s", json.dumps(logutils.clean(params), indent=4))
+                file_name=None, file_content=None, axapi_args=None, stream=False, **kwargs):
+        # With stream=True the result is an iterable of (list_key, item) for
+        # the response's "*-list" arrays, decoded as the body arrives.
+        # Wire tracing is skipped entirely unless DEBUG is enabled
+        trace = LOG.isEnabledFor(logging.DEBUG)
+        if trace:
+            LOG.debug("axapi_http: full url = %s", self.url_base + api_url)
+            LOG.debug("axapi_http: %s url = %s", method, api_url)
+            LOG.debug("axapi_http: params = %s", logutils.Dump(params, indent=4))
 
         valid_http_codes = [200, 204]
 
@@ -64,13 +140,14 @@ class HttpClient(object):
             formatted_axapi_args = dict(
                 [(k.replace('_', '-'), v) for k, v in six.iteritems(axapi_args)]
             )
-            params = acos_client.v21.axapi_http.merge_dicts(params, formatted_axapi_args)
+            params = utils.merge_dicts(params, formatted_axapi_args)
 
         # Set data" variable for the request
         if params:
             params_copy = params.copy()
-            LOG.debug("axapi_http: params_all = %s", logutils.clean(params_copy))
-            payload = json.dumps(params_copy)
+            if trace:
+                LOG.debug("axapi_http: params_all = %s", logutils.Dump(params_copy))
+            payload = self.codec.dumps(params_copy)
         else:
             payload = None
 
@@ -83,9 +160,12 @@ class HttpClient(object):
 
         # Set "headers" variable for the request
         request_headers = self.HEADERS.copy()
+        if not self.keep_alive:
+            request_headers["Connection"] = "close"
         if headers:
             request_headers.update(headers)
-        LOG.debug("axapi_http: headers = %s", json.dumps(logutils.clean(request_headers), indent=4))
+        if trace:
+            LOG.debug("axapi_http: headers = %s", logutils.Dump(request_headers, indent=4))
 
         # Process files if passed as a parameter
         if file_name is not None:
@@ -96,12 +176,19 @@ class HttpClient(object):
             request_headers.pop("Content-type", None)
             request_headers.pop("Content-Type", None)
 
-        # Create session to set HTTPAdapter or SSLAdapter and set max_retries
-        session = Session()
-        if self.port == 443:
-            session.mount('https://', HTTPAdapter(max_retries=max_retries))
+        # Fail fast before building anything that would need cleaning up
+        self.circuit_breaker.before_call()
+
+        # Reuse the pooled session unless this call overrides max_retries,
+        # which is bound to the adapter and so needs a one-off session.
+        if max_retries == self.max_retries:
+            session = self.session
+            one_off = False
         else:
-            session.mount('http://', HTTPAdapter(max_retries=max_retries))
+            session = self._new_session(max_retries)
+            one_off = True
+            # Closing the one-off session would cut a streamed body short
+            stream = False
         session_request = getattr(session, method.lower())
 
         # Make actual request and handle any errors
@@ -112,22 +199,36 @@ class HttpClient(object):
                 )
             else:
                 device_response = session_request(
-                    self.url_base + api_url, verify=False, data=payload, headers=request_headers, timeout=timeout
+                    self.url_base + api_url, verify=False, data=payload, headers=request_headers, timeout=timeout,
+                    stream=stream
                 )
+        except (requests_exceptions.ConnectionError, requests_exceptions.Timeout) as e:
+            self.circuit_breaker.record_failure()
+            LOG.error("acos_client failing with error %s after %s retries", e.__class__.__name__, max_retries)
+            raise e
         except (Exception) as e:
+            # No response came back, so this says nothing about the device
+            self.circuit_breaker.release()
             LOG.error("acos_client failing with error %s after %s retries", e.__class__.__name__, max_retries)
             raise e
+        else:
+            self.circuit_breaker.record_success()
         finally:
-            session.close()
+            if one_off:
+                session.close()
+
+        if stream and device_response.status_code == 200:
+            return jsonstream.ListStream(device_response)
 
         # Validate json response
         try:
-            json_response = device_response.json()
-            LOG.debug("axapi_http: data = %s", json.dumps(logutils.clean(json_response), indent=4))
+            json_response = self.codec.loads(device_response.content)
+            if trace:
+                LOG.debug("axapi_http: data = %s", logutils.Dump(json_response, indent=4))
         except ValueError as e:
             # The response is not JSON but it still succeeded.
             if device_response.status_code in valid_http_codes:
-                return device_response.text
+                return iter(()) if stream else device_response.text
             else:
                 raise e
 
@@ -140,6 +241,8 @@ class HttpClient(object):
         if 'authorizationschema' in json_response:
             acos_responses.raise_axapi_auth_error(json_response, method, api_url, headers)
 
+        if stream:
+            return jsonstream.lists_in(json_response)
         return json_response
 
     def get(self, api_url, params={}, headers=None, **kwargs):
@@ -15,64 +15,191 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import ipaddress
+import json
 import six
-import time
 
 from acos_client import errors as ae
+from acos_client import response_cache
+from acos_client import retry
 
 
 class BaseV30(object):
 
+    # Objects per list request for the *_many() bulk operations
+    BULK_CHUNK_SIZE = 100
+
+    # How many times _request retries each retryable error; delays and
+    # the overall deadline come from the client's RetryPolicy.
+    RETRY_LIMITS = {
+        ae.ConfigManagerNotReady: 24,
+        ae.InvalidSessionID: 5,
+    }
+
     def __init__(self, client):
         self.client = client
         self.http = client.http
-        self.auth_header = {}
+        # Sub-resources, built on first access and then reused
+        self._children = {}
+
+    def _child(self, cls):
+        """Return the cls sub-resource of this resource, creating it once."""
+        try:
+            return self._children[cls]
+        except KeyError:
+            return self._children.setdefault(cls, cls(self.client))
 
     def minimal_dict(self, my_dict, exclude=[]):
         return dict((k, v) for k, v in my_dict.items() if v is not None or k in exclude)
 
+    def _optimistic(self, kwargs):
+        """Pop the per-call 'optimistic' flag, defaulting to the client's.
+
+        Optimistic creates skip the existence GET and rely on the device
+        rejecting the duplicate POST, which raises Exists.
+        """
+        optimistic = kwargs.pop('optimistic', None)
+        if optimistic is None:
+            optimistic = getattr(self.client, 'optimistic', False) is True
+        return optimistic
+
     def url(self, action):
-        self.auth_header['Authorization'] = "A10 %s" % self.client.session.id
         return ("/axapi/v3" + action)
 
-    def _request(self, method, action, params, retry_count=0, **kwargs):
-        if retry_count > 24:
-            raise ae.ACOSUnknownError()
+    def _coalesce(self):
+        return getattr(self.client, 'coalesce_gets', False) is True
 
+    def _request(self, method, action, params, **kwargs):
+        if method == 'GET':
+            return self._send(method, action, params, **kwargs)
         try:
-            return self.client.http.request(method, self.url(action), params,
-                                            self.auth_header, **kwargs)
-        except (ae.InvalidSessionID, ae.ConfigManagerNotReady) as e:
-            if type(e) == ae.ConfigManagerNotReady:
-                retry_limit = 24
-                sleep_secs = 5
-            else:
-                retry_limit = 5
-                sleep_secs = 1.0
-
-            if retry_count < retry_limit:
-                time.sleep(sleep_secs)
-                try:
-                    p = self.client.current_partition
-                    self.client.session.close()
-                    self.client.partition.active(p)
-                except Exception:
-                    pass
-                return self._request(method, action, params, retry_count + 1, **kwargs)
-            raise e
+            return self._send(method, action, params, **kwargs)
+        finally:
+            # Even a failed write may have changed something
+            if self._coalesce():
+                self.http.inflight.forget()
+            cache = response_cache.cache_for(self.client)
+            if cache is not None:
+                cache.invalidate(self.client.http.url_base, action)
+
+    def _send(self, method, action, params, **kwargs):
+        policy = retry.policy_for(self.client)
+        budget = policy.budget(self.client.http.url_base)
+        attempt, started = retry.begin()
+
+        partition = self.client.current_partition
+        sessions = self.client.session
+        session = sessions.acquire()
+        try:
+            # Other threads may share this session, but only in partition
+            with session.using(partition):
+                while True:
+                    session_id = session.id
+                    auth_header = {'Authorization': "A10 %s" % session_id}
+                    try:
+                        # A fresh or pooled session may not be in our partition yet
+                        session.activate(partition)
+                        r = self.client.http.request(method, self.url(action), params,
+                                                     auth_header, **kwargs)
+                    except (ae.InvalidSessionID, ae.ConfigManagerNotReady) as e:
+                        delay = None
+                        if attempt < self.RETRY_LIMITS.get(type(e), 0):
+                            delay = policy.next_delay(attempt, started)
+                        if delay is None or not budget.withdraw():
+                            raise
+
+                        attempt += 1
+                        try:
+                            session.reset(session_id)
+                        except Exception:
+                            pass
+                        retry.wait(delay, attempt, started)
+                        continue
+
+                    budget.deposit()
+                    return r
+        finally:
+            sessions.release(session)
 
     def _get(self, action, params={}, **kwargs):
-        return self._request('GET', action, params, **kwargs)
+        # cache=False reads from the device even with a response cache
+        use_cache = kwargs.pop('cache', True)
+        if kwargs.get('stream') or kwargs.get('axapi_args'):
+            return self._request('GET', action, params, **kwargs)
+        partition = self.client.current_partition
+
+        def get():
+            if not self._coalesce():
+                return self._request('GET', action, params, **kwargs)
+            key = (partition, action, json.dumps(params, sort_keys=True) if params else '')
+            return self.http.inflight.do(key, lambda: self._request('GET', action, params, **kwargs))
+
+        cache = response_cache.cache_for(self.client)
+        if cache is None or not use_cache:
+            return get()
+        return cache.fetch(self.client.http.url_base, partition, action, params, get)
 
     def _post(self, action, params={}, **kwargs):
         return self._request('POST', action, params, **kwargs)
 
+    def _iter_list(self, action, list_key=None, **kwargs):
+        """Yield the items of the "*-list" arrays in a GET of action.
+
+        The body is parsed while it is read, so only one item is held in
+        memory at a time. With list_key, items of other lists are skipped.
+        """
+        for key, item in self._get(action, stream=True, **kwargs):
+            if list_key is None or key == list_key:
+                yield item
+
     def _put(self, action, params={}, **kwargs):
         return self._request('PUT', action, params, **kwargs)
 
     def _delete(self, action, params={}, **kwargs):
         return self._request('DELETE', action, params, **kwargs)
 
+    def _post_list(self, url, list_key, items, chunk_size=None, exists_ok=False, **kwargs):
+        """POST objects to url as '<list_key>' payloads of chunk_size each.
+
+        items is a list of (item, body, fallback) where body is the object
+        as it appears in the list and fallback() writes that one object
+        alone. When a chunk is rejected its items are retried one at a time
+        so the failing ones can be identified; those are raised together
+        as PartialFailure.
+
+        List writes are not atomic: the device may have created the objects
+        before the one it rejected. For creates pass exists_ok=True so that
+        those come back from the fallback as Exists without being counted
+        as failures.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        failures = []
+        for i in six.moves.range(0, len(items), chunk_size):
+            chunk = items[i:i + chunk_size]
+            try:
+                self._post(url, {list_key: [body for item, body, fallback in chunk]}, **kwargs)
+            except ae.ACOSException:
+                for item, body, fallback in chunk:
+                    try:
+                        fallback()
+                    except ae.Exists as e:
+                        if not exists_ok:
+                            failures.append((item, e))
+                    except ae.ACOSException as e:
+                        failures.append((item, e))
+        if failures:
+            raise ae.PartialFailure(failures, len(items))
+
+    def _each(self, items, fn):
+        """Call fn(item) for every item, raising PartialFailure at the end."""
+        failures = []
+        for item in items:
+            try:
+                fn(item)
+            except ae.ACOSException as e:
+                failures.append((item, e))
+        if failures:
+            raise ae.PartialFailure(failures, len(items))
+
     def _is_ipv6(self, ip_address):
         validated_ip_address = ipaddress.ip_address(six.text_type(ip_address))
         return isinstance(validated_ip_address, ipaddress.IPv6Address)
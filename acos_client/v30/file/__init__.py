@@ -21,8 +21,8 @@ from acos_client.v30.file.ssl_key import SSLKey
 class File(base.BaseV30):
     @property
     def ssl_cert(self):
-        return SSLCert(self.client)
+        return self._child(SSLCert)
 
     @property
     def ssl_key(self):
-        return SSLKey(self.client)
+        return self._child(SSLKey)
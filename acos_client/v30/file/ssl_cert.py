@@ -55,7 +55,7 @@ class SSLCert(base.BaseV30):
                           file_content=cert, **kwargs)
 
     def create(self, file="", cert="", size="", certificate_type="", action="", **kwargs):
-        if self.exists(file):
+        if not self._optimistic(kwargs) and self.exists(file):
             raise acos_errors.Exists
 
         self._set(file, cert, size, certificate_type, action, **kwargs)
@@ -92,19 +92,19 @@ class Interface(base.BaseV30):
 
     @property
     def ethernet(self):
-        return EthernetInterface(self.client)
+        return self._child(EthernetInterface)
 
     @property
     def management(self):
-        return ManagementInterface(self.client)
+        return self._child(ManagementInterface)
 
     @property
     def lif(self):
-        return LogicalInterface(self.client)
+        return self._child(LogicalInterface)
 
     @property
     def ve(self):
-        return VirtualEthernet(self.client)
+        return self._child(VirtualEthernet)
 
 
 class EthernetInterface(Interface):
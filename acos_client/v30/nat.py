@@ -21,12 +21,12 @@ from acos_client.v30 import base
 class Nat(base.BaseV30):
     @property
     def pool(self):
-        return self.Pool(self.client)
+        return self._child(self.Pool)
 
     class Pool(base.BaseV30):
         url_prefix = "/ip/nat/pool/"
 
-        def _set(self, name, start_ip, end_ip, mask, ip_rr=None, vrid=None, **kwargs):
+        def _set(self, name, start_ip, end_ip, mask, ip_rr=None, vrid=None, update=None, **kwargs):
             params = {
                 "pool": self.minimal_dict(
                     {
@@ -44,7 +44,10 @@ class Nat(base.BaseV30):
             if vrid:
                 params["pool"]["vrid"] = vrid
 
-            if self.exists(name):
+            if update is None:
+                update = self.exists(name)
+
+            if update:
                 self._post(self.url_prefix + name, params, **kwargs)
             else:
                 self._post(self.url_prefix, params, **kwargs)
@@ -63,10 +66,10 @@ class Nat(base.BaseV30):
             return self._get(self.url_prefix)
 
         def create(self, name, start_ip, end_ip, mask, ip_rr, vrid, **kwargs):
-            if self.exists(name):
+            if not self._optimistic(kwargs) and self.exists(name):
                 raise acos_errors.Exists
 
-            self._set(name, start_ip, end_ip, mask, ip_rr, vrid, **kwargs)
+            self._set(name, start_ip, end_ip, mask, ip_rr, vrid, update=False, **kwargs)
 
         def delete(self, name, **kwargs):
             self._delete(self.url_prefix + name)
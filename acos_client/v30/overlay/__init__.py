@@ -21,8 +21,8 @@ from acos_client.v30.overlay.vtep import OverlayVtep
 class Overlay(base.BaseV30):
     @property
     def options(self):
-        return OverlayOptions(self.client)
+        return self._child(OverlayOptions)
 
     @property
     def vtep(self):
-        return OverlayVtep(self.client)
+        return self._child(OverlayVtep)
@@ -54,7 +54,7 @@ class Partition(base.BaseV30):
 
     def active(self, name='shared'):
         if self.client.current_partition != name:
-            self._post("/active-partition/" + name)
+            self.client.session.activate(name)
             self.client.current_partition = name
 
     def _next_available_id(self):
@@ -52,6 +52,10 @@ class RIB(base.BaseV30):
     def get_all(self):
         return self._get(self.url_prefix)
 
+    def iter_all(self, **kwargs):
+        """Like get_all(), but yields one route at a time."""
+        return self._iter_list(self.url_prefix, **kwargs)
+
     def _build_nexthops(self, nexthops):
         hops = []
         for ip, dist in nexthops:
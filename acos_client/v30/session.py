@@ -13,6 +13,16 @@
 #    under the License.
 
 
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import contextlib
+import six
+import threading
+
+from acos_client import session_cache
+
+
 class Session(object):
 
     def __init__(self, client, username, password):
@@ -21,13 +31,49 @@ class Session(object):
         self.username = username
         self.password = password
         self.session_id = None
+        # Partition active on the device for this session
+        self.partition = 'shared'
+        self._lock = threading.RLock()
+        # Calls in flight on this session and the partition they need
+        self._holds = 0
+        self._held_partition = None
+        self._holds_changed = threading.Condition(threading.Lock())
 
     @property
     def id(self):
+        return self._login(self.client.current_partition)
+
+    def _login(self, partition):
         if self.session_id is None:
-            self.authenticate(self.username, self.password)
+            # Only one caller logs in; the others wait and share its id
+            with self._lock:
+                if self.session_id is None:
+                    self._lease_or_authenticate(partition)
         return self.session_id
 
+    def _lease_or_authenticate(self, partition):
+        cache = session_cache.cache_for(self.client)
+        if cache is not None:
+            session_id = cache.lease(self._cache_key(partition))
+            if session_id is not None:
+                self.session_id = session_id
+                self.partition = partition
+                return
+        self.authenticate(self.username, self.password)
+
+    def _cache_key(self, partition):
+        return session_cache.cache_key(self.http.url_base, self.username, self.password, partition)
+
+    def acquire(self, timeout=None):
+        return self
+
+    def release(self, session):
+        pass
+
+    @contextlib.contextmanager
+    def checkout(self, timeout=None):
+        yield self
+
     def authenticate(self, username, password):
         url = "/axapi/v3/auth"
         payload = {
@@ -48,7 +94,65 @@ class Session(object):
 
         return r
 
+    def reset(self, stale_id):
+        """Drop a session id the device rejected.
+
+        Only the first caller holding stale_id logs off; callers arriving
+        after a new id was issued keep using it.
+        """
+        with self._lock:
+            if self.session_id == stale_id:
+                cache = session_cache.cache_for(self.client)
+                if cache is not None:
+                    cache.discard(stale_id)
+                self._logoff()
+
+    @contextlib.contextmanager
+    def using(self, partition):
+        """Keep this session in partition for the duration of the block.
+
+        Any number of threads can use the session in the same partition at
+        once. A thread needing another partition waits until they are done
+        before switching it, so no call runs in the wrong partition.
+        """
+        with self._holds_changed:
+            while self._holds and self._held_partition != partition:
+                self._holds_changed.wait()
+            self._holds += 1
+            self._held_partition = partition
+        try:
+            yield self
+        finally:
+            with self._holds_changed:
+                self._holds -= 1
+                if not self._holds:
+                    self._held_partition = None
+                    self._holds_changed.notify_all()
+
+    def activate(self, partition):
+        """Make partition the active partition for this session."""
+        with self.using(partition):
+            if self.partition != partition:
+                # A session lent by the cache may already be in partition
+                session_id = self._login(partition)
+                with self._lock:
+                    if self.partition == partition:
+                        return
+                    h = {'Authorization': "A10 %s" % session_id}
+                    self.http.post('/axapi/v3/active-partition/' + partition, headers=h)
+                    self.partition = partition
+
     def close(self):
+        cache = session_cache.cache_for(self.client)
+        if cache is not None and self.session_id is not None:
+            # Hand the session to the next client instead of logging off
+            if cache.release(self._cache_key(self.partition), self.session_id):
+                self.session_id = None
+                self.partition = 'shared'
+                return
+        return self._logoff()
+
+    def _logoff(self):
         try:
             self.client.partition.active()
         except Exception:
@@ -62,5 +166,144 @@ class Session(object):
             r = self.http.post('/axapi/v3/logoff', headers=h)
         finally:
             self.session_id = None
+            self.partition = 'shared'
 
         return r
+
+
+class SessionPool(object):
+    """A fixed number of AXAPI sessions, each used by one request at a time.
+
+    Sessions log in lazily the first time they are checked out, or all at
+    once with warm(). A session whose id the device rejects is re-created
+    on its own without disturbing the others.
+    """
+
+    def __init__(self, client, username, password, size=4):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.sessions = [Session(client, username, password) for i in six.moves.range(size)]
+        self._idle = six.moves.queue.LifoQueue()
+        for session in reversed(self.sessions):
+            self._idle.put(session)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    @property
+    def session_id(self):
+        for session in self.sessions:
+            if session.session_id is not None:
+                return session.session_id
+        return None
+
+    @property
+    def id(self):
+        return self.sessions[0].id
+
+    def acquire(self, timeout=None):
+        """Take an idle session, waiting up to timeout seconds for one."""
+        return self._idle.get(timeout=timeout)
+
+    def release(self, session):
+        self._idle.put(session)
+
+    @contextlib.contextmanager
+    def checkout(self, timeout=None):
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def warm(self):
+        """Log in every session that is not already authenticated."""
+        for session in self.sessions:
+            session.id
+
+    def activate(self, partition):
+        """Make partition active on one idle session."""
+        with self.checkout() as session:
+            session.activate(partition)
+
+    def authenticate(self, username, password):
+        return [session.authenticate(username, password) for session in self.sessions]
+
+    def close(self):
+        for session in self.sessions:
+            if session.session_id is not None:
+                session.close()
+
+
+class PartitionSessions(object):
+    """A separate session, or SessionPool, for every partition used.
+
+    Each partition's sessions are switched into it once, the first time
+    they are used, and stay there. Changing client.current_partition then
+    only changes which sessions the next request is routed to, without an
+    /active-partition round trip.
+    """
+
+    def __init__(self, client, username, password, size=None):
+        self.client = client
+        self.username = username
+        self.password = password
+        self.size = size
+        self.partitions = {}
+        # Session -> the Session or SessionPool it is released to
+        self._owners = {}
+        self._lock = threading.Lock()
+
+    def sessions_for(self, partition):
+        """Return the Session or SessionPool for partition, creating it."""
+        with self._lock:
+            sessions = self.partitions.get(partition)
+            if sessions is None:
+                if self.size:
+                    sessions = SessionPool(self.client, self.username, self.password, self.size)
+                    members = sessions.sessions
+                else:
+                    sessions = Session(self.client, self.username, self.password)
+                    members = [sessions]
+                for session in members:
+                    self._owners[session] = sessions
+                self.partitions[partition] = sessions
+            return sessions
+
+    @property
+    def session_id(self):
+        for sessions in list(self.partitions.values()):
+            if sessions.session_id is not None:
+                return sessions.session_id
+        return None
+
+    @property
+    def id(self):
+        return self.sessions_for(self.client.current_partition).id
+
+    def acquire(self, timeout=None):
+        return self.sessions_for(self.client.current_partition).acquire(timeout)
+
+    def release(self, session):
+        self._owners[session].release(session)
+
+    @contextlib.contextmanager
+    def checkout(self, timeout=None):
+        session = self.acquire(timeout)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def activate(self, partition):
+        """Log in partition's session and switch it into partition."""
+        self.sessions_for(partition).activate(partition)
+
+    def authenticate(self, username, password):
+        return [sessions.authenticate(username, password) for sessions in list(self.partitions.values())]
+
+    def close(self):
+        for sessions in list(self.partitions.values()):
+            if sessions.session_id is not None:
+                sessions.close()
@@ -24,15 +24,15 @@ class SFlow(base.BaseV30):
 
     @property
     def collector(self):
-        return SFlowCollector(self.client)
+        return self._child(SFlowCollector)
 
     @property
     def setting(self):
-        return SFlowSetting(self.client)
+        return self._child(SFlowSetting)
 
     @property
     def polling(self):
-        return SFlowPolling(self.client)
+        return self._child(SFlowPolling)
 
 
 class SFlowSetting(base.BaseV30):
@@ -78,7 +78,7 @@ class SFlowCollectorIP(base.BaseV30):
 class SFlowCollector(base.BaseV30):
     @property
     def ip(self):
-        return SFlowCollectorIP(self.client)
+        return self._child(SFlowCollectorIP)
 
 
 class SFlowPolling(base.BaseV30):
@@ -16,8 +16,10 @@ import acos_client.v30.base as base
 
 from acos_client.v30.slb.common import SLBCommon
 from acos_client.v30.slb.hm import HealthMonitor
+from acos_client.v30.slb.reconcile import Reconciler
 from acos_client.v30.slb.server import Server
 from acos_client.v30.slb.service_group import ServiceGroup
+from acos_client.v30.slb.snapshot import SLBSnapshot
 from acos_client.v30.slb.template import Template
 from acos_client.v30.slb.virtual_server import VirtualServer
 
@@ -29,27 +31,43 @@ class SLB(base.BaseV30):
 
     @property
     def hm(self):
-        return HealthMonitor(self.client)
+        return self._child(HealthMonitor)
 
     @property
     def server(self):
-        return Server(self.client)
+        return self._child(Server)
 
     @property
     def service_group(self):
-        return ServiceGroup(self.client)
+        return self._child(ServiceGroup)
 
     @property
     def template(self):
-        return Template(self.client)
+        return self._child(Template)
 
     @property
     def virtual_server(self):
-        return VirtualServer(self.client)
+        return self._child(VirtualServer)
 
     @property
     def common(self):
-        return SLBCommon(self.client)
+        return self._child(SLBCommon)
+
+    @property
+    def reconciler(self):
+        return self._child(Reconciler)
 
     def all(self):
         return self._get('/slb/')
+
+    def snapshot(self):
+        """Fetch the SLB configuration once and return it as an SLBSnapshot."""
+        return SLBSnapshot(self, self._get('/slb/', cache=False))
+
+    def iter_all(self, **kwargs):
+        """Yield (list_key, item) for every object in the SLB config.
+
+        The response is parsed as it is read, so the whole configuration
+        is never held in memory at once.
+        """
+        return self._get('/slb/', stream=True, **kwargs)
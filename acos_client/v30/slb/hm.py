@@ -112,12 +112,13 @@ class HealthMonitor(base.BaseV30):
 
     def create(self, name, mon_type, interval, timeout, max_retries,
                method=None, url=None, expect_code=None, port=None, **kwargs):
-        try:
-            self.get(name)
-        except acos_errors.NotFound:
-            pass
-        else:
-            raise acos_errors.Exists()
+        if not self._optimistic(kwargs):
+            try:
+                self.get(name)
+            except acos_errors.NotFound:
+                pass
+            else:
+                raise acos_errors.Exists()
 
         self._set(self.url_prefix, name, mon_type, interval, timeout,
                   max_retries, method, url, expect_code, port, **kwargs)
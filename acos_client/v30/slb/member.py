@@ -13,6 +13,7 @@
 #    under the License.
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import functools
 import six
 
 
@@ -45,6 +46,23 @@ class Member(base.BaseV30):
         )
         return self._get(url + 'oper', **kwargs)
 
+    def _params(self, server_name, server_port, status=STATUS_ENABLE, member_state=True,
+                config_defaults=None, **kwargs):
+        params = {
+            "member": self.minimal_dict({
+                "name": server_name,
+                "port": int(server_port),
+                # flip status code, becuase it's a disable flag in v30
+                "member-stats-data-disable": status,
+                "member-state": member_state and 'enable' or 'disable',
+            })
+        }
+
+        if config_defaults:
+            for k, v in six.iteritems(config_defaults):
+                params['member'][k] = v
+        return params
+
     def _write(self,
                service_group_name,
                server_name,
@@ -60,21 +78,8 @@ class Member(base.BaseV30):
                 port=server_port
             )
 
-        params = {
-            "member": self.minimal_dict({
-                "name": server_name,
-                "port": int(server_port),
-                # flip status code, becuase it's a disable flag in v30
-                "member-stats-data-disable": status,
-                "member-state": member_state and 'enable' or 'disable',
-            })
-        }
-
-        config_defaults = kwargs.get("config_defaults")
-
-        if config_defaults:
-            for k, v in six.iteritems(config_defaults):
-                params['member'][k] = v
+        params = self._params(server_name, server_port, status, member_state,
+                              kwargs.get("config_defaults"))
         self._post(url, params, **kwargs)
 
     def create(self,
@@ -83,12 +88,13 @@ class Member(base.BaseV30):
                server_port,
                status=STATUS_ENABLE,
                member_state=True, **kwargs):
-        try:
-            self.get(service_group_name, server_name, server_port)
-        except acos_errors.NotFound:
-            pass
-        else:
-            raise acos_errors.Exists()
+        if not self._optimistic(kwargs):
+            try:
+                self.get(service_group_name, server_name, server_port)
+            except acos_errors.NotFound:
+                pass
+            else:
+                raise acos_errors.Exists()
 
         self._write(service_group_name,
                     server_name, server_port, status, member_state, **kwargs)
@@ -109,3 +115,30 @@ class Member(base.BaseV30):
             port=server_port
         )
         self._delete(url)
+
+    def _many(self, service_group_name, members, update=False, chunk_size=None, **kwargs):
+        items = []
+        for member in members:
+            params = self._params(**member)
+            fallback = functools.partial(self._write, service_group_name, update=update,
+                                         **dict(member, **kwargs))
+            items.append((member, params['member'], fallback))
+        url = self.url_base_tmpl.format(gname=service_group_name)
+        self._post_list(url, 'member-list', items, chunk_size, exists_ok=not update, **kwargs)
+
+    def create_many(self, service_group_name, members, chunk_size=None, **kwargs):
+        """Add members with member-list requests of chunk_size each.
+
+        members is a list of dicts of create() arguments, e.g.
+        {'server_name': 's1', 'server_port': 80}. There is no existence
+        check. Raises PartialFailure naming the members that failed.
+        """
+        self._many(service_group_name, members, False, chunk_size, **kwargs)
+
+    def update_many(self, service_group_name, members, chunk_size=None, **kwargs):
+        """Update members with member-list requests; see create_many()."""
+        self._many(service_group_name, members, True, chunk_size, **kwargs)
+
+    def delete_many(self, service_group_name, members):
+        """Delete (server_name, server_port) members, raising PartialFailure for failures."""
+        self._each(members, lambda m: self.delete(service_group_name, *m))
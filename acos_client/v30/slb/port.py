@@ -11,6 +11,7 @@
 #    under the License.
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import functools
 
 from acos_client.v30 import base
 
@@ -33,10 +34,8 @@ class Port(base.BaseV30):
 
         return self._delete(url)
 
-    def _set(self, server_name, port, protocol, update=False, **kwargs):
-        url = self.url_base_tmpl.format(server=server_name)
-
-        params = {
+    def _params(self, port, protocol, **kwargs):
+        return {
             "port": {
                 "conn-resume": kwargs.get("conn_resume", None),
                 "conn-limit": kwargs.get("conn_limit", 8000000),
@@ -49,9 +48,39 @@ class Port(base.BaseV30):
             }
         }
 
+    def _set(self, server_name, port, protocol, update=False, **kwargs):
+        url = self.url_base_tmpl.format(server=server_name)
+        params = self._params(port, protocol, **kwargs)
+
         if update:
             url += self.url_port_tmpl.format(port=port, protocol=protocol)
 
             return self._put(url, params, **kwargs)
         else:
             return self._post(url, params, **kwargs)
+
+    def _many(self, server_name, ports, update=False, chunk_size=None, **kwargs):
+        items = []
+        for port in ports:
+            params = self._params(**port)
+            fallback = functools.partial(self._set, server_name, update=update, **dict(port, **kwargs))
+            items.append((port, params['port'], fallback))
+        url = self.url_base_tmpl.format(server=server_name)
+        self._post_list(url, 'port-list', items, chunk_size, exists_ok=not update, **kwargs)
+
+    def create_many(self, server_name, ports, chunk_size=None, **kwargs):
+        """Add ports to a server with port-list requests of chunk_size each.
+
+        ports is a list of dicts of create() arguments, e.g.
+        {'port': 80, 'protocol': 'tcp'}. Raises PartialFailure naming the
+        ports that failed.
+        """
+        self._many(server_name, ports, False, chunk_size, **kwargs)
+
+    def update_many(self, server_name, ports, chunk_size=None, **kwargs):
+        """Update ports with port-list requests; see create_many()."""
+        self._many(server_name, ports, True, chunk_size, **kwargs)
+
+    def delete_many(self, server_name, ports):
+        """Delete (port, protocol) ports, raising PartialFailure for failures."""
+        self._each(ports, lambda p: self.delete(server_name, *p))
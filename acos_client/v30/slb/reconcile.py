@@ -0,0 +1,186 @@
+# Copyright 2014,  Jeff Buttars,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+
+import six
+
+from acos_client import errors as acos_errors
+from acos_client.v30 import base
+
+# One configuration change; see Reconciler.plan()
+Change = collections.namedtuple('Change', ['action', 'kind', 'key', 'url', 'body'])
+
+_Kind = collections.namedtuple('_Kind', ['list_key', 'body_key', 'collection', 'key_fields', 'children'])
+
+# Object types in dependency order: each may refer to those before it.
+# collection is formatted with the parent object's name.
+KINDS = collections.OrderedDict([
+    ('health-monitor', _Kind('monitor-list', 'monitor', '/health/monitor/', ('name',), {})),
+    ('server', _Kind('server-list', 'server', '/slb/server/', ('name',), {'port-list': 'server-port'})),
+    ('server-port', _Kind('port-list', 'port', '/slb/server/{}/port/', ('port-number', 'protocol'), {})),
+    ('service-group', _Kind('service-group-list', 'service-group', '/slb/service-group/', ('name',),
+                            {'member-list': 'member'})),
+    ('member', _Kind('member-list', 'member', '/slb/service-group/{}/member/', ('name', 'port'), {})),
+    ('virtual-server', _Kind('virtual-server-list', 'virtual-server', '/slb/virtual-server/', ('name',),
+                             {'port-list': 'vport'})),
+    ('vport', _Kind('port-list', 'port', '/slb/virtual-server/{}/port/', ('port-number', 'protocol'), {})),
+])
+
+TOP_LEVEL = ('health-monitor', 'server', 'service-group', 'virtual-server')
+
+_RANK = dict((name, i) for i, name in enumerate(KINDS))
+
+
+def _contains(current, desired):
+    """True if every field in desired has the same value in current."""
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(
+            k in current and _contains(current[k], v) for k, v in six.iteritems(desired))
+    if isinstance(desired, list):
+        if not isinstance(current, list) or len(current) != len(desired):
+            return False
+        return all(_contains(c, d) for c, d in six.moves.zip(current, desired))
+    return current == desired
+
+
+class Reconciler(base.BaseV30):
+    """Bring the SLB configuration to a declared state with minimal calls.
+
+    The spec has the shape of an AXAPI /slb/ response: any of
+    'monitor-list', 'server-list', 'service-group-list' and
+    'virtual-server-list', with servers, service groups and virtual
+    servers carrying their 'port-list' or 'member-list'. Objects are
+    matched on their keys (name; name and port for members; port-number
+    and protocol for ports) and only the fields given in the spec are
+    compared, so device defaults do not show up as differences.
+
+    The current state is read with one /slb/ GET, plus one for health
+    monitors if the spec lists any, so a reconcile that changes nothing
+    costs two requests whatever the size of the configuration.
+    """
+
+    def plan(self, spec, prune=False):
+        """Return the Changes that would make the device match spec.
+
+        Children (ports, members) missing from an object that lists them
+        are deleted. Top-level objects missing from a list in the spec are
+        only deleted with prune=True; object types the spec leaves out are
+        never touched. Creates and updates come in dependency order,
+        followed by deletes in the reverse order.
+        """
+        if 'slb' in spec:
+            spec = dict(spec['slb'], **dict((k, v) for k, v in six.iteritems(spec) if k != 'slb'))
+
+        current = self._current(spec)
+        changes = []
+        for name in TOP_LEVEL:
+            list_key = KINDS[name].list_key
+            if list_key in spec:
+                self._diff(name, None, spec[list_key], current.get(list_key, []), prune, changes)
+
+        writes = [c for c in changes if c.action != 'delete']
+        deletes = [c for c in changes if c.action == 'delete']
+        writes.sort(key=lambda c: _RANK[c.kind])
+        deletes.sort(key=lambda c: -_RANK[c.kind])
+        return writes + deletes
+
+    def apply(self, changes, chunk_size=None):
+        """Make the changes, stopping at the first that fails.
+
+        Consecutive creates in one collection are sent as list requests
+        of chunk_size objects; see BaseV30._post_list.
+        """
+        i = 0
+        while i < len(changes):
+            change = changes[i]
+            kind = KINDS[change.kind]
+            if change.action == 'create':
+                batch = [change]
+                for later in changes[i + 1:]:
+                    if later.action != 'create' or later.url != change.url:
+                        break
+                    batch.append(later)
+                items = [(c, c.body, self._writer(c.url, kind.body_key, c.body)) for c in batch]
+                self._post_list(change.url, kind.list_key, items, chunk_size, exists_ok=True)
+                i += len(batch)
+                continue
+            if change.action == 'update':
+                self._post(change.url, {kind.body_key: change.body})
+            else:
+                try:
+                    self._delete(change.url)
+                except acos_errors.NotFound:
+                    pass
+            i += 1
+
+    def reconcile(self, spec, prune=False, dry_run=False, chunk_size=None):
+        """Plan and apply the changes for spec; returns the Changes."""
+        changes = self.plan(spec, prune=prune)
+        if not dry_run:
+            self.apply(changes, chunk_size=chunk_size)
+        return changes
+
+    def _writer(self, url, body_key, body):
+        return lambda: self._post(url, {body_key: body})
+
+    def _current(self, spec):
+        snapshot = self.client.slb.snapshot()
+        current = {
+            'server-list': list(snapshot.servers.values()),
+            'service-group-list': list(snapshot.service_groups.values()),
+            'virtual-server-list': list(snapshot.virtual_servers.values()),
+        }
+        if 'monitor-list' in spec:
+            r = self._get(KINDS['health-monitor'].collection, cache=False)
+            current['monitor-list'] = r.get('monitor-list', []) if isinstance(r, dict) else []
+        return current
+
+    def _key(self, name, obj):
+        try:
+            return tuple(obj[f] for f in KINDS[name].key_fields)
+        except KeyError:
+            raise ValueError("%s %r needs %s" % (name, obj, ' and '.join(KINDS[name].key_fields)))
+
+    def _diff(self, name, parent, desired, current, prune, changes):
+        kind = KINDS[name]
+        collection = kind.collection.format(parent)
+        prefix = (parent,) if parent is not None else ()
+        existing = dict((self._key(name, obj), obj) for obj in current)
+        seen = set()
+
+        for obj in desired:
+            key = self._key(name, obj)
+            seen.add(key)
+            url = collection + '+'.join(six.text_type(k) for k in key)
+            cur = existing.get(key)
+            if cur is None:
+                # New objects are created together with their children
+                changes.append(Change('create', name, prefix + key, collection, obj))
+                continue
+
+            fields = dict((k, v) for k, v in six.iteritems(obj) if k not in kind.children)
+            if not _contains(cur, fields):
+                changes.append(Change('update', name, prefix + key, url, fields))
+            for list_key, child in six.iteritems(kind.children):
+                if list_key in obj:
+                    self._diff(child, key[0], obj[list_key], cur.get(list_key, []), True, changes)
+
+        if prune:
+            for key in existing:
+                if key not in seen:
+                    url = collection + '+'.join(six.text_type(k) for k in key)
+                    changes.append(Change('delete', name, prefix + key, url, None))
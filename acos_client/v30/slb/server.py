@@ -13,6 +13,7 @@
 #    under the License.
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import functools
 import six
 
 
@@ -28,7 +29,11 @@ class Server(base.BaseV30):
     def get(self, name, **kwargs):
         return self._get(self.url_prefix + name, **kwargs)
 
-    def create(self, name, ip_address, status=1, server_templates=None, **kwargs):
+    def iter_all(self, **kwargs):
+        """Yield every server, one at a time as the response is read."""
+        return self._iter_list(self.url_prefix, 'server-list', **kwargs)
+
+    def _params(self, name, ip_address, status=1, server_templates=None, config_defaults=None, **kwargs):
         params = {
             "server": {
                 "name": name,
@@ -47,40 +52,30 @@ class Server(base.BaseV30):
             server_templates = {k: v for k, v in server_templates.items() if v}
             params['server']['template-server'] = server_templates.get('template-server', None)
 
-        config_defaults = kwargs.get("config_defaults")
-
         if config_defaults:
             for k, v in six.iteritems(config_defaults):
                 params['server'][k] = v
 
+        return params
+
+    def create(self, name, ip_address, status=1, server_templates=None, **kwargs):
+        params = self._params(name, ip_address, status, server_templates, **kwargs)
+
         # Two creates in a row apparently works in ACOS 4.0; stop that
-        try:
-            self.get(name, **kwargs)
-        except acos_errors.NotFound:
-            pass
-        else:
-            raise acos_errors.Exists()
+        if not self._optimistic(kwargs):
+            try:
+                self.get(name, **kwargs)
+            except acos_errors.NotFound:
+                pass
+            else:
+                raise acos_errors.Exists()
 
         return self._post(self.url_prefix, params, **kwargs)
 
     def update(self, name, ip_address, status=1, server_templates=None, **kwargs):
-        params = {
-            "server": {
-                "name": name,
-                "action": 'enable' if status else 'disable',
-                "conn-resume": kwargs.get("conn_resume", None),
-                "conn-limit": kwargs.get("conn_limit", 8000000),
-            }
-        }
-
-        if self._is_ipv6(ip_address):
-            params['server']['server-ipv6-addr'] = ip_address
-        else:
-            params['server']['host'] = ip_address
-
-        if server_templates:
-            server_templates = {k: v for k, v in server_templates.items() if v}
-            params['server']['template-server'] = server_templates.get('template-server', None)
+        params = self._params(name, ip_address, status, server_templates,
+                              conn_resume=kwargs.get("conn_resume"),
+                              conn_limit=kwargs.get("conn_limit", 8000000))
 
         self.get(name, **kwargs)
 
@@ -89,6 +84,32 @@ class Server(base.BaseV30):
     def delete(self, name):
         return self._delete(self.url_prefix + name)
 
+    def _many(self, servers, update=False, chunk_size=None, **kwargs):
+        items = []
+        for server in servers:
+            params = self._params(**server)
+            url = self.url_prefix + server['name'] if update else self.url_prefix
+            fallback = functools.partial(self._post, url, params, **kwargs)
+            items.append((server, params['server'], fallback))
+        self._post_list(self.url_prefix, 'server-list', items, chunk_size, exists_ok=not update, **kwargs)
+
+    def create_many(self, servers, chunk_size=None, **kwargs):
+        """Create servers with server-list requests of chunk_size each.
+
+        servers is a list of dicts of create() arguments, e.g.
+        {'name': 's1', 'ip_address': '10.0.0.1'}. There is no existence
+        check. Raises PartialFailure naming the servers that failed.
+        """
+        self._many(servers, False, chunk_size, **kwargs)
+
+    def update_many(self, servers, chunk_size=None, **kwargs):
+        """Update servers with server-list requests; see create_many()."""
+        self._many(servers, True, chunk_size, **kwargs)
+
+    def delete_many(self, names):
+        """Delete servers by name, raising PartialFailure for any that fail."""
+        self._each(names, self.delete)
+
     @property
     def port(self):
-        return Port(self.client)
+        return self._child(Port)
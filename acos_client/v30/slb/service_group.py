@@ -26,7 +26,7 @@ class ServiceGroup(base.BaseV30):
 
     @property
     def member(self):
-        return Member(self.client)
+        return self._child(Member)
 
     # Valid LB methods
     ROUND_ROBIN = 'round-robin'
@@ -124,13 +124,26 @@ class ServiceGroup(base.BaseV30):
     def all_oper(self, *args, **kwargs):
         return self._get(self.url_prefix + "oper", **kwargs)
 
+    def iter_all(self, **kwargs):
+        """Like all(), but yields one service group at a time."""
+        return self._iter_list(self.url_prefix, 'service-group-list', **kwargs)
+
+    def iter_stats(self, **kwargs):
+        """Like all_stats(), but yields one service group at a time."""
+        return self._iter_list(self.url_prefix + "stats", 'service-group-list', **kwargs)
+
+    def iter_oper(self, **kwargs):
+        """Like all_oper(), but yields one service group at a time."""
+        return self._iter_list(self.url_prefix + "oper", 'service-group-list', **kwargs)
+
     def create(self, name, protocol=TCP, lb_method=ROUND_ROBIN, service_group_templates=None, **kwargs):
-        try:
-            self.get(name)
-        except acos_errors.NotFound:
-            pass
-        else:
-            raise acos_errors.Exists
+        if not self._optimistic(kwargs):
+            try:
+                self.get(name)
+            except acos_errors.NotFound:
+                pass
+            else:
+                raise acos_errors.Exists
 
         return self._set(name, protocol, lb_method, service_group_templates, **kwargs)
 
@@ -0,0 +1,116 @@
+# Copyright 2014,  Jeff Buttars,  A10 Networks.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import collections
+
+
+class SLBSnapshot(object):
+    """Indexed view of the SLB configuration from a single /slb/ fetch.
+
+    Objects are the dicts AXAPI returned. Every index is a plain dict:
+
+        servers                  name -> server
+        servers_by_ip            host or server-ipv6-addr -> server
+        service_groups           name -> service group
+        members                  (group, server, port) -> member
+        groups_by_member         (server, port) -> set of group names
+        groups_by_server         server -> set of group names
+        virtual_servers          name -> virtual server
+        virtual_servers_by_ip    ip-address or ipv6-address -> virtual server
+        vports                   (virtual server, port-number, protocol) -> vport
+        vport_service_group      (virtual server, port-number, protocol) -> group name
+        vports_by_service_group  group -> set of vport keys
+
+    Lookups for objects that are not configured raise KeyError; use
+    .get() where absence is expected. The snapshot reflects the partition
+    active when it was taken and is not updated by later writes; call
+    refresh() for the object type that changed. Both always read from the
+    device, bypassing any response cache.
+    """
+
+    # Object type -> URL of its list; the response key is '<type>-list'
+    TYPES = collections.OrderedDict([
+        ('server', '/slb/server/'),
+        ('service-group', '/slb/service-group/'),
+        ('virtual-server', '/slb/virtual-server/'),
+    ])
+
+    def __init__(self, slb, data):
+        self._slb = slb
+        data = data.get('slb', data) if data else {}
+        for object_type in self.TYPES:
+            self._index(object_type, data.get(object_type + '-list', []))
+
+    def refresh(self, object_type):
+        """Re-read one object type with one GET and rebuild its indexes."""
+        if object_type not in self.TYPES:
+            raise ValueError("object_type must be one of %s" % ', '.join(self.TYPES))
+        r = self._slb._get(self.TYPES[object_type], cache=False) or {}
+        self._index(object_type, r.get(object_type + '-list', []))
+
+    def _index(self, object_type, objects):
+        getattr(self, '_index_' + object_type.replace('-', '_'))(objects)
+
+    def _index_server(self, objects):
+        self.servers = {}
+        self.servers_by_ip = {}
+        for server in objects:
+            self.servers[server['name']] = server
+            for key in ('host', 'server-ipv6-addr'):
+                if key in server:
+                    self.servers_by_ip[server[key]] = server
+
+    def _index_service_group(self, objects):
+        self.service_groups = {}
+        self.members = {}
+        self.groups_by_member = collections.defaultdict(set)
+        self.groups_by_server = collections.defaultdict(set)
+        for group in objects:
+            name = group['name']
+            self.service_groups[name] = group
+            for member in group.get('member-list', []):
+                self.members[(name, member['name'], member['port'])] = member
+                self.groups_by_member[(member['name'], member['port'])].add(name)
+                self.groups_by_server[member['name']].add(name)
+        self.groups_by_member = dict(self.groups_by_member)
+        self.groups_by_server = dict(self.groups_by_server)
+
+    def _index_virtual_server(self, objects):
+        self.virtual_servers = {}
+        self.virtual_servers_by_ip = {}
+        self.vports = {}
+        self.vport_service_group = {}
+        by_group = collections.defaultdict(set)
+        for vs in objects:
+            name = vs['name']
+            self.virtual_servers[name] = vs
+            for key in ('ip-address', 'ipv6-address'):
+                if key in vs:
+                    self.virtual_servers_by_ip[vs[key]] = vs
+            for port in vs.get('port-list', []):
+                key = (name, port['port-number'], port.get('protocol'))
+                self.vports[key] = port
+                if 'service-group' in port:
+                    self.vport_service_group[key] = port['service-group']
+                    by_group[port['service-group']].add(key)
+        self.vports_by_service_group = dict(by_group)
+
+    def vports_reaching_server(self, server):
+        """Keys of the vports whose service group has server as a member."""
+        keys = set()
+        for group in self.groups_by_server.get(server, ()):
+            keys.update(self.vports_by_service_group.get(group, ()))
+        return keys
@@ -26,24 +26,24 @@ class Template(base.BaseV30):
 
     @property
     def client_ssl(self):
-        return ClientSSL(self.client)
+        return self._child(ClientSSL)
 
     @property
     def cipher_ssl(self):
-        return SSLCipher(self.client)
+        return self._child(SSLCipher)
 
     @property
     def cookie_persistence(self):
-        return CookiePersistence(self.client)
+        return self._child(CookiePersistence)
 
     @property
     def src_ip_persistence(self):
-        return SourceIpPersistence(self.client)
+        return self._child(SourceIpPersistence)
 
     @property
     def server_ssl(self):
-        return ServerSSL(self.client)
+        return self._child(ServerSSL)
 
     @property
     def http_template(self):
-        return HTTPTemplate(self.client)
+        return self._child(HTTPTemplate)
@@ -35,7 +35,7 @@ class BasePersistence(base.BaseV30):
             return False
 
     def create(self, name, **kwargs):
-        if self.exists(name):
+        if not self._optimistic(kwargs) and self.exists(name):
             raise acos_errors.Exists
         self._post(self.prefix, self.get_params(name), **kwargs)
 
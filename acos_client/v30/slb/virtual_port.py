@@ -13,6 +13,7 @@
 #    under the License.
 from __future__ import absolute_import
 from __future__ import unicode_literals
+import functools
 import six
 
 
@@ -67,9 +68,8 @@ class VirtualPort(base.BaseV30):
         )
         return self._get(url)
 
-    def _set(
+    def _params(
         self,
-        virtual_server_name,
         name,
         protocol,
         port,
@@ -87,7 +87,6 @@ class VirtualPort(base.BaseV30):
         tcp_template=None,
         udp_template=None,
         exclude_minimize=None,
-        update=False,
         **kwargs
     ):
         exclude_minimize = [] if exclude_minimize is None else exclude_minimize
@@ -149,6 +148,52 @@ class VirtualPort(base.BaseV30):
             if conn_limit > 0 and conn_limit <= 8000000:
                 params["port"]["conn-limit"] = conn_limit
 
+        return params
+
+    def _set(
+        self,
+        virtual_server_name,
+        name,
+        protocol,
+        port,
+        service_group_name,
+        s_pers_name=None,
+        c_pers_name=None,
+        status=0,
+        no_dest_nat=None,
+        autosnat=False,
+        ipinip=False,
+        source_nat_pool=None,
+        ha_conn_mirror=None,
+        conn_limit=None,
+        virtual_port_templates=None,
+        tcp_template=None,
+        udp_template=None,
+        exclude_minimize=None,
+        update=False,
+        **kwargs
+    ):
+        params = self._params(
+            name,
+            protocol,
+            port,
+            service_group_name,
+            s_pers_name,
+            c_pers_name,
+            status,
+            no_dest_nat=no_dest_nat,
+            autosnat=autosnat,
+            ipinip=ipinip,
+            source_nat_pool=source_nat_pool,
+            ha_conn_mirror=ha_conn_mirror,
+            conn_limit=conn_limit,
+            virtual_port_templates=virtual_port_templates,
+            tcp_template=tcp_template,
+            udp_template=udp_template,
+            exclude_minimize=exclude_minimize,
+            **kwargs
+        )
+
         url = self.url_server_tmpl.format(name=virtual_server_name)
         if update:
             url += self.url_port_tmpl.format(
@@ -279,6 +324,36 @@ class VirtualPort(base.BaseV30):
         url += self.url_port_tmpl.format(port_number=port, protocol=protocol)
         return self._delete(url)
 
+    def _many(self, virtual_server_name, vports, update=False, chunk_size=None, **kwargs):
+        items = []
+        for vport in vports:
+            params = self._params(**vport)
+            fallback = functools.partial(self._set, virtual_server_name, update=update,
+                                         **dict(vport, **kwargs))
+            items.append((vport, params['port'], fallback))
+        url = self.url_server_tmpl.format(name=virtual_server_name)
+        self._post_list(url, 'port-list', items, chunk_size, exists_ok=not update, **kwargs)
+
+    def create_many(self, virtual_server_name, vports, chunk_size=None, **kwargs):
+        """Add vports with port-list requests of chunk_size each.
+
+        vports is a list of dicts of create() arguments, e.g.
+        {'name': 'vip1_80', 'protocol': 'http', 'port': 80,
+        'service_group_name': 'pool1'}. Raises PartialFailure naming the
+        vports that failed.
+        """
+        vports = [dict(vport, status=vport.get('status', 1)) for vport in vports]
+        self._many(virtual_server_name, vports, False, chunk_size, **kwargs)
+
+    def update_many(self, virtual_server_name, vports, chunk_size=None, **kwargs):
+        """Update vports with port-list requests; see create_many()."""
+        vports = [dict(vport, status=vport.get('status', 1)) for vport in vports]
+        self._many(virtual_server_name, vports, True, chunk_size, **kwargs)
+
+    def delete_many(self, virtual_server_name, vports):
+        """Delete (name, protocol, port) vports, raising PartialFailure for failures."""
+        self._each(vports, lambda v: self.delete(virtual_server_name, *v))
+
     def _set_sampling_enable(self, sample_list, dest_obj):
         dest_array = []
         for x in sample_list:
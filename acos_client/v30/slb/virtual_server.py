@@ -26,11 +26,15 @@ class VirtualServer(base.BaseV30):
 
     @property
     def vport(self):
-        return VirtualPort(self.client)
+        return self._child(VirtualPort)
 
     def all(self):
         return self._get(self.url_prefix)
 
+    def iter_all(self, **kwargs):
+        """Like all(), but yields one virtual server at a time."""
+        return self._iter_list(self.url_prefix, 'virtual-server-list', **kwargs)
+
     def get(self, name):
         return self._get(self.url_prefix + name)
 
@@ -73,12 +77,13 @@ class VirtualServer(base.BaseV30):
 
     def create(self, name, ip_address, arp_disable=False, vrid=None,
                virtual_server_templates=None, template_virtual_server=None, **kwargs):
-        try:
-            self.get(name)
-        except acos_errors.NotFound:
-            pass
-        else:
-            raise acos_errors.Exists
+        if not self._optimistic(kwargs):
+            try:
+                self.get(name)
+            except acos_errors.NotFound:
+                pass
+            else:
+                raise acos_errors.Exists
 
         return self._set(name, ip_address, arp_disable, vrid, virtual_server_templates,
                          template_virtual_server, **kwargs)
@@ -23,11 +23,11 @@ class System(base.BaseV30):
 
     @property
     def action(self):
-        return Action(self.client)
+        return self._child(Action)
 
     @property
     def partition(self):
-        return Partition(self.client)
+        return self._child(Partition)
 
     def information(self):
         return self._get("/system")
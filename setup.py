@@ -35,7 +35,8 @@ setup(
         'Topic :: Software Development :: Libraries :: Python Modules'
     ],
 
-    install_requires = ['requests>=2.3.0', 'six', 'uhashring'],
+    install_requires = ['requests>=2.3.0', 'six', 'uhashring',
+                        'futures; python_version < "3.0"'],
 
     test_suite="acos_client.tests.test_suite"
 )